@@ -1,9 +1,50 @@
 # Script update for Jixovox database utilities - updated 2026-01-05 09:37 UTC by lloydlewis
 import json
+import os
 import re
+from collections import defaultdict
+from contextlib import contextmanager
 from pathlib import Path
-from threading import Lock
-from typing import List, Dict, Optional
+from threading import Lock, RLock
+from typing import FrozenSet, Iterator, List, Dict, Optional, Set, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib encoder/decoder
+    orjson = None
+
+_EMAIL_RE = re.compile(r'^[\w\.-]+@[\w\.-]+\.\w+$')
+_MODULE_DIR = Path(__file__).resolve().parent
+
+
+def _dump_bytes(data) -> bytes:
+    """Serialize role data compactly for users.json, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+def _loads(raw):
+    """Parse users.json content (str or bytes), using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+class _instance_or_default:
+    """
+    Method that binds to the instance, or to a default ``Users()`` when called
+    on the class (keeps former classmethods callable as ``Users.method(...)``).
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.__doc__ = func.__doc__
+
+    def __get__(self, obj, owner):
+        if obj is None:
+            obj = owner()
+        return self.func.__get__(obj, owner)
 
 
 class Users:
@@ -20,11 +61,21 @@ class Users:
     """
 
     VALID_ROLES = ['Owner', 'Developer', 'Admin', 'Member', 'Bot']
+    # Membership checks; VALID_ROLES keeps the public ordered list
+    _VALID_ROLE_SET: FrozenSet[str] = frozenset(VALID_ROLES)
     REQUIRED_FIELDS = {'id', 'name', 'email', 'role'}
 
-    # In-memory cache for all users to reduce repeated file reads
-    _cache: Dict[str, List[Dict]] = {}
-    _lock = Lock()
+    # In-memory cache keyed by (base_dir, role) -> ((mtime_ns, size) of users.json, users)
+    _cache: Dict[Tuple[Path, str], Tuple[Optional[Tuple[int, int]], List[Dict]]] = {}
+    # Per-role name/email sets backing O(1) duplicate checks
+    _name_index: Dict[Tuple[Path, str], Set[str]] = {}
+    _email_index: Dict[Tuple[Path, str], Set[str]] = {}
+    # Per-role lowercased (id, name, email, cache position) tuples for find_user
+    _search_index: Dict[Tuple[Path, str], List[Tuple[str, str, str, int]]] = {}
+    # One re-entrant lock per base_dir; the duplicate check spans every role,
+    # so the lock covers the whole database rather than a single role file.
+    _locks: Dict[Path, RLock] = {}
+    _locks_guard = Lock()
 
     def __init__(self, base_dir: Optional[Path] = None):
         """
@@ -32,7 +83,17 @@ class Users:
 
         :param base_dir: Base directory for role folders. Defaults to script directory.
         """
-        self.BASE_DIR = base_dir or Path(__file__).resolve().parent
+        self.BASE_DIR = base_dir or _MODULE_DIR
+        if self.BASE_DIR == _MODULE_DIR:
+            self._role_paths, self._users_files = _ROLE_PATHS, _USERS_FILES
+        else:
+            self._role_paths = {r: self.BASE_DIR / r for r in self.VALID_ROLES}
+            self._users_files = {r: p / 'users.json' for r, p in self._role_paths.items()}
+        with Users._locks_guard:
+            self._lock = Users._locks.setdefault(self.BASE_DIR, RLock())
+        self._bulk_depth = 0
+        # Users queued by bulk() per role, not yet written to users.json
+        self._pending: Dict[str, List[Dict]] = {}
         self._ensure_role_folders()
 
     def _ensure_role_folders(self):
@@ -40,55 +101,109 @@ class Users:
         Ensure all role folders exist, create them if missing.
         """
         for role in self.VALID_ROLES:
-            role_path = self.BASE_DIR / role
-            role_path.mkdir(parents=True, exist_ok=True)
-            users_file = role_path / 'users.json'
-            if not users_file.exists():
+            self._role_paths[role].mkdir(parents=True, exist_ok=True)
+            if not self._users_files[role].exists():
                 self._write_data(role, [])
 
+    def _index_role(self, role: str, data: List[Dict]):
+        """
+        Rebuild the duplicate-check and search indexes for a role.
+
+        :param role: Role folder name.
+        :param data: List of user dicts currently stored for the role.
+        """
+        key = (self.BASE_DIR, role)
+        self._name_index[key] = {u.get('name') for u in data}
+        self._email_index[key] = {u.get('email') for u in data}
+        self._search_index[key] = [
+            (str(u.get('id', '')).lower(), u.get('name', '').lower(), u.get('email', '').lower(), idx)
+            for idx, u in enumerate(data)
+        ]
+
+    def _index_user(self, role: str, user: Dict, idx: int):
+        """
+        Add a single appended user to the role indexes without a full rebuild.
+
+        :param role: Role folder name.
+        :param user: User dict that was appended to the role cache.
+        :param idx: Position of the user in the role cache.
+        """
+        key = (self.BASE_DIR, role)
+        self._name_index[key].add(user.get('name'))
+        self._email_index[key].add(user.get('email'))
+        self._search_index[key].append(
+            (str(user.get('id', '')).lower(), user.get('name', '').lower(), user.get('email', '').lower(), idx)
+        )
+
+    def _file_stamp(self, role: str) -> Optional[Tuple[int, int]]:
+        """
+        Return (mtime_ns, size) of the role's users.json, or None if it does not exist.
+        """
+        try:
+            st = self._users_files[role].stat()
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
     def _read_data(self, role: str) -> List[Dict]:
         """
         Read user data from JSON file with caching.
 
+        The cached copy is reused while the file's mtime and size are unchanged.
+
         :param role: Role folder name.
         :return: List of user dicts.
         """
-        if role in self._cache:
-            return self._cache[role]
+        key = (self.BASE_DIR, role)
+        stamp = self._file_stamp(role)
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
 
-        file_path = self.BASE_DIR / role / 'users.json'
+        data: List[Dict] = []
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                if isinstance(data, list):
-                    self._cache[role] = data
-                    return data
+            loaded = _loads(self._users_files[role].read_bytes())
+            if isinstance(loaded, list):
+                data = loaded
         except (FileNotFoundError, json.JSONDecodeError):
-            self._cache[role] = []
+            pass
+        # The file changed under a bulk() block: keep the users it queued
+        data.extend(self._pending.get(role, ()))
 
-        return []
+        self._cache[key] = (stamp, data)
+        self._index_role(role, data)
+        return data
 
-    def _write_data(self, role: str, data: List[Dict]):
+    def _write_data(self, role: str, data: List[Dict], durable: bool = False):
         """
         Write user data to JSON file atomically and update cache.
 
+        The data always goes to a temp file that is renamed over the role
+        file, so a crash mid write never leaves a truncated users.json. By
+        default nothing is fsynced and the OS page cache decides when the
+        bytes reach the disk.
+
         :param role: Role folder name.
         :param data: List of user dicts.
+        :param durable: Fsync the temp file before the rename.
         """
-        file_path = self.BASE_DIR / role / 'users.json'
+        file_path = self._users_files[role]
         tmp_file = file_path.with_suffix('.json.tmp')
         try:
-            with open(tmp_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4)
-                f.flush()
-            tmp_file.replace(file_path)
-            self._cache[role] = data
+            with open(tmp_file, 'wb') as f:
+                f.write(_dump_bytes(data))
+                if durable:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_file, file_path)
+            self._cache[(self.BASE_DIR, role)] = (self._file_stamp(role), data)
+            self._index_role(role, data)
         except Exception as e:
             raise IOError(f"Failed to write data for role {role}: {e}")
 
     def _validate_user(self, user: Dict):
         """
-        Validate required fields and email format.
+        Validate required fields, role, and email format (cheapest checks first).
 
         :param user: User dictionary.
         :raises ValueError: If validation fails.
@@ -97,14 +212,13 @@ class Users:
         if missing:
             raise ValueError(f"Missing required fields: {', '.join(missing)}")
 
+        if user['role'] not in self._VALID_ROLE_SET:
+            raise ValueError(f"Invalid role: {user['role']}")
+
         # Email regex validation
-        email_regex = r'^[\w\.-]+@[\w\.-]+\.\w+$'
-        if not re.match(email_regex, user['email']):
+        if not _EMAIL_RE.match(user['email']):
             raise ValueError(f"Invalid email format: {user['email']}")
 
-        if user['role'] not in self.VALID_ROLES:
-            raise ValueError(f"Invalid role: {user['role']}")
-
     def add_user(self, user_info: Dict):
         """
         Add a new user after validation and duplicate check.
@@ -121,41 +235,123 @@ class Users:
             role = user_info['role']
             users = self._read_data(role)
             users.append(user_info)
-            self._write_data(role, users)
+            if self._bulk_depth:
+                self._index_user(role, user_info, len(users) - 1)
+                self._pending.setdefault(role, []).append(user_info)
+            else:
+                self._write_data(role, users)
 
-    @classmethod
-    def is_duplicate(cls, name: str, email: str) -> bool:
+    def add_users(self, users: List[Dict]):
+        """
+        Add many users with one validation pass and one write per role.
+
+        Nothing is written if any entry is invalid or duplicates an existing
+        user or another entry in the batch.
+
+        :param users: List of user dictionaries containing id, name, email, role.
+        :raises ValueError: If any user is duplicate or invalid.
+        """
+        for user_info in users:
+            self._validate_user(user_info)
+
+        by_role: Dict[str, List[Dict]] = defaultdict(list)
+        for user_info in users:
+            by_role[user_info['role']].append(user_info)
+
+        with self._lock:
+            for role in self.VALID_ROLES:
+                self._read_data(role)
+            names: Set[str] = set()
+            emails: Set[str] = set()
+            for user_info in users:
+                name, email = user_info['name'], user_info['email']
+                if self._indexed_duplicate(name, email) or name in names or email in emails:
+                    raise ValueError(f"User with same name or email already exists: {name} <{email}>")
+                names.add(name)
+                emails.add(email)
+
+            for role, batch in by_role.items():
+                current = self._read_data(role)
+                start = len(current)
+                current.extend(batch)
+                if self._bulk_depth:
+                    for offset, user_info in enumerate(batch):
+                        self._index_user(role, user_info, start + offset)
+                    self._pending.setdefault(role, []).extend(batch)
+                else:
+                    self._write_data(role, current)
+
+    @contextmanager
+    def bulk(self):
+        """
+        Defer role file writes until the block exits.
+
+        Users added inside the block are appended to the cache and indexes and
+        also queued per role, so a role file that changes on disk meanwhile is
+        reloaded with the queued users kept; each touched role file is written
+        once on exit.
+        """
+        self._bulk_depth += 1
+        try:
+            yield self
+        finally:
+            self._bulk_depth -= 1
+            if not self._bulk_depth:
+                with self._lock:
+                    try:
+                        for role in sorted(self._pending):
+                            self._write_data(role, self._read_data(role))
+                    finally:
+                        self._pending.clear()
+
+    @_instance_or_default
+    def is_duplicate(self, name: str, email: str) -> bool:
         """
         Check if a user with the same name or email exists across all roles.
 
+        Like the former classmethod, ``Users.is_duplicate(name, email)`` still
+        works and checks the default database next to this module.
+
+        Uses the cached per-role name/email indexes, reloading a role only when its file changed.
+
         :param name: Name of user.
         :param email: Email of user.
         :return: True if duplicate exists, False otherwise.
         """
-        for role in cls.VALID_ROLES:
-            role_folder = Path(__file__).resolve().parent / role
-            users_file = role_folder / 'users.json'
-            if users_file.exists():
-                try:
-                    with open(users_file, 'r', encoding='utf-8') as f:
-                        users = json.load(f)
-                        for user in users:
-                            if user.get('name') == name or user.get('email') == email:
-                                return True
-                except json.JSONDecodeError:
-                    continue
+        for role in self.VALID_ROLES:
+            self._read_data(role)
+        return self._indexed_duplicate(name, email)
+
+    def _indexed_duplicate(self, name: str, email: str) -> bool:
+        """
+        Check the already-loaded role indexes for a name or email match.
+
+        :param name: Name of user.
+        :param email: Email of user.
+        :return: True if duplicate exists, False otherwise.
+        """
+        for role in self.VALID_ROLES:
+            key = (self.BASE_DIR, role)
+            if name in self._name_index[key] or email in self._email_index[key]:
+                return True
         return False
 
+    def iter_all_users(self) -> Iterator[Dict]:
+        """
+        Lazily yield all users across all roles without building a combined list.
+
+        :return: Iterator over user dicts.
+        """
+        for role in self.VALID_ROLES:
+            yield from self._read_data(role)
+
     def list_all_users(self) -> List[Dict]:
         """
         Return a flattened list of all users across all roles.
 
         :return: List of all user dicts.
         """
-        all_users = []
-        for role in self.VALID_ROLES:
-            all_users.extend(self._read_data(role))
-        return all_users
+        return list(self.iter_all_users())
 
     def find_user(self, query: str) -> List[Dict]:
         """
@@ -166,9 +362,13 @@ class Users:
         """
         query_lower = query.lower()
         results = []
-        for user in self.list_all_users():
-            if query_lower in str(user.get('id', '')).lower() \
-               or query_lower in user.get('name', '').lower() \
-               or query_lower in user.get('email', '').lower():
-                results.append(user)
+        for role in self.VALID_ROLES:
+            users = self._read_data(role)
+            for id_l, name_l, email_l, idx in self._search_index[(self.BASE_DIR, role)]:
+                if query_lower in id_l or query_lower in name_l or query_lower in email_l:
+                    results.append(users[idx])
         return results
+
+
+_ROLE_PATHS: Dict[str, Path] = {r: _MODULE_DIR / r for r in Users.VALID_ROLES}
+_USERS_FILES: Dict[str, Path] = {r: p / 'users.json' for r, p in _ROLE_PATHS.items()}
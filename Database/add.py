@@ -9,19 +9,27 @@ Secure CLI user registration script with:
 - Full type hints and structured exceptions
 """
 
+import atexit
 import sys
 import os
 import re
 import json
 import gzip
+import io
 import logging
 import traceback
-import secrets
+import zlib
+import string
 import hashlib
+import math
 import time
+import threading
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime, UTC
-from typing import Any, Callable, Dict, List, Set
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 from argon2 import PasswordHasher
 from logging.handlers import RotatingFileHandler
 from cryptography.fernet import Fernet, InvalidToken
@@ -30,16 +38,41 @@ from prompt_toolkit.completion import WordCompleter
 from prompt_toolkit.styles import Style as PTStyle
 from prompt_toolkit.patch_stdout import patch_stdout
 
+try:
+    import orjson
+except ImportError:  # optional: fall back to stdlib json
+    orjson = None
+
+try:
+    import fcntl
+except ImportError:  # Windows: writers are not serialized across processes
+    fcntl = None
+
 # -----------------------------
 # Constants / Configuration
 # -----------------------------
 BASE_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = BASE_DIR.parent
 VALID_ROLES = ["Owner", "Developer", "Admin", "Member"]
+_VALID_ROLE_SET = frozenset(VALID_ROLES)
 LOG_FILE = BASE_DIR / "Logs" / "system_log.txt"
 STATS_FILE = BASE_DIR / "Logs" / "stats.json"
 # Use environment for pepper and encryption key for better security
-PEPPER = os.environ.get("APP_PEPPER", "static-pepper")
-ENC_KEY = os.environ.get("APP_ENC_KEY", Fernet.generate_key().decode())
+PEPPER = os.environ.get("APP_PEPPER") or "static-pepper"
+# Argon2id cost (OWASP: 46 MiB, t=1, p=1); override per host via the environment
+ARGON2_MEMORY_COST = int(os.environ.get("APP_ARGON2_M", "47104"))
+ARGON2_TIME_COST = int(os.environ.get("APP_ARGON2_T", "1"))
+ARGON2_PARALLELISM = int(os.environ.get("APP_ARGON2_P", "1"))
+# Only generate a key when none is configured; such a key dies with the process
+ENC_KEY = os.environ.get("APP_ENC_KEY") or ""
+_EPHEMERAL_ENC_KEY = not ENC_KEY
+if _EPHEMERAL_ENC_KEY:
+    ENC_KEY = Fernet.generate_key().decode()
+
+# Brute force protection: attempts allowed per window, window length, tracked emails
+MAX_LOGIN_ATTEMPTS = 5
+LOGIN_WINDOW_SEC = 900
+MAX_TRACKED_EMAILS = 10_000
 
 EMAIL_DOMAINS = ["@gmail.com", "@yahoo.com", "@outlook.com", "@protonmail.com"]
 EMAIL_COMPLETER = WordCompleter(EMAIL_DOMAINS, match_middle=True)
@@ -59,41 +92,82 @@ logging.basicConfig(
     format="%(asctime)s %(levelname)s %(message)s",
     handlers=[handler]
 )
+if _EPHEMERAL_ENC_KEY:
+    logging.warning("APP_ENC_KEY is not set; using a temporary encryption key for this process")
 
 # -----------------------------
 # Security utilities
 # -----------------------------
-ph = PasswordHasher()
+ph = PasswordHasher(
+    time_cost=ARGON2_TIME_COST,
+    memory_cost=ARGON2_MEMORY_COST,
+    parallelism=ARGON2_PARALLELISM,
+    hash_len=32,
+    salt_len=16,
+)
 try:
     fernet = Fernet(ENC_KEY.encode())
 except Exception:
     fernet = Fernet(Fernet.generate_key())
-login_attempts: Dict[str, int] = {}
+# email -> (attempt count, window start); least recently touched first
+login_attempts: "OrderedDict[str, Tuple[int, float]]" = OrderedDict()
+_login_lock = threading.Lock()
 
 def _norm_email(e: str) -> str:
     return e.strip().lower()
 
-def _hash_email(e: str) -> str:
-    return hashlib.sha256(_norm_email(e).encode()).hexdigest()
+@lru_cache(maxsize=4096)
+def _hash_norm_email(normalized: str) -> int:
+    return int.from_bytes(hashlib.blake2b(normalized.encode(), digest_size=16).digest(), "big")
+
+def _hash_email(e: str) -> int:
+    """128-bit dedup key for an email; persisted as 32 hex chars in ``email_h``."""
+    return _hash_norm_email(_norm_email(e))
+
+# Plaintext email plus its index key, computed once and passed through the insert path
+_EmailKey = namedtuple("_EmailKey", ("plain", "digest"))
+
+def email_key(plain: str) -> _EmailKey:
+    return _EmailKey(plain, _hash_email(plain))
+
+def _email_key_from_record(value: Any) -> Optional[int]:
+    # Keys written before the switch to 128-bit BLAKE2b are sha256 hex; ignore them
+    if isinstance(value, str) and len(value) == 32:
+        try:
+            return int(value, 16)
+        except ValueError:
+            return None
+    return None
 
 def encrypt_data(data: str) -> str:
     return fernet.encrypt(data.encode()).decode()
 
+def encrypt_many(*values: str) -> List[str]:
+    """Encrypt several fields of one record with the shared key and a single timestamp."""
+    encrypt_at = fernet.encrypt_at_time
+    now = int(time.time())
+    return [encrypt_at(v.encode(), now).decode() for v in values]
+
 def decrypt_data(token: str) -> str:
     try:
         return fernet.decrypt(token.encode()).decode()
     except InvalidToken:
         return "[UNREADABLE]"
 
+_PEPPER_B = PEPPER.encode()
+
 def hash_password(password: str) -> Dict[str, str]:
-    salt = secrets.token_hex(16)
-    salted_pw = password + salt + PEPPER
-    hashed = ph.hash(salted_pw)
-    return {"hash": hashed, "salt": salt}
+    # argon2 generates the salt and embeds it (with the cost parameters) in the PHC string
+    return {"hash": ph.hash(password.encode() + _PEPPER_B)}
 
 def verify_password(stored: Dict[str, str], password: str) -> bool:
+    if "salt" in stored:
+        # Legacy record: explicit salt mixed into the input
+        secret = b"".join((password.encode(), stored["salt"].encode(), _PEPPER_B))
+    else:
+        secret = password.encode() + _PEPPER_B
     try:
-        ph.verify(stored["hash"], password + stored["salt"] + PEPPER)
+        ph.verify(stored["hash"], secret)
         return True
     except Exception:
         return False
@@ -106,6 +180,22 @@ class ValidationError(UserError): pass
 class EmailExistsError(ValidationError): pass
 class DatabaseError(UserError): pass
 
+# -----------------------------
+# JSON helpers
+# -----------------------------
+def _dumps(obj: Any, indent: bool = False) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode("utf-8")
+    if indent:
+        # Same layout as orjson's OPT_INDENT_2
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(",", ":"))
+
+def _loads(raw: str | bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 def log_exception(e: Exception) -> None:
     logging.error(f"{type(e).__name__}: {e}\n{traceback.format_exc()}")
 
@@ -113,120 +203,416 @@ def log_exception(e: Exception) -> None:
 # Brute force protection
 # -----------------------------
 def check_brute_force(email: str) -> None:
-    attempts = login_attempts.get(email, 0)
-    if attempts >= 5:
-        raise ValidationError("Too many attempts, try again later.")
-    login_attempts[email] = attempts + 1
+    with _login_lock:
+        now = time.monotonic()
+        # Age out stale windows from the least recently touched end
+        while login_attempts:
+            _, (_, first_seen) = next(iter(login_attempts.items()))
+            if now - first_seen <= LOGIN_WINDOW_SEC:
+                break
+            login_attempts.popitem(last=False)
+
+        attempts, first_seen = login_attempts.get(email, (0, now))
+        if now - first_seen > LOGIN_WINDOW_SEC:
+            attempts, first_seen = 0, now
+        if attempts >= MAX_LOGIN_ATTEMPTS:
+            login_attempts.move_to_end(email)
+            raise ValidationError("Too many attempts, try again later.")
+        login_attempts[email] = (attempts + 1, first_seen)
+        login_attempts.move_to_end(email)
+        while len(login_attempts) > MAX_TRACKED_EMAILS:
+            login_attempts.popitem(last=False)
 
 # -----------------------------
 # Validation helpers
 # -----------------------------
+_NAME_RE = re.compile(r"[A-Za-z\s]+")
+_EMAIL_RE = re.compile(r"^[\w\.-]+@[\w\.-]+\.\w+$")
+_STRIP_TABLE = str.maketrans("", "", "<>\"'")
+
+# Byte -> class mask (bit0 upper, bit1 lower, bit2 digit, bit3 special)
+_PW_ALL_CLASSES = 0xF
+_PW_CLASS = bytearray(256)
+for _group, _bit in (
+    (string.ascii_uppercase, 0x1),
+    (string.ascii_lowercase, 0x2),
+    (string.digits, 0x4),
+    ('!@#$%^&*(),.?":{}|<>', 0x8),
+):
+    for _ch in _group.encode("ascii"):
+        _PW_CLASS[_ch] |= _bit
+del _group, _bit, _ch
+
 class Validator:
     @staticmethod
     def name(name: str) -> None:
-        if not re.fullmatch(r"[A-Za-z\s]+", name):
+        if not _NAME_RE.fullmatch(name):
             raise ValidationError("Invalid name format.")
 
     @staticmethod
     def email(email: str) -> None:
-        if not re.match(r"^[\w\.-]+@[\w\.-]+\.\w+$", email):
+        if not _EMAIL_RE.match(email):
             raise ValidationError("Invalid email format.")
 
     @staticmethod
     def password(password: str) -> None:
-        if (
-            len(password) < 8
-            or not re.search(r"[A-Z]", password)
-            or not re.search(r"[a-z]", password)
-            or not re.search(r"\d", password)
-            or not re.search(r'[!@#$%^&*(),.?":{}|<>]', password)
-        ):
+        if len(password) < 8:
             raise ValidationError("Weak password.")
+        seen = 0
+        for b in password.encode("ascii", "ignore"):
+            seen |= _PW_CLASS[b]
+            if seen == _PW_ALL_CLASSES:
+                return
+        raise ValidationError("Weak password.")
 
 # -----------------------------
 # User database
 # -----------------------------
+class _EmailBloom:
+    """
+    Bloom filter over _hash_email digests, consulted before the email set.
+
+    Bit positions come from the two 64-bit halves of the key itself (double
+    hashing), so membership tests do no extra hashing. A miss is definitive; a hit
+    still has to be confirmed against the authoritative set.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001) -> None:
+        self.capacity = max(capacity, 1024)
+        self._m = math.ceil(-self.capacity * math.log(error_rate) / (math.log(2) ** 2))
+        self._k = max(1, round(self._m / self.capacity * math.log(2)))
+        self._bits = bytearray((self._m + 7) // 8)
+
+    def _positions(self, digest: int):
+        h1 = digest >> 64
+        h2 = (digest & 0xFFFFFFFFFFFFFFFF) | 1
+        m = self._m
+        return ((h1 + i * h2) % m for i in range(self._k))
+
+    def add(self, digest: int) -> None:
+        bits = self._bits
+        for pos in self._positions(digest):
+            bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, digest: int) -> bool:
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(digest))
+
 class Users:
     """
     Manage users stored in gzip-compressed JSON Lines format per role folder.
-    Supports safe_mode for atomic full rewrites or faster append-only mode.
+
+    Append mode keeps one gzip stream open across inserts and batches
+    encoded records in memory; records are only guaranteed on disk after
+    flush()/close() (or leaving the ``with`` block).
+
+    safe_mode also appends, but journals each record (with its cache
+    position and CRC32) to ``users.jsonl.gz.wal`` and syncs both files
+    before returning. On load the journal is checked against the file tail
+    and any record the file lost or garbled is replayed from it.
+
+    Loading never rewrites the file: a torn gzip stream (a crashed writer, or
+    one still running) is salvaged in memory only. The first insert takes an
+    exclusive lock on ``users.jsonl.gz.lock`` (POSIX), held until close(); the
+    lock holder reloads if another writer got there first, and it alone
+    compacts the file with a full atomic rewrite, either to repair it or once
+    enough records have accumulated since the last rewrite.
     """
 
+    APPEND_BUFFER_SIZE = 64 * 1024
+    READ_BUFFER_SIZE = 128 * 1024
+    MIN_COMPACT_RECORDS = 256
+
     def __init__(self, role_folder: Path, safe_mode: bool = False) -> None:
         self.role_folder = role_folder
         self.db_file = role_folder / "users.jsonl.gz"
+        self.wal_file = role_folder / "users.jsonl.gz.wal"
+        self.lock_file = role_folder / "users.jsonl.gz.lock"
         self.cache: List[Dict[str, Any]] = []
-        self.email_index: Set[str, int] = set()
+        self.email_index: Set[int] = set()
         self.safe_mode = safe_mode
+        self._writer: Optional[gzip.GzipFile] = None
+        self._buf = bytearray()
+        self._dirty_count = 0
+        self._needs_compact = False
+        self._lock_fd: Optional[int] = None
+        self._stamp: Optional[Tuple[int, int, int]] = None
         role_folder.mkdir(parents=True, exist_ok=True)
         self._load_cache()
+        self._rebuild_bloom()
+
+    def _rebuild_bloom(self) -> None:
+        # Sized with headroom so inserts rarely force a rebuild
+        self._email_bloom = _EmailBloom(capacity=2 * len(self.email_index))
+        for digest in self.email_index:
+            self._email_bloom.add(digest)
+
+    def _index_email(self, digest: int) -> None:
+        self.email_index.add(digest)
+        if len(self.email_index) > self._email_bloom.capacity:
+            self._rebuild_bloom()
+        else:
+            self._email_bloom.add(digest)
+
+    def _file_stamp(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = self.db_file.stat()
+        except FileNotFoundError:
+            return None
+        return st.st_ino, st.st_mtime_ns, st.st_size
+
+    def _read_wal(self) -> List[Tuple[int, int, Dict[str, Any]]]:
+        entries = []
+        if self.wal_file.exists():
+            with open(self.wal_file, "rb") as f:
+                for line in f:
+                    try:
+                        entry = _loads(line)
+                        entries.append((int(entry["n"]), int(entry["crc"]), dict(entry["user"])))
+                    except (ValueError, KeyError, TypeError):
+                        break  # torn final entry
+        return entries
 
     def _load_cache(self) -> None:
-        if not self.db_file.exists():
+        # Stamped before reading, so a write racing the load forces a reload
+        self._stamp = self._file_stamp()
+        if self._stamp is None:
             return
+        wal = self._read_wal()
+        wal_start = wal[0][0] if wal else None
+        crcs: Dict[int, int] = {}
         try:
-            with gzip.open(self.db_file, "rt", encoding="utf-8") as f:
-                for line in f:
-                    user = json.loads(line)
-                    self.cache.append(user)
-                    if "email" in user:
-                        plain = decrypt_data(user["email"]) if user["email"] else ""
-                        if plain and plain != "[UNREADABLE]":
-                            self.email_index.add(_hash_email(plain))
+            # Binary mode: records are parsed straight from the line bytes,
+            # one at a time, so no decoded copy of the file is held. The
+            # larger read buffer cuts decompressor calls per line.
+            with io.BufferedReader(gzip.GzipFile(self.db_file, "rb"), buffer_size=self.READ_BUFFER_SIZE) as f:
+                self._ingest(f, wal_start, crcs)
+        except EOFError:
+            # Gzip stream without its trailer (crashed or still-open writer);
+            # the read-ahead buffer lost the tail, so re-ingest everything
+            # that can still be decompressed
+            logging.warning(f"Truncated gzip stream in {self.db_file}")
+            self.cache.clear()
+            self.email_index.clear()
+            crcs.clear()
+            self._ingest(self._salvage_lines(), wal_start, crcs)
+            self._needs_compact = True
         except Exception as e:
             raise DatabaseError(f"Load failed: {e}")
 
+        for i, (n, crc, _) in enumerate(wal):
+            if crcs.get(n) != crc:
+                # The file lost or garbled this record: rebuild the tail from the journal
+                logging.warning(f"Journal mismatch at record {n} in {self.db_file}")
+                del self.cache[n:]
+                self.cache.extend(user for _, _, user in wal[i:])
+                self.email_index = {d for d in map(_email_key_from_record,
+                                                   (u.get("email_h") for u in self.cache)) if d is not None}
+                self._needs_compact = True
+                break
+        self._dirty_count = len(wal)
+
+    def _ingest(self, lines: Iterable[bytes], wal_start: Optional[int], crcs: Dict[int, int]) -> None:
+        for lineno, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                user = _loads(line)
+            except ValueError:
+                logging.warning(f"Skipping corrupt record {self.db_file}:{lineno}")
+                continue
+            if not isinstance(user, dict):
+                continue
+            if wal_start is not None and len(self.cache) >= wal_start:
+                crcs[len(self.cache)] = zlib.crc32(line.rstrip(b"\r\n"))
+            self.cache.append(user)
+            digest = _email_key_from_record(user.get("email_h"))
+            if digest is not None:
+                self.email_index.add(digest)
+            elif user.get("email"):
+                # Older row without a current key: decrypt once and
+                # backfill so the next _save_full() persists it.
+                plain = decrypt_data(user["email"])
+                if plain and plain != "[UNREADABLE]":
+                    digest = _hash_email(plain)
+                    user["email_h"] = f"{digest:032x}"
+                    self.email_index.add(digest)
+
+    def _salvage_lines(self) -> List[bytes]:
+        """Decompress every complete gzip member plus whatever the cut one yields."""
+        data = self.db_file.read_bytes()
+        chunks: List[bytes] = []
+        while data:
+            d = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            try:
+                chunks.append(d.decompress(data))
+            except zlib.error:
+                break
+            if not d.eof:
+                break
+            data = d.unused_data
+        return b"".join(chunks).splitlines(keepends=True)
+
+    def _acquire_writer(self) -> None:
+        """Become the role's only writer; reload if the file moved on, repair if torn."""
+        if self._lock_fd is not None:
+            return
+        fd = os.open(self.lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        self._lock_fd = fd
+        if self._file_stamp() != self._stamp:
+            # Another writer appended since this store was loaded
+            self.cache.clear()
+            self.email_index.clear()
+            self._needs_compact = False
+            self._load_cache()
+            self._rebuild_bloom()
+        if self._needs_compact:
+            self._save_full()
+
+    def compact(self) -> None:
+        """Rewrite the JSONL file from the cache, dropping blank/corrupt lines."""
+        self._save_full()
+
     def _save_full(self) -> None:
+        self._acquire_writer()
+        self._close_stream()
         tmp = self.db_file.with_suffix(".tmp")
         with gzip.open(tmp, "wt", encoding="utf-8") as f:
             for u in self.cache:
-                f.write(json.dumps(u) + "\n")
+                f.write(_dumps(u) + "\n")
         tmp.replace(self.db_file)
+        self.wal_file.unlink(missing_ok=True)
+        self._dirty_count = 0
+        self._needs_compact = False
+        self._stamp = self._file_stamp()
+
+    def _append_journaled(self, user: Dict[str, Any]) -> None:
+        record = _dumps(user).encode("utf-8")
+        # Journal first: a record that reaches the WAL survives a torn file
+        with open(self.wal_file, "ab") as f:
+            entry = {"n": len(self.cache) - 1, "crc": zlib.crc32(record), "user": user}
+            f.write(_dumps(entry).encode("utf-8") + b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+        writer = self._open_append()
+        self._drain()
+        writer.write(record + b"\n")
+        writer.flush()
+        os.fsync(writer.fileobj.fileno())
+        self._dirty_count += 1
+        if self._dirty_count > max(self.MIN_COMPACT_RECORDS, len(self.cache) // 4):
+            self._save_full()
+
+    def _open_append(self) -> gzip.GzipFile:
+        if self._writer is None:
+            # One buffer layer, so GzipFile.flush() reaches the OS before fsync
+            raw = open(self.db_file, "ab", buffering=self.APPEND_BUFFER_SIZE)
+            # Append-heavy workload: favour speed over ratio
+            self._writer = gzip.GzipFile(fileobj=raw, mode="ab", compresslevel=1)
+        return self._writer
 
     def _append(self, user: Dict[str, Any]) -> None:
-        with gzip.open(self.db_file, "at", encoding="utf-8") as f:
-            f.write(json.dumps(user) + "\n")
-
-    def email_exists(self, email: str) -> bool:
-        candidate = email
-        if "@" not in candidate:
-            candidate = decrypt_data(candidate)
-        return _hash_email(candidate) in self.email_index
-
-    def add_user(self, user: Dict[str, Any]) -> None:
-        candidate = user.get("email", "")
-        if self.email_exists(candidate):
+        self._buf += _dumps(user).encode("utf-8") + b"\n"
+        if len(self._buf) >= self.APPEND_BUFFER_SIZE:
+            self._drain()
+
+    def _drain(self) -> None:
+        if self._buf:
+            self._open_append().write(bytes(self._buf))
+            self._buf.clear()
+
+    def flush(self) -> None:
+        self._drain()
+        if self._writer is not None:
+            self._writer.flush()
+
+    def _close_stream(self) -> None:
+        self._drain()
+        if self._writer is not None:
+            raw = self._writer.fileobj
+            self._writer.close()  # GzipFile leaves a passed-in fileobj open
+            raw.close()
+            self._writer = None
+            self._stamp = self._file_stamp()
+
+    def close(self) -> None:
+        self._close_stream()
+        if self._lock_fd is not None:
+            os.close(self._lock_fd)  # releases the flock
+            self._lock_fd = None
+
+    def __enter__(self) -> "Users":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _has_digest(self, digest: int) -> bool:
+        if digest not in self._email_bloom:
+            return False
+        return digest in self.email_index
+
+    def email_exists(self, email: Union[str, _EmailKey], *, is_plain: bool = True) -> bool:
+        if isinstance(email, _EmailKey):
+            return self._has_digest(email.digest)
+        plain = email if is_plain else decrypt_data(email)
+        return self._has_digest(_hash_email(plain))
+
+    def add_user(self, user: Dict[str, Any], key: Union[str, _EmailKey, None] = None) -> None:
+        """
+        Insert ``user`` under its plaintext email ``key``.
+
+        Without ``key`` it is derived from ``user["email"]``, which may be
+        plaintext or encrypted (decrypted once here).
+        """
+        if key is None:
+            candidate = user.get("email", "")
+            key = candidate if "@" in candidate else decrypt_data(candidate)
+            if not key or key == "[UNREADABLE]":
+                raise ValidationError("User email cannot be read.")
+        if not isinstance(key, _EmailKey):
+            key = email_key(key)
+        self._acquire_writer()
+        digest = key.digest
+        if self._has_digest(digest):
             raise EmailExistsError("Email already exists.")
+        user["email_h"] = f"{digest:032x}"
+        self._index_email(digest)
         self.cache.append(user)
-        plain = decrypt_data(candidate) if "@" not in candidate else candidate
-        if plain and plain != "[UNREADABLE]":
-            self.email_index.add(_hash_email(plain))
         if self.safe_mode:
-            self._save_full()
+            self._append_journaled(user)
         else:
             self._append(user)
 
 # -----------------------------
 # Plaintext mirror for compatibility with other tools
 # -----------------------------
+# Role folders whose users.ndjson got records from this process
+_mirrored_roles: Set[Path] = set()
+
 def _mirror_plain_users_json(role_folder: Path, user_plain: Dict[str, Any]) -> None:
-    dst = role_folder / "users.json"
+    # Append-only while running; _rollup_mirrors folds users.ndjson into
+    # users.json at exit (as `cli.py compact` does) so other tools see the users
     try:
-        existing = []
-        if dst.exists():
-            data = json.loads(dst.read_text("utf-8"))
-            if isinstance(data, list):
-                existing = data
-        by_key = {}
-        for u in existing:
-            key = (str(u.get("id")), _norm_email(str(u.get("email", ""))))
-            by_key[key] = u
-        key = (str(user_plain.get("id")), _norm_email(user_plain.get("email", "")))
-        by_key[key] = user_plain
-        merged = list(by_key.values())
-        tmp = dst.with_suffix(".tmp")
-        tmp.write_text(json.dumps(merged, indent=4, ensure_ascii=False), encoding="utf-8")
-        tmp.replace(dst)
+        with open(role_folder / "users.ndjson", "ab", buffering=1 << 16) as f:
+            f.write(json.dumps(user_plain, separators=(",", ":"), ensure_ascii=False).encode("utf-8") + b"\n")
+        _mirrored_roles.add(role_folder)
+    except Exception as e:
+        log_exception(e)
+
+@atexit.register
+def _rollup_mirrors() -> None:
+    if not _mirrored_roles:
+        return
+    try:
+        if str(PROJECT_ROOT) not in sys.path:
+            sys.path.append(str(PROJECT_ROOT))
+        from Database.export_import import rollup_users_json
+        for role_folder in sorted(_mirrored_roles):
+            rollup_users_json(role_folder)
+        _mirrored_roles.clear()
     except Exception as e:
         log_exception(e)
 
@@ -234,18 +620,127 @@ def _mirror_plain_users_json(role_folder: Path, user_plain: Dict[str, Any]) -> N
 # Stats helpers
 # -----------------------------
 def load_stats() -> Dict[str, Any]:
-    if not STATS_FILE.exists():
-        return {"User_Count": 0}
     try:
-        with open(STATS_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception:
+        return _loads(STATS_FILE.read_bytes())
+    except Exception:  # missing or unreadable stats file
         return {"User_Count": 0}
 
 def update_stats(stats: Dict[str, Any]) -> None:
     STATS_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(STATS_FILE, "w", encoding="utf-8") as f:
-        json.dump(stats, f, indent=4)
+    tmp = STATS_FILE.with_suffix(".tmp")
+    tmp.write_text(_dumps(stats, indent=True), encoding="utf-8")
+    os.replace(tmp, STATS_FILE)
+
+# -----------------------------
+# Programmatic API
+# -----------------------------
+def _normalize_role(role: str) -> str:
+    role = role.capitalize()
+    if role not in _VALID_ROLE_SET:
+        raise ValidationError("Invalid role.")
+    return role
+
+def _store_user(users: Users, user_id: str, name: str, key: _EmailKey, hashed_pw: Dict[str, str]) -> Dict[str, Any]:
+    """Encrypt and append one user, mirror it in plaintext and return the mirror record."""
+    role = users.role_folder.name
+    enc_name, enc_email = encrypt_many(name, key.plain)
+    created = datetime.now(UTC).isoformat()
+    user = {
+        "id": user_id,
+        "name": enc_name,
+        "email": enc_email,
+        "password": hashed_pw,
+        "role": role,
+        "created": created
+    }
+    users.add_user(user, key)
+    plain = {
+        "id": user_id,
+        "name": name,
+        "email": key.plain,
+        "password": hashed_pw,
+        "role": role,
+        "created": created
+    }
+    _mirror_plain_users_json(users.role_folder, plain)
+    return plain
+
+def create_user(role: str, name: str, email: str, password: str, *, users: Optional[Users] = None) -> Dict[str, Any]:
+    """
+    Validate, hash, encrypt and store a single user without prompting.
+
+    Pass ``users`` to reuse an open store for the role; otherwise one is
+    opened and closed around the insert. Returns the plaintext record.
+    """
+    role = _normalize_role(role)
+    Validator.name(name)
+    Validator.email(email)
+    Validator.password(password)
+    key = email_key(email)
+    stats = load_stats()
+    new_id = stats.get("User_Count", 0) + 1
+
+    store = users if users is not None else Users(BASE_DIR / role)
+    try:
+        # Cheap duplicate check before paying for Argon2
+        if store.email_exists(key):
+            raise EmailExistsError("Email already exists.")
+        record = _store_user(store, str(new_id), name, key, hash_password(password))
+    finally:
+        if users is None:
+            store.close()
+
+    stats["User_Count"] = new_id
+    update_stats(stats)
+    return record
+
+def create_users_bulk(records: Iterable[Tuple[str, str, str, str]], *, max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Store many ``(role, name, email, password)`` records in one pass.
+
+    Everything is validated and checked for duplicates (against each role
+    store and within the batch) before anything is written. Passwords are
+    hashed on a thread pool (argon2-cffi releases the GIL), each role store
+    is opened once, and stats are written once at the end.
+    """
+    rows = [(_normalize_role(role), name, email, password) for role, name, email, password in records]
+    for _, name, email, password in rows:
+        Validator.name(name)
+        Validator.email(email)
+        Validator.password(password)
+
+    stats = load_stats()
+    base_id = stats.get("User_Count", 0)
+    created: List[Dict[str, Any]] = []
+    stores: Dict[str, Users] = {}
+    try:
+        keys: List[_EmailKey] = []
+        seen: Set[Tuple[str, int]] = set()
+        for role, _, email, _ in rows:
+            store = stores.get(role)
+            if store is None:
+                store = stores[role] = Users(BASE_DIR / role)
+            key = email_key(email)
+            if store.email_exists(key) or (role, key.digest) in seen:
+                raise EmailExistsError(f"Email already exists: {email}")
+            seen.add((role, key.digest))
+            keys.append(key)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            hashes = list(pool.map(hash_password, (row[3] for row in rows)))
+
+        for (role, name, _, _), key, hashed_pw in zip(rows, keys, hashes):
+            user_id = str(base_id + len(created) + 1)
+            created.append(_store_user(stores[role], user_id, name, key, hashed_pw))
+    finally:
+        for store in stores.values():
+            store.close()
+        # Count every record written, even when a later one failed, so the
+        # next run does not hand out the same ids again
+        if created:
+            stats["User_Count"] = base_id + len(created)
+            update_stats(stats)
+    return created
 
 # -----------------------------
 # CLI input
@@ -266,7 +761,7 @@ def ui_input(text: str, password: bool = False) -> str:
         ).strip()
     if not val:
         raise ValidationError("Empty input.")
-    return re.sub(r"[<>\"']", "", val)
+    return val.translate(_STRIP_TABLE)
 
 
 def prompt_with_validation(
@@ -292,46 +787,19 @@ def prompt_with_validation(
 # -----------------------------
 # Main flow
 # -----------------------------
-def main() -> None:
+def main(argv: Optional[List[str]] = None) -> None:
     try:
         from Utils.display_title import display_title
         display_title()
     except Exception:
         pass
 
-    stats = load_stats()
-    new_id = stats.get("User_Count", 0) + 1
     try:
         name = prompt_with_validation("Name: ", Validator.name)
         email = prompt_with_validation("Email: ", Validator.email)
         password = prompt_with_validation("Password: ", Validator.password, password=True)
-        hashed_pw = hash_password(password)
         role = prompt_with_validation(f"Role ({', '.join(VALID_ROLES)}): ")
-        role = role.capitalize()
-        if role not in VALID_ROLES:
-            raise ValidationError("Invalid role.")
-        users = Users(BASE_DIR / role)
-        if users.email_exists(email):
-            raise EmailExistsError("Email already exists.")
-        user = {
-            "id": str(new_id),
-            "name": encrypt_data(name),
-            "email": encrypt_data(email),
-            "password": hashed_pw,
-            "role": role,
-            "created": datetime.now(UTC).isoformat()
-        }
-        users.add_user(user)
-        _mirror_plain_users_json(BASE_DIR / role, {
-            "id": str(new_id),
-            "name": name,
-            "email": email,
-            "password": hashed_pw,
-            "role": role,
-            "created": datetime.now(UTC).isoformat()
-        })
-        stats["User_Count"] = new_id
-        update_stats(stats)
+        create_user(role, name, email, password)
         print("User added successfully.")
     except Exception as e:
         log_exception(e)
@@ -3,8 +3,8 @@
 """
 Secure automated bot account generator with:
 - Random unique bot name and email generation
-- Strong random password assignment with SHA-256 hashing
-- JSON database storage with automatic file creation
+- Strong random password assignment with BLAKE2b hashing
+- Append-only NDJSON storage, merged into users.json by `cli.py compact`
 - Logging of every bot creation event and total count
 - Input validation with upper bound to prevent abuse
 - Fallback for colors and display_title if Utils is missing
@@ -19,11 +19,12 @@ import sys
 import time
 import json
 import logging
-import random
-import string
+import base64
+import secrets
 import hashlib
+from contextlib import suppress
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Callable, Dict, List, Set
 
 # ==========================================================
 # Optional Imports with Fallbacks
@@ -48,12 +49,20 @@ except Exception:
     def display_title(title: str) -> None:
         print(f"\n{title}\n" + "=" * len(title))
 
+try:
+    import orjson
+except ImportError:
+    # Fallback: stdlib json (slower on large bot files)
+    orjson = None
+
 # ==========================================================
 # Path Configuration
 # ==========================================================
 BASE_DIR: Path = Path(__file__).resolve().parent
 BOT_DIR: Path = DATABASE_DIR / "Bot"
 BOT_FILE: Path = BOT_DIR / "users.json"
+PENDING_BOT_FILE: Path = BOT_DIR / "users.ndjson"
+COMPACTING_BOT_FILE: Path = BOT_DIR / "users.ndjson.compacting"
 LOG_FILE: Path = BASE_DIR / "Logs" / "system_log.txt"
 
 LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
@@ -93,47 +102,83 @@ def log_action(bot: Dict[str, str]) -> None:
     """Log creation of a single bot."""
     logging.info(f"Created bot '{bot['name']}' with email '{bot['email']}'")
 
+def _loads(raw: bytes):
+    """Decode JSON bytes with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def _dumps(obj) -> bytes:
+    """Encode compact JSON bytes with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
 def load_bots() -> List[Dict[str, str]]:
-    """Load existing bots from the JSON file. Create file if missing."""
+    """Load existing bots from the JSON file plus any not yet compacted. Create file if missing."""
     if not BOT_FILE.exists():
         BOT_FILE.write_text("[]", encoding="utf-8")
+    bots: List[Dict[str, str]] = []
     try:
-        with open(BOT_FILE, "r", encoding="utf-8") as f:
-            bots: List[Dict[str, str]] = json.load(f)
-            logging.info("Loaded %d existing bots from database", len(bots))
-            return bots
-    except json.JSONDecodeError as e:
+        data = _loads(BOT_FILE.read_bytes())
+        bots = [b for b in data if isinstance(b, dict)] if isinstance(data, list) else []
+    except ValueError as e:
         logging.error("JSON decode error: %s", e)
-        return []
-
-def save_bots(bots: List[Dict[str, str]]) -> None:
-    """Save the full bot list to the JSON file."""
-    with open(BOT_FILE, "w", encoding="utf-8") as f:
-        json.dump(bots, f, indent=4)
-    logging.info("Saved total %d bots to database", len(bots))
+    # Bots mid-compaction sit in the renamed pending file until merged
+    for pending in (COMPACTING_BOT_FILE, PENDING_BOT_FILE):
+        if not pending.exists():
+            continue
+        with open(pending, "rb") as f:
+            for line in f:
+                with suppress(ValueError):
+                    record = _loads(line)
+                    if isinstance(record, dict):
+                        bots.append(record)
+    logging.info("Loaded %d existing bots from database", len(bots))
+    return bots
+
+def append_bots(new_bots: List[Dict[str, str]]) -> None:
+    """Append only the new bots to the NDJSON file in a single write."""
+    payload = b"".join(_dumps(bot) + b"\n" for bot in new_bots)
+    with open(PENDING_BOT_FILE, "ab") as f:
+        f.write(payload)
+    logging.info("Appended %d bots to database", len(new_bots))
 
 # ==========================================================
 # Bot Creation Helpers
 # ==========================================================
 
-def generate_unique_name(existing_names: Set[str]) -> str:
-    """Generate a unique bot name."""
-    while True:
-        name = "Bot" + ''.join(random.choices(string.ascii_uppercase + string.digits, k=5))
-        if name not in existing_names:
-            return name
-
-def generate_unique_email(existing_emails: Set[str]) -> str:
-    """Generate a unique bot email."""
-    while True:
-        prefix = ''.join(random.choices(string.ascii_lowercase + string.digits, k=8))
-        email = f"{prefix}@botmail.com"
-        if email not in existing_emails:
-            return email
+def _generate_unique(count: int, existing: Set[str], width: int, render: Callable[[bytes], str]) -> List[str]:
+    """Draw ~1.1x ``count`` candidates per round from one urandom call, keeping unseen ones."""
+    picked: List[str] = []
+    seen = set(existing)
+    while len(picked) < count:
+        batch = int((count - len(picked)) * 1.1) + 1
+        raw = os.urandom(batch * width)
+        for i in range(0, len(raw), width):
+            value = render(raw[i:i + width])
+            if value not in seen:
+                seen.add(value)
+                picked.append(value)
+                if len(picked) == count:
+                    break
+    return picked
+
+def generate_unique_names(count: int, existing_names: Set[str]) -> List[str]:
+    """Generate ``count`` unique bot names."""
+    return _generate_unique(
+        count, existing_names, 5, lambda b: "Bot" + base64.b32encode(b).decode("ascii")[:5]
+    )
+
+def generate_unique_emails(count: int, existing_emails: Set[str]) -> List[str]:
+    """Generate ``count`` unique bot emails."""
+    return _generate_unique(count, existing_emails, 4, lambda b: f"{b.hex()}@botmail.com")
+
+PASSWORD_HASH_ALGO = "blake2b"
 
 def hash_password(password: str) -> str:
-    """Return a SHA-256 hash of the password."""
-    return hashlib.sha256(password.encode("utf-8")).hexdigest()
+    """Return a 256-bit BLAKE2b hex digest of the password."""
+    return hashlib.blake2b(password.encode("utf-8"), digest_size=32).hexdigest()
 
 def create_bots(count: int) -> List[Dict[str, str]]:
     """
@@ -145,27 +190,24 @@ def create_bots(count: int) -> List[Dict[str, str]]:
     existing_names: Set[str] = {b["name"] for b in bots}
     existing_emails: Set[str] = {b["email"] for b in bots}
 
+    names = generate_unique_names(count, existing_names)
+    emails = generate_unique_emails(count, existing_emails)
     new_bots: List[Dict[str, str]] = []
-    for _ in range(count):
-        name = generate_unique_name(existing_names)
-        email = generate_unique_email(existing_emails)
-        password_plain = ''.join(random.choices(string.ascii_letters + string.digits, k=10))
-        password_hashed = hash_password(password_plain)
+    for name, email in zip(names, emails):
+        password_hashed = hash_password(secrets.token_urlsafe(8)[:10])
 
         bot = {
             "name": name,
             "email": email,
             "password_hash": password_hashed,
+            "password_algo": PASSWORD_HASH_ALGO,
             "role": "Bot"
         }
 
-        bots.append(bot)
         new_bots.append(bot)
-        existing_names.add(name)
-        existing_emails.add(email)
         log_action(bot)
 
-    save_bots(bots)
+    append_bots(new_bots)
     logging.info("Created %d new bots in this session", len(new_bots))
     return new_bots
 
@@ -186,7 +228,7 @@ def main() -> None:
         show_loading("Creating bots")
         new_bots = create_bots(count)
 
-        print(f"{GREEN + BRIGHT}{len(new_bots)} bots successfully created and saved to Bot/users.json{RESET}\n")
+        print(f"{GREEN + BRIGHT}{len(new_bots)} bots successfully created and saved to Bot/users.ndjson{RESET}\n")
 
         header = f"{WHITE + BRIGHT}{'Id'.ljust(5)}{'Name'.ljust(18)}{'Email'}{RESET}"
         print(header)
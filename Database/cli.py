@@ -4,8 +4,10 @@ Unified CLI entrypoint that wraps the existing database utilities.
 
 Subcommands
 -----------
-- add, search, update, remove: delegate to the existing interactive scripts.
+- add, search, update, remove: delegate to the existing interactive scripts,
+  imported and run in-process (``--isolate`` runs them in a subprocess).
 - export, import, backup: use the export_import helpers.
+- compact: fold the append-only ``users.ndjson`` mirrors into ``users.json``.
 
 Examples
 --------
@@ -21,6 +23,7 @@ Forward extra options to an underlying script::
 from __future__ import annotations
 
 import argparse
+import importlib
 import subprocess
 import sys
 from dataclasses import dataclass
@@ -40,23 +43,31 @@ from Database import export_import  # noqa: E402
 class ScriptCommand:
     name: str
     path: Path
+    module: str
     help: str
 
 
 SCRIPT_COMMANDS: Dict[str, ScriptCommand] = {
-    "add": ScriptCommand("add", SCRIPTS_DIR / "add.py", "Run the add utility"),
-    "search": ScriptCommand("search", SCRIPTS_DIR / "search.py", "Run the search utility"),
-    "update": ScriptCommand("update", SCRIPTS_DIR / "update.py", "Run the update utility"),
-    "remove": ScriptCommand("remove", SCRIPTS_DIR / "remove.py", "Run the remove utility"),
+    "add": ScriptCommand("add", SCRIPTS_DIR / "add.py", "Database.add", "Run the add utility"),
+    "search": ScriptCommand("search", SCRIPTS_DIR / "search.py", "Database.search", "Run the search utility"),
+    "update": ScriptCommand("update", SCRIPTS_DIR / "update.py", "Database.update", "Run the update utility"),
+    "remove": ScriptCommand("remove", SCRIPTS_DIR / "remove.py", "Database.remove", "Run the remove utility"),
 }
 
 
-def _run_script(path: Path, extra_args: Optional[List[str]] = None) -> int:
-    cmd = [sys.executable, str(path)]
-    if extra_args:
-        cmd.extend(extra_args)
-    result = subprocess.run(cmd)
-    return result.returncode
+def _run_script(script: ScriptCommand, extra_args: Optional[List[str]] = None, isolate: bool = False) -> int:
+    if extra_args and extra_args[0] == "--":
+        extra_args = extra_args[1:]
+    if isolate:
+        cmd = [sys.executable, str(script.path)]
+        if extra_args:
+            cmd.extend(extra_args)
+        result = subprocess.run(cmd)
+        return result.returncode
+
+    module = importlib.import_module(script.module)
+    result = module.main(extra_args or [])
+    return result if isinstance(result, int) else 0
 
 
 def _add_script_subcommand(subparsers: argparse._SubParsersAction[argparse.ArgumentParser]) -> None:
@@ -66,12 +77,19 @@ def _add_script_subcommand(subparsers: argparse._SubParsersAction[argparse.Argum
             help=script.help,
             formatter_class=argparse.ArgumentDefaultsHelpFormatter,
         )
+        parser.add_argument(
+            "--isolate",
+            action="store_true",
+            help="Run the script in a separate Python process",
+        )
         parser.add_argument(
             "script_args",
             nargs=argparse.REMAINDER,
             help="Arguments forwarded to the underlying script",
         )
-        parser.set_defaults(handler=lambda args, script=script: _run_script(script.path, args.script_args))
+        parser.set_defaults(
+            handler=lambda args, script=script: _run_script(script, args.script_args, isolate=args.isolate)
+        )
 
 
 def _add_export_subcommand(subparsers: argparse._SubParsersAction[argparse.ArgumentParser]) -> None:
@@ -115,6 +133,15 @@ def _add_backup_subcommand(subparsers: argparse._SubParsersAction[argparse.Argum
     )
 
 
+def _add_compact_subcommand(subparsers: argparse._SubParsersAction[argparse.ArgumentParser]) -> None:
+    parser = subparsers.add_parser(
+        "compact",
+        help="Roll pending users.ndjson records into users.json",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.set_defaults(handler=_handle_compact)
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Unified entrypoint for database utilities",
@@ -127,6 +154,7 @@ def build_parser() -> argparse.ArgumentParser:
     _add_export_subcommand(sub)
     _add_import_subcommand(sub)
     _add_backup_subcommand(sub)
+    _add_compact_subcommand(sub)
 
     return parser
 
@@ -140,6 +168,13 @@ def _handle_import(args: argparse.Namespace) -> int:
     return 0
 
 
+def _handle_compact(args: argparse.Namespace) -> int:
+    applied = export_import.compact_database()
+    for role, count in applied.items():
+        print(f"  {role}: {count} pending record(s) merged")
+    return 0
+
+
 def _print_and_return(message: str, code: int = 0) -> int:
     print(message)
     return code
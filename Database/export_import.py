@@ -8,6 +8,7 @@ Features
 - Import a snapshot in merge or replace mode with duplicate protection.
 - Lightweight validation of user objects and automatic stats refresh.
 - Backup helper with retention control.
+- Rollup of the append-only ``users.ndjson`` mirror into ``users.json``.
 - CLI with explicit subcommands: ``export``, ``import``, and ``backup``.
 
 Usage examples
@@ -30,68 +31,124 @@ interactive CLI tools.
 
 from __future__ import annotations
 
-import argparse
+import hashlib
 import json
+import os
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Tuple
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.append(str(PROJECT_ROOT))
 
+if TYPE_CHECKING:  # argparse is imported lazily; see build_parser
+    import argparse
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib encoder/decoder
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional: large snapshots are then parsed in one go
+    ijson = None
+
+
+def _dumps(data: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=4, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 try:
     from Handler.config_loader import Config, load_config
-    from Database.storage import JsonStorageAdapter, StorageAdapter
+    from Database.storage import JsonStorageAdapter, StorageAdapter, atomic_write_bytes, read_file_bytes, write_file_bytes
 except Exception as exc:  # pragma: no cover - guarded fallback
     raise ImportError("config_loader is required for export/import utilities") from exc
 
 
 DEFAULT_ROLES: Tuple[str, ...] = ("Owner", "Developer", "Admin", "Member", "Bot")
+_DEFAULT_ROLES_SET = frozenset(DEFAULT_ROLES)
+_DEFAULT_ROLES_LIST: List[str] = list(DEFAULT_ROLES)
 USER_FILE = "users.json"
+PENDING_USER_FILE = "users.ndjson"
+# users.ndjson is renamed to this while it is being merged into users.json
+COMPACTING_USER_FILE = PENDING_USER_FILE + ".compacting"
 REQUIRED_FIELDS = frozenset({"id", "name", "email", "role"})
+_REQUIRED_FIELDS_SORTED: Tuple[str, ...] = tuple(sorted(REQUIRED_FIELDS))
+# Sidecar in the exports directory describing the most recent snapshot
+EXPORT_CACHE_FILE = ".cache.json"
+# Snapshots at least this large are imported role by role when ijson is available
+STREAM_IMPORT_MIN_BYTES = 1 << 20
+
 
+def _clean(value: Any) -> str:
+    # Already-clean strings pass through without allocating a copy
+    if type(value) is str and (not value or not (value[0].isspace() or value[-1].isspace())):
+        return value
+    return str(value).strip()
 
-def _normalize_user(user: Dict[str, Any], role: str) -> Dict[str, Any]:
+
+def _normalize_user(user: Dict[str, Any], role: str, copy: bool = True) -> Dict[str, Any]:
+    """Validate and normalize one user; with ``copy=False`` ``user`` is updated in place."""
     if not isinstance(user, dict):
         raise ValueError("User entries must be dictionaries")
 
-    missing = REQUIRED_FIELDS - user.keys()
+    missing = [field for field in _REQUIRED_FIELDS_SORTED if field not in user]
     if missing:
-        raise ValueError(f"Missing required fields for {role}: {', '.join(sorted(missing))}")
+        raise ValueError(f"Missing required fields for {role}: {', '.join(missing)}")
 
-    normalized = dict(user)
+    normalized = dict(user) if copy else user
     normalized["role"] = role
-    normalized["id"] = str(normalized.get("id", "")).strip()
-    normalized["name"] = str(normalized.get("name", "")).strip()
-    normalized["email"] = str(normalized.get("email", "")).strip()
+    normalized["id"] = _clean(normalized.get("id", ""))
+    normalized["name"] = _clean(normalized.get("name", ""))
+    normalized["email"] = _clean(normalized.get("email", ""))
     return normalized
 
 
-def _dedupe_users(users: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    seen: Dict[str, int] = {}
-    deduped: List[Dict[str, Any]] = []
-
-    for user in users:
-        email_key = str(user.get("email", "")).lower()
-        identifier = email_key or str(user.get("id", ""))
-        if identifier in seen:
-            deduped[seen[identifier]] = user
-        else:
-            seen[identifier] = len(deduped)
-            deduped.append(user)
-    return deduped
-
-
-def _reindex_ids(users: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    reindexed: List[Dict[str, Any]] = []
-    for idx, user in enumerate(users, start=1):
-        updated = dict(user)
-        updated["id"] = str(idx)
-        reindexed.append(updated)
-    return reindexed
+def _merge_role_users(
+    existing: Iterable[Dict[str, Any]], incoming: Iterable[Any], role: str
+) -> Tuple[int, List[Dict[str, Any]]]:
+    """
+    Dedupe ``existing`` followed by normalized ``incoming`` and renumber ids.
+
+    One pass over the records: incoming entries are normalized in place as
+    they are keyed. Dicts keep first-insertion order, so a later duplicate
+    replaces the earlier record in its original position. The caller must
+    own every dict passed in. Returns ``(incoming_count, merged)``.
+    """
+    acc: Dict[str, Dict[str, Any]] = {}
+    lower = str.lower
+    get = dict.get
+    for user in existing:
+        email = get(user, "email", "")
+        # The id is only looked up for records without an email
+        acc[lower(str(email)) if email else str(get(user, "id", ""))] = user
+
+    count = 0
+    for raw in incoming:
+        user = _normalize_user(raw, role, copy=False)
+        email = user["email"]
+        acc[lower(email) if email else user["id"]] = user
+        count += 1
+
+    merged = list(acc.values())
+    for idx, user in enumerate(merged, start=1):
+        user["id"] = str(idx)
+    return count, merged
 
 
 @dataclass(frozen=True)
@@ -100,6 +157,87 @@ class ImportSummary:
     total_users: int
 
 
+def _role_fingerprints(adapter: StorageAdapter, users_file: str) -> Optional[Dict[str, Any]]:
+    """Return ``role -> [mtime_ns, size]`` for JSON-backed storage, else ``None``."""
+    if not isinstance(adapter, JsonStorageAdapter):
+        return None
+    database_dir = adapter.config.database_dir
+    # One directory listing tells which role folders exist; only those are stat'ed
+    try:
+        with os.scandir(database_dir) as entries:
+            present = {entry.name for entry in entries if entry.name in _DEFAULT_ROLES_SET and entry.is_dir()}
+    except FileNotFoundError:
+        present = set()
+
+    prints: Dict[str, Any] = dict.fromkeys(DEFAULT_ROLES)
+    for role in present:
+        try:
+            st = os.stat(database_dir / role / users_file)
+        except FileNotFoundError:
+            continue
+        prints[role] = [st.st_mtime_ns, st.st_size]
+    return prints
+
+
+def _reuse_snapshot(
+    cache_path: Path, fingerprints: Dict[str, Any], users_file: str, generated_at: str
+) -> Optional[bytes]:
+    """Return the previous snapshot re-stamped with ``generated_at`` if no role changed."""
+    try:
+        cache = _loads(read_file_bytes(cache_path))
+    except (OSError, ValueError):
+        return None
+    if (
+        type(cache) is not dict
+        or cache.get("roles") != fingerprints
+        or cache.get("users_file") != users_file
+        or type(cache.get("generated_at")) is not str
+    ):
+        return None
+
+    try:
+        previous = read_file_bytes(Path(cache.get("snapshot", "")))
+    except OSError:
+        return None
+    if hashlib.sha256(previous).hexdigest() != cache.get("sha256"):
+        return None
+
+    # Metadata is serialized first, so the first match is the snapshot's own stamp
+    needle = b'"generated_at": "' + cache["generated_at"].encode() + b'"'
+    if needle not in previous:
+        return None
+    return previous.replace(needle, b'"generated_at": "' + generated_at.encode() + b'"', 1)
+
+
+def _build_snapshot(
+    adapter: StorageAdapter,
+    users_file: str,
+    generated_at: str,
+    fingerprints: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    def _load(role: str) -> List[Dict[str, Any]]:
+        # Roles known to have no users file are exported empty without a lookup
+        if fingerprints is not None and fingerprints[role] is None:
+            return []
+        return adapter.load_role_users(role, users_file)
+
+    # Role files are independent; read them concurrently (file I/O releases the GIL).
+    # The users mapping is built in one step with all role keys present.
+    with ThreadPoolExecutor(max_workers=len(DEFAULT_ROLES)) as pool:
+        users = dict(zip(DEFAULT_ROLES, pool.map(_load, DEFAULT_ROLES)))
+
+    snapshot: Dict[str, Any] = {
+        "metadata": {
+            "generated_at": generated_at,
+            "roles": _DEFAULT_ROLES_LIST,
+            "users_file": users_file,
+            "user_count": sum(map(len, users.values())),
+        },
+        "users": users,
+    }
+    return snapshot
+
+
 def export_database(
     output: Path | None = None,
     users_file: str = USER_FILE,
@@ -109,26 +247,31 @@ def export_database(
     adapter = storage or JsonStorageAdapter(config or load_config())
     cfg = adapter.config
     cfg.exports_dir.mkdir(parents=True, exist_ok=True)
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
+    now = datetime.now(timezone.utc)
+    timestamp = now.strftime("%Y%m%d-%H%M%S")
     target = output or cfg.exports_dir / f"users-export-{timestamp}.json"
-
-    snapshot: Dict[str, Any] = {
-        "metadata": {
-            "generated_at": datetime.now(timezone.utc).isoformat(),
-            "roles": DEFAULT_ROLES,
+    generated_at = now.isoformat()
+
+    # Unchanged role files (same mtime and size) reuse the last snapshot's bytes
+    # instead of being parsed and serialized again
+    cache_path = cfg.exports_dir / EXPORT_CACHE_FILE
+    fingerprints = _role_fingerprints(adapter, users_file)
+    payload = None
+    if fingerprints is not None:
+        payload = _reuse_snapshot(cache_path, fingerprints, users_file, generated_at)
+    if payload is None:
+        payload = _dumps(_build_snapshot(adapter, users_file, generated_at, fingerprints))
+
+    write_file_bytes(target, payload)
+    if fingerprints is not None:
+        cache = {
+            "snapshot": str(target),
+            "sha256": hashlib.sha256(payload).hexdigest(),
+            "generated_at": generated_at,
             "users_file": users_file,
-        },
-        "users": {},
-    }
-
-    total_users = 0
-    for role in DEFAULT_ROLES:
-        users = adapter.load_role_users(role, users_file)
-        snapshot["users"][role] = users
-        total_users += len(users)
-
-    snapshot["metadata"]["user_count"] = total_users
-    target.write_text(json.dumps(snapshot, indent=4, ensure_ascii=False), encoding="utf-8")
+            "roles": fingerprints,
+        }
+        write_file_bytes(cache_path, _dumps(cache))
     return target
 
 
@@ -146,34 +289,116 @@ def import_database(
 
     adapter = storage or JsonStorageAdapter(config or load_config())
 
-    raw = json.loads(snapshot_path.read_text(encoding="utf-8"))
-    users_section = raw.get("users")
-    if not isinstance(users_section, dict):
-        raise ValueError("Snapshot is missing a valid 'users' section")
-
-    imported_counts: Dict[str, int] = {}
-    total_after_import = 0
-
-    for role in DEFAULT_ROLES:
-        entries = users_section.get(role, [])
+    def _import_role(role: str, entries: Any) -> Tuple[int, int]:
         incoming_raw = entries if isinstance(entries, list) else []
-        incoming = [_normalize_user(user, role) for user in incoming_raw]
-
-        if mode == "merge":
-            existing = adapter.load_role_users(role, users_file)
-            merged = _dedupe_users([*existing, *incoming])
-        else:
-            merged = _dedupe_users(incoming)
-
-        merged = _reindex_ids(merged)
+        existing = adapter.load_role_users(role, users_file) if mode == "merge" else ()
+        # Snapshot entries are parsed fresh for this import, so normalize in place
+        incoming_count, merged = _merge_role_users(existing, incoming_raw, role)
         adapter.write_role_users(role, merged, users_file)
-        imported_counts[role] = len(incoming)
-        total_after_import += len(merged)
+        return incoming_count, len(merged)
+
+    # Each role reads and writes its own directory, so roles run concurrently.
+    # Adapters with a ``batch`` context stage the role files and swap them in
+    # together once every role has been written.
+    futures: Dict[str, Future[Tuple[int, int]]] = {}
+    batch = getattr(adapter, "batch", None)
+    with batch() if batch is not None else nullcontext():
+        with ThreadPoolExecutor(max_workers=len(DEFAULT_ROLES)) as pool:
+            if ijson is not None and snapshot_path.stat().st_size >= STREAM_IMPORT_MIN_BYTES:
+                # Each role list is handed off as soon as it is parsed
+                with open(snapshot_path, "rb") as f:
+                    for role, entries in ijson.kvitems(f, "users", use_float=True):
+                        if role in _DEFAULT_ROLES_SET and role not in futures:
+                            futures[role] = pool.submit(_import_role, role, entries)
+                if not futures:
+                    raw = _loads(read_file_bytes(snapshot_path))
+                    if type(raw) is not dict or type(raw.get("users")) is not dict:
+                        raise ValueError("Snapshot is missing a valid 'users' section")
+                for role in DEFAULT_ROLES:
+                    if role not in futures:
+                        futures[role] = pool.submit(_import_role, role, [])
+            else:
+                raw = _loads(read_file_bytes(snapshot_path))
+                users_section = raw.get("users") if type(raw) is dict else None
+                if type(users_section) is not dict:
+                    raise ValueError("Snapshot is missing a valid 'users' section")
+                for role in DEFAULT_ROLES:
+                    futures[role] = pool.submit(_import_role, role, users_section.get(role, []))
+
+        # Collect inside the batch so a failed role aborts the whole swap
+        imported_counts: Dict[str, int] = {}
+        total_after_import = 0
+        for role in DEFAULT_ROLES:
+            incoming_count, merged_count = futures[role].result()
+            imported_counts[role] = incoming_count
+            total_after_import += merged_count
+        # Staged with the role files so counts and users land together
+        adapter.update_stats(total_after_import)
 
-    adapter.update_stats(total_after_import)
     return ImportSummary(roles_updated=imported_counts, total_users=total_after_import)
 
 
+def _read_pending(path: Path) -> List[Dict[str, Any]]:
+    pending: List[Dict[str, Any]] = []
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                record = _loads(line)
+            except ValueError:
+                continue
+            if isinstance(record, dict):
+                pending.append(record)
+    return pending
+
+
+def _merge_pending_file(role_folder: Path, pending_path: Path) -> int:
+    pending = _read_pending(pending_path)
+
+    dst = role_folder / USER_FILE
+    existing: List[Dict[str, Any]] = []
+    if dst.exists():
+        data = _loads(dst.read_bytes())
+        if isinstance(data, list):
+            existing = data
+
+    by_key: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    for user in (*existing, *pending):
+        key = (str(user.get("id")), str(user.get("email", "")).strip().lower())
+        by_key[key] = user
+
+    atomic_write_bytes(dst, _dumps(list(by_key.values())))
+    pending_path.unlink()
+    return len(pending)
+
+
+def rollup_users_json(role_folder: Path) -> int:
+    """Fold pending ``users.ndjson`` records into ``users.json`` and clear them.
+
+    The pending file is first renamed to ``users.ndjson.compacting`` so records
+    appended during the merge start a fresh ``users.ndjson`` instead of being
+    deleted with it. A ``.compacting`` file left by an interrupted run is merged
+    first. Records are merged by (id, email); a pending record replaces an
+    existing one with the same key. Returns the number of pending records applied.
+    """
+    pending_path = role_folder / PENDING_USER_FILE
+    compacting_path = role_folder / COMPACTING_USER_FILE
+    applied = 0
+    if compacting_path.exists():
+        applied += _merge_pending_file(role_folder, compacting_path)
+    try:
+        os.replace(pending_path, compacting_path)
+    except FileNotFoundError:
+        return applied
+    return applied + _merge_pending_file(role_folder, compacting_path)
+
+
+def compact_database(config: Config | None = None) -> Dict[str, int]:
+    cfg = config or load_config()
+    return {role: rollup_users_json(cfg.database_dir / role) for role in DEFAULT_ROLES}
+
+
 def prune_old_exports(cfg: Config, retention: int) -> None:
     if retention <= 0:
         return
@@ -201,7 +426,9 @@ def run_backup(
     return snapshot_path
 
 
-def build_parser() -> argparse.ArgumentParser:
+def build_parser() -> "argparse.ArgumentParser":
+    import argparse
+
     parser = argparse.ArgumentParser(description="Export or import role-based user data")
     subparsers = parser.add_subparsers(dest="command", required=True)
 
@@ -220,8 +447,59 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+# Flags understood without argparse: command -> {flag: (dest, converter)}
+_FAST_OPTIONS: Dict[str, Dict[str, Tuple[str, Any]]] = {
+    "export": {"-o": ("output", Path), "--output": ("output", Path), "--users-file": ("users_file", str)},
+    "import": {
+        "-f": ("file", Path),
+        "--file": ("file", Path),
+        "--mode": ("mode", str),
+        "--users-file": ("users_file", str),
+    },
+    "backup": {"--retention": ("retention", int)},
+}
+_FAST_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    "export": {"output": None, "users_file": USER_FILE},
+    "import": {"file": None, "mode": "merge", "users_file": USER_FILE},
+    "backup": {"retention": None},
+}
+
+
+def _fast_parse(argv: List[str]) -> Optional[SimpleNamespace]:
+    """
+    Parse the common invocations without importing argparse.
+
+    Returns ``None`` for anything unusual (help, unknown or malformed flags)
+    so :func:`build_parser` handles it, including the error messages.
+    """
+    if not argv or argv[0] not in _FAST_OPTIONS:
+        return None
+    command = argv[0]
+    options = _FAST_OPTIONS[command]
+    values = dict(_FAST_DEFAULTS[command], command=command)
+    rest = iter(argv[1:])
+    for arg in rest:
+        flag, sep, value = arg.partition("=")
+        if flag not in options:
+            return None
+        if not sep:
+            value = next(rest, None)
+            if value is None or value.startswith("-"):
+                return None
+        dest, convert = options[flag]
+        try:
+            values[dest] = convert(value)
+        except ValueError:
+            return None
+
+    if command == "import" and (values["file"] is None or values["mode"] not in {"merge", "replace"}):
+        return None
+    return SimpleNamespace(**values)
+
+
 def main(argv: List[str] | None = None) -> None:
-    args = build_parser().parse_args(argv)
+    argv = sys.argv[1:] if argv is None else argv
+    args = _fast_parse(argv) or build_parser().parse_args(argv)
 
     if args.command == "export":
         destination = export_database(args.output, users_file=args.users_file)
@@ -2,7 +2,7 @@
 # Log Editor CLI with live file watching and advanced key bindings
 """
 A terminal-based log editor with:
-- Real-time file monitoring using Watchdog
+- Real-time file monitoring using watchfiles (or Watchdog as a fallback)
 - Full editing capabilities (cut, copy, paste, undo, select all)
 - Internal clipboard management
 - Safe atomic file save with encoding handling
@@ -13,10 +13,12 @@ A terminal-based log editor with:
 
 import sys
 import os
+import asyncio
 import io
+import mmap
 import threading
 from pathlib import Path
-import time
+from typing import Optional, Tuple
 
 # ---------- Optional Imports with Fallbacks ----------
 try:
@@ -26,12 +28,27 @@ try:
     from prompt_toolkit.widgets import TextArea, Frame
     from prompt_toolkit.styles import Style
     from prompt_toolkit.selection import SelectionState, SelectionType
-    from watchdog.observers import Observer
-    from watchdog.events import FileSystemEventHandler
 except ImportError as e:
     print(f"Missing required package: {e.name}. Install via pip (e.g., pip install prompt_toolkit watchdog).")
     sys.exit(1)
 
+# File watching: watchfiles (Rust-backed, coalesces events) when available,
+# otherwise watchdog's directory observer
+try:
+    from watchfiles import awatch
+except ImportError:
+    awatch = None
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError as e:
+    if awatch is None:
+        print(f"Missing required package: {e.name}. Install via pip (e.g., pip install watchfiles or watchdog).")
+        sys.exit(1)
+    Observer = None
+    FileSystemEventHandler = object
+
 # ---------- Paths & Constants ----------
 def _safe_base_dir() -> Path:
     """Get current script directory or fallback to cwd."""
@@ -43,6 +60,8 @@ def _safe_base_dir() -> Path:
 BASE_DIR: Path = _safe_base_dir()
 LOGS_DIR: Path = BASE_DIR / "Logs"
 LOG_FILE: Path = LOGS_DIR / "system_log.txt"
+# Resolved once at import for comparing watcher event paths
+LOG_FILE_RESOLVED: str = str(LOG_FILE.resolve())
 
 # Style configuration for prompt_toolkit
 style = Style.from_dict({
@@ -52,6 +71,11 @@ style = Style.from_dict({
 
 clipboard = ""  # Internal clipboard
 
+# Text and byte size the log file is known to hold (last load or save);
+# lets a save that only appended write just the new tail
+_last_saved_text = None
+_last_saved_size = -1
+
 # ---------- Utility Functions ----------
 def show_error(message: str) -> None:
     """Display error message and clear screen."""
@@ -72,66 +96,265 @@ def ensure_log_file() -> None:
     except Exception as e:
         show_error(f"Failed to prepare log file: {e}")
 
+def _remember_saved(text: Optional[str], size: int) -> None:
+    global _last_saved_text, _last_saved_size
+    _last_saved_text, _last_saved_size = text, size
+
+def _decode_log(data) -> Tuple[str, bool]:
+    """Decode log bytes with universal newlines; the flag is False if lossy."""
+    try:
+        text, exact = str(data, "utf-8"), True
+    except UnicodeDecodeError:
+        text, exact = str(data, "utf-8", "replace"), False
+    if "\r" in text:
+        text, exact = text.replace("\r\n", "\n").replace("\r", "\n"), False
+    return text, exact
+
 def load_file() -> str:
-    """Load file content safely with encoding fallback."""
+    """Load file content safely with encoding fallback.
+
+    The file is memory-mapped and decoded straight from the mapping, so no
+    intermediate bytes copy of a large log is made.
+    """
     ensure_log_file()
     try:
-        with io.open(LOG_FILE, "r", encoding="utf-8") as f:
-            return f.read()
-    except UnicodeDecodeError:
-        with io.open(LOG_FILE, "r", encoding="utf-8", errors="replace") as f:
-            return f.read()
+        fd = os.open(LOG_FILE, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            size = os.fstat(fd).st_size
+            if size == 0:  # empty files cannot be mapped
+                text, exact = "", True
+            else:
+                with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                    text, exact = _decode_log(mm)
+                    size = len(mm)
+        finally:
+            os.close(fd)
     except Exception as e:
         show_error(f"Could not read file: {e}")
         return ""
-
-def atomic_save(path: Path, content: str) -> None:
-    """Atomically save content to a file."""
-    tmp = path.with_suffix(path.suffix + ".tmp")
-    with io.open(tmp, "w", encoding="utf-8", errors="strict") as f:
-        f.write(content)
-        f.flush()
-        os.fsync(f.fileno())
-    try:
-        tmp.replace(path)
-    except Exception:
-        if path.exists():
-            path.unlink()
-        tmp.rename(path)
-
-def save_file(content: str) -> None:
+    # Lossy decodes (replacement characters, CRLF) never take the append-only save
+    _remember_saved(text if exact else None, size if exact else -1)
+    return text
+
+_tmp_paths: dict = {}  # target path -> sibling temp path, built once per file
+
+def atomic_save(path: Path, content: str, durable: bool = False) -> int:
+    """Atomically save content to a file; fsync first only when ``durable``.
+
+    Returns the number of bytes written.
+    """
+    tmp = _tmp_paths.get(path)
+    if tmp is None:
+        tmp = _tmp_paths[path] = path.with_suffix(path.suffix + ".tmp")
+    data = content.encode("utf-8", errors="strict")
+    if durable:
+        with io.open(tmp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+    else:
+        tmp.write_bytes(data)
+    # os.replace overwrites the target on Windows as well as POSIX
+    os.replace(tmp, path)
+    return len(data)
+
+def save_file(content: str, durable: bool = False) -> None:
     """Save content safely with error handling."""
     ensure_log_file()
     try:
-        atomic_save(LOG_FILE, content)
+        base = _last_saved_text
+        # Pure append onto what the file still holds: write only the delta
+        if (
+            not durable
+            and base is not None
+            and content.startswith(base)
+            and os.stat(LOG_FILE).st_size == _last_saved_size
+        ):
+            delta = content[len(base):].encode("utf-8")
+            if delta:
+                with open(LOG_FILE, "ab") as f:
+                    f.write(delta)
+            _remember_saved(content, _last_saved_size + len(delta))
+        else:
+            _remember_saved(content, atomic_save(LOG_FILE, content, durable=durable))
     except PermissionError:
         show_error("Permission denied while saving.")
     except Exception as e:
         show_error(f"Could not save file: {e}")
 
+# ---------- Line Editing Helpers ----------
+# These locate the cursor's line with find/rfind around the cursor, so each
+# edit costs O(line length) plus the slice join instead of splitting and
+# re-joining every line of the buffer.
+def _line_bounds(text: str, cursor: int) -> Tuple[int, int]:
+    """Return ``(start, end)`` of the line holding ``cursor``, newline excluded."""
+    start = text.rfind("\n", 0, cursor) + 1
+    end = text.find("\n", cursor)
+    return start, len(text) if end == -1 else end
+
+def delete_current_line(buffer) -> Optional[str]:
+    """Remove the cursor's line and return its text (``None`` if the buffer is empty)."""
+    text = buffer.text
+    if not text:
+        return None
+    start, end = _line_bounds(text, buffer.cursor_position)
+    line = text[start:end]
+    if end < len(text):
+        cursor = start
+        end += 1  # take the line's own newline
+    elif start > 0:
+        start -= 1  # last line: take the newline before it
+        cursor = text.rfind("\n", 0, start) + 1
+    else:
+        cursor = 0
+    buffer.text = text[:start] + text[end:]
+    buffer.cursor_position = cursor
+    return line
+
+def insert_line_above(buffer, line: str) -> None:
+    """Insert ``line`` as a new line before the cursor's line and move there."""
+    text = buffer.text
+    if not text:
+        buffer.text = line
+        buffer.cursor_position = 0
+        return
+    start, _ = _line_bounds(text, buffer.cursor_position)
+    buffer.text = text[:start] + line + "\n" + text[start:]
+    buffer.cursor_position = start
+
+# ---------- Live Reload ----------
+def refresh_from_disk(text_area: TextArea, lock: threading.Lock) -> None:
+    """
+    Bring the text area up to date with the log file.
+
+    When the file only grew past what the editor last loaded or saved and the
+    buffer still shows exactly that text, just the new tail is read and
+    appended. Shrunk or rewritten files, unsaved edits and tails that do not
+    decode cleanly fall back to a full :func:`load_file`.
+    """
+    base, known_size = _last_saved_text, _last_saved_size
+    try:
+        new_size = os.stat(LOG_FILE).st_size
+    except OSError:
+        return
+    if new_size == known_size:
+        return  # our own save, or nothing new
+
+    with lock:
+        buffer = text_area.buffer
+        if base is not None and new_size > known_size >= 0 and buffer.text == base:
+            with open(LOG_FILE, "rb") as f:
+                f.seek(known_size)
+                tail = f.read(new_size - known_size)
+            try:
+                delta = tail.decode("utf-8")
+            except UnicodeDecodeError:
+                delta = None  # e.g. a multi-byte character still being written
+            if delta is not None and "\r" not in delta:
+                text = base + delta
+                buffer.text = text
+                _remember_saved(text, known_size + len(tail))
+                return
+        buffer.text = load_file()
+
+def run_on_ui(app: Optional[Application], fn) -> None:
+    """
+    Run ``fn`` on the application's event loop and redraw afterwards.
+
+    prompt_toolkit buffers are not thread-safe, so watcher threads hand their
+    updates to the UI loop instead of mutating the text area themselves.
+    Before the application runs, ``fn`` is called directly.
+    """
+    loop = getattr(app, "loop", None)
+    if loop is None or not loop.is_running():
+        fn()
+        return
+
+    def _apply() -> None:
+        try:
+            fn()
+        except Exception:
+            pass
+        app.invalidate()
+
+    loop.call_soon_threadsafe(_apply)
+
 # ---------- Watchdog Handler ----------
 class LogHandler(FileSystemEventHandler):
     """Watchdog handler to auto-refresh text area on file changes."""
-    def __init__(self, text_area: TextArea):
+    DEBOUNCE_SECONDS = 0.1  # coalesce bursts of modify events into one reload
+
+    def __init__(self, text_area: TextArea, app: Optional[Application] = None):
         self.text_area = text_area
+        self.app = app
         self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        # Resolved once: event paths are matched by string, not per-event realpath
+        self._target_paths = frozenset({
+            os.path.join(str(LOGS_DIR), LOG_FILE.name),
+            LOG_FILE_RESOLVED,
+        })
+        self._target_name = LOG_FILE.name
+
+    def _is_target(self, src_path: str) -> bool:
+        if src_path in self._target_paths:
+            return True
+        # Other files in the directory are rejected by name without a syscall;
+        # a differently spelled path to the log is confirmed by inode. The
+        # inode is looked up fresh because saves swap the file by rename.
+        if os.path.basename(src_path) != self._target_name:
+            return False
+        try:
+            return os.path.samefile(src_path, LOG_FILE)
+        except OSError:
+            return False
+
+    def _refresh(self) -> None:
+        try:
+            run_on_ui(self.app, lambda: refresh_from_disk(self.text_area, self._lock))
+        except Exception:
+            pass
 
     def on_modified(self, event) -> None:
         if event.is_directory:
             return
-        # Cross-platform path comparison
-        if os.path.abspath(event.src_path) == str(LOG_FILE.resolve()):
+        if self._is_target(event.src_path):
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.DEBOUNCE_SECONDS, self._refresh)
+            self._timer.daemon = True
+            self._timer.start()
+
+def _watch_log_file(text_area: TextArea, app: Optional[Application] = None) -> None:
+    """Reload the text area from watchfiles' debounced change batches."""
+    target = LOG_FILE_RESOLVED
+    lock = threading.Lock()
+
+    async def _watch() -> None:
+        # Saves replace the file by rename, so watch the (non-recursive) logs
+        # directory and keep only batches that touch the log file itself
+        async for _changes in awatch(
+            str(LOGS_DIR),
+            watch_filter=lambda _change, path: os.path.abspath(path) == target,
+            debounce=50,
+            recursive=False,
+        ):
             try:
-                with open(LOG_FILE, "r", encoding="utf-8", errors="replace") as f:
-                    new_content = f.read()
-                with self._lock:
-                    self.text_area.buffer.text = new_content
+                run_on_ui(app, lambda: refresh_from_disk(text_area, lock))
             except Exception:
                 pass
 
-def start_watchdog(text_area: TextArea) -> None:
-    """Start the Watchdog observer thread."""
-    event_handler = LogHandler(text_area)
+    try:
+        asyncio.run(_watch())
+    except Exception:
+        pass
+
+def start_watchdog(text_area: TextArea, app: Optional[Application] = None) -> None:
+    """Start the file watcher thread (watchfiles, else a Watchdog observer)."""
+    if awatch is not None:
+        threading.Thread(target=_watch_log_file, args=(text_area, app), daemon=True).start()
+        return
+    event_handler = LogHandler(text_area, app)
     observer = Observer()
     observer.schedule(event_handler, str(LOGS_DIR), recursive=False)
     observer.daemon = True
@@ -164,18 +387,25 @@ def main() -> None:
     )
 
     kb = KeyBindings()
+    status_help = status_bar.text
+    pending_clear = None  # event-loop handle that restores the help text
 
     # ---------- File Operations ----------
     @kb.add("c-s")
     def _(event) -> None:
+        nonlocal pending_clear
         save_file(text_area.text)
-        # Show temporary "Saved!" message in status bar
-        original = status_bar.text
+        # Show temporary "Saved!" message in status bar; the reset is a timer
+        # on the application's event loop, and a newer save restarts it
         status_bar.text = "Saved!"
-        def clear_status():
-            time.sleep(2)
-            status_bar.text = original
-        threading.Thread(target=clear_status, daemon=True).start()
+        if pending_clear is not None:
+            pending_clear.cancel()
+
+        def clear_status() -> None:
+            status_bar.text = status_help
+            event.app.invalidate()
+
+        pending_clear = event.app.loop.call_later(2.0, clear_status)
 
     @kb.add("c-x")
     def _(event) -> None:
@@ -190,42 +420,14 @@ def main() -> None:
             data = buffer.cut_selection()
             clipboard = data.text if data else ""
         else:
-            lines = buffer.text.splitlines()
-            if not lines:
-                return
-            row = buffer.document.cursor_position_row
-            row = max(0, min(row, len(lines) - 1))
-            clipboard = lines[row]
-            del lines[row]
-            buffer.text = "\n".join(lines)
-            try:
-                new_idx = buffer.document.translate_row_col_to_index(
-                    min(row, len(lines) - 1) if lines else 0, 0
-                )
-                buffer.cursor_position = new_idx
-            except Exception:
-                buffer.cursor_position = 0
+            line = delete_current_line(buffer)
+            if line is not None:
+                clipboard = line
 
     @kb.add("c-u")
     def _(event) -> None:
         global clipboard
-        buffer = text_area.buffer
-        lines = buffer.text.splitlines()
-        row = buffer.document.cursor_position_row
-        row = max(0, min(row, len(lines)))
-        insert_text = clipboard or ""
-        if not lines:
-            lines = [insert_text]
-            new_row = 0
-        else:
-            lines.insert(row, insert_text)
-            new_row = row
-        buffer.text = "\n".join(lines)
-        try:
-            new_idx = buffer.document.translate_row_col_to_index(new_row, 0)
-            buffer.cursor_position = new_idx
-        except Exception:
-            buffer.cursor_position = len(buffer.text)
+        insert_line_above(text_area.buffer, clipboard or "")
 
     @kb.add("c-c")
     def _(event) -> None:
@@ -259,22 +461,7 @@ def main() -> None:
         if buffer.selection_state:
             buffer.cut_selection()
             return
-        lines = buffer.text.splitlines()
-        if not lines:
-            return
-        row = buffer.document.cursor_position_row
-        row = max(0, min(row, len(lines) - 1))
-        del lines[row]
-        buffer.text = "\n".join(lines)
-        if lines:
-            new_row = min(row, len(lines) - 1)
-            try:
-                new_idx = buffer.document.translate_row_col_to_index(new_row, 0)
-                buffer.cursor_position = new_idx
-            except Exception:
-                buffer.cursor_position = len(buffer.text)
-        else:
-            buffer.cursor_position = 0
+        delete_current_line(buffer)
 
     @kb.add("backspace")
     def _(event) -> None:
@@ -352,7 +539,7 @@ def main() -> None:
     )
 
     # Start watchdog thread for live updates
-    start_watchdog(text_area)
+    start_watchdog(text_area, app)
 
     try:
         app.run()
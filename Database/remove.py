@@ -16,8 +16,10 @@ Interactive user removal from role folders with:
 import asyncio
 import json
 import logging
+import os
 import threading
 import shutil
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Optional, TypedDict, Tuple
 
@@ -26,9 +28,14 @@ from prompt_toolkit.styles import Style as PTStyle
 from prompt_toolkit.shortcuts import radiolist_dialog
 
 try:
-    from rapidfuzz import fuzz
+    from rapidfuzz import fuzz, process
 except ImportError:
-    fuzz = None  # fallback exact match
+    fuzz = process = None  # fallback exact match
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib encoder/decoder
+    orjson = None
 
 # =====================
 # Config / Constants
@@ -38,9 +45,12 @@ DEFAULT_USER_FILE: str = "users.json"
 CONFIRM_VALUES: set[str] = {"y", "yes"}
 LOG_NAME: str = "delete_user"
 LOG_FILE_NAME: str = "delete_user.log"
-DATABASE_DIR = Path(__file__).resolve().parent / "Database"
-UNITS_DIR = Path(__file__).resolve().parent.parent / "Units"
+FUZZY_THRESHOLD: int = 80  # partial_ratio scores strictly above this count as a match
+_HERE = Path(__file__).resolve().parent  # resolved once for every path below
+DATABASE_DIR = _HERE / "Database"
+UNITS_DIR = _HERE.parent / "Units"
 _file_lock = threading.Lock()
+_ROLE_PATHS: Dict[str, Path] = {r: DATABASE_DIR / r for r in DEFAULT_ROLES}
 
 # =====================
 # Optional Imports
@@ -58,15 +68,24 @@ except Exception:
 # =====================
 # Logging
 # =====================
+class _LazyFileHandler(logging.FileHandler):
+    """FileHandler that creates its directory and opens the file on first emit."""
+
+    def __init__(self, filename: Path, encoding: str = "utf-8"):
+        super().__init__(filename, encoding=encoding, delay=True)
+
+    def _open(self):
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return super()._open()
+
 def setup_logger() -> logging.Logger:
-    """Setup file logger"""
+    """Setup file logger (no filesystem access until a record is written)"""
     log_dir = DATABASE_DIR / "Logs"
-    log_dir.mkdir(parents=True, exist_ok=True)
     logger = logging.getLogger(LOG_NAME)
     if not any(isinstance(h, logging.FileHandler) and h.baseFilename.endswith(LOG_FILE_NAME)
                for h in logger.handlers):
         logger.setLevel(logging.INFO)
-        fh = logging.FileHandler(log_dir / LOG_FILE_NAME, encoding="utf-8")
+        fh = _LazyFileHandler(log_dir / LOG_FILE_NAME, encoding="utf-8")
         fh.setFormatter(logging.Formatter('[%(asctime)s] %(levelname)s | %(message)s'))
         logger.addHandler(fh)
     return logger
@@ -94,42 +113,72 @@ class User(TypedDict, total=False):
 # =====================
 # Helpers
 # =====================
-async def async_read_file(path: Path, timeout: int = 5) -> str:
-    """Read file async with timeout"""
+def _dumps(data) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=4, ensure_ascii=False).encode("utf-8")
+
+def _loads(raw: bytes):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+async def async_read_file(path: Path, timeout: int = 5) -> bytes:
+    """Read file bytes async with timeout (JSON parsers take bytes directly)"""
     loop = asyncio.get_event_loop()
     try:
-        return await asyncio.wait_for(loop.run_in_executor(None, path.read_text, "utf-8"), timeout=timeout)
+        return await asyncio.wait_for(loop.run_in_executor(None, path.read_bytes), timeout=timeout)
     except asyncio.TimeoutError:
         logger.warning(f"Timeout reading {path}")
-        return ""
+        return b""
     except Exception as e:
         logger.exception(f"Error reading {path}: {e}")
-        return ""
+        return b""
 
 def backup_file(path: Path) -> None:
-    """Create backup of file"""
+    """Create backup of file.
+
+    The backup is a hard link, so no bytes are copied: save_users replaces the
+    role file by rename, which leaves the ``.bak`` link on the old contents.
+    Filesystems without hard links fall back to a full copy.
+    """
     if path.exists():
         backup_path = path.with_suffix(".bak")
-        shutil.copy2(path, backup_path)
+        try:
+            backup_path.unlink(missing_ok=True)
+            os.link(path, backup_path)
+        except OSError:
+            shutil.copy2(path, backup_path)
         logger.info(f"Backup created: {backup_path}")
 
+async def read_role_files(paths: List[Path]) -> List[bytes]:
+    """Read several role files concurrently; failed reads come back as ``b""``."""
+    return await asyncio.gather(*(async_read_file(path) for path in paths))
+
 def load_users(file_path: Path) -> List[User]:
     """Load users from JSON"""
     if not file_path.exists():
         raise FileNotFoundError(f"User file not found: {file_path}")
+    return parse_users(file_path.read_bytes(), file_path)
+
+def parse_users(raw, file_path: Path) -> List[User]:
+    """Parse users.json content (str or bytes) read from ``file_path``"""
     try:
-        data = json.loads(file_path.read_text("utf-8"))
-        if not isinstance(data, list):
-            raise ValueError("Expected list in JSON")
-        return data
-    except json.JSONDecodeError as e:
+        data = _loads(raw)
+    except ValueError as e:  # json and orjson decode errors both subclass ValueError
         raise ValueError(f"Invalid JSON in {file_path}: {e}")
+    if not isinstance(data, list):
+        raise ValueError("Expected list in JSON")
+    return data
 
 def save_users(file_path: Path, users: List[User]) -> None:
     """Save users to JSON thread-safe"""
+    tmp_path = file_path.with_suffix(file_path.suffix + ".tmp")
     try:
-        with _file_lock, file_path.open("w", encoding="utf-8") as f:
-            json.dump(users, f, indent=4, ensure_ascii=False)
+        payload = _dumps(users)  # serialize outside the lock
+        with _file_lock:
+            tmp_path.write_bytes(payload)
+            os.replace(tmp_path, file_path)
     except Exception as e:
         logger.exception(f"Failed to save {file_path}: {e}")
         raise
@@ -141,36 +190,72 @@ def confirm_action(prompt_text: str) -> bool:
 def safe_user_info(user: User) -> str:
     return f"id:{user.get('id')} name:{user.get('name','')}"
 
-def fuzzy_match(query: str, user: User) -> bool:
-    query = query.lower()
-    if user.get("id") == query:
+def _match_keys(user: User) -> Tuple[Optional[str], str, str]:
+    return user.get("id"), user.get("name", "").lower(), user.get("email", "").lower()
+
+def _matches_keys(query: str, keys: Tuple[Optional[str], str, str]) -> bool:
+    """``query`` must already be lowercased."""
+    uid, name, email = keys
+    if uid == query:
         return True
-    for field in ("name", "email"):
-        val = user.get(field, "").lower()
-        if fuzz and fuzz.partial_ratio(query, val) > 80:
-            return True
+    for val in (name, email):
         if query in val:
             return True
+        if fuzz and fuzz.partial_ratio(query, val) > FUZZY_THRESHOLD:
+            return True
     return False
 
+def fuzzy_match(query: str, user: User) -> bool:
+    return _matches_keys(query.lower(), _match_keys(user))
+
+def find_match_indices(query: str, users: List[User]) -> List[int]:
+    """
+    Return the positions in ``users`` matching ``query``, in ascending order.
+
+    Fields are lowercased once per user. Exact id and substring hits are
+    checked in Python; fuzzy scoring runs as one RapidFuzz batch per field
+    over the whole role instead of one partial_ratio call per user.
+    """
+    query = query.lower()
+    keys = [_match_keys(u) for u in users]
+    hits = {idx for idx, (uid, name, email) in enumerate(keys)
+            if uid == query or query in name or query in email}
+
+    if process is not None:
+        for column in (1, 2):
+            choices = [k[column] for k in keys]
+            for _, score, idx in process.extract(query, choices, scorer=fuzz.partial_ratio,
+                                                 score_cutoff=FUZZY_THRESHOLD, limit=None):
+                if score > FUZZY_THRESHOLD:
+                    hits.add(idx)
+
+    return sorted(hits)
+
+def find_matches(query: str, users: List[User]) -> List[User]:
+    """Return users matching ``query`` in their original order."""
+    return [users[idx] for idx in find_match_indices(query, users)]
+
 # =====================
 # Core Logic
 # =====================
-def delete_user_from_role(role_dir: Path, query: str) -> Optional[bool]:
+def delete_user_from_role(role_dir: Path, query: str, users: Optional[List[User]] = None) -> Optional[bool]:
+    """Interactively delete one match in ``role_dir``; ``users`` may be preloaded."""
     user_file = role_dir / DEFAULT_USER_FILE
     backup_file(user_file)
-    users = load_users(user_file)
+    if users is None:
+        users = load_users(user_file)
     if not users:
         return None
 
-    matches = [u for u in users if fuzzy_match(query, u)]
-    if not matches:
+    match_idx = find_match_indices(query, users)
+    if not match_idx:
         logger.info(f"No match in {role_dir.name}")
         return False
 
-    selected = matches[0]
-    if len(matches) > 1:
-        choices = [(str(idx), f"{u['name']} | {u['email']} | id:{u['id']}") for idx, u in enumerate(matches)]
+    selected_idx = match_idx[0]
+    if len(match_idx) > 1:
+        choices = [(str(pos), f"{users[i]['name']} | {users[i]['email']} | id:{users[i]['id']}")
+                   for pos, i in enumerate(match_idx)]
         result = radiolist_dialog(title=f"Delete user in {role_dir.name}",
                                   text="Multiple matches found. Choose one:",
                                   values=choices).run()
@@ -178,33 +263,53 @@ def delete_user_from_role(role_dir: Path, query: str) -> Optional[bool]:
             logger.info("Cancelled")
             print(YELLOW + "✗ Cancelled" + STYLE_RESET)
             return None
-        selected = matches[int(result)]
+        selected_idx = match_idx[int(result)]
 
+    selected = users[selected_idx]
     print(RED + f"→ Deleting: {selected['name']} | {selected['email']} (id:{selected['id']})" + STYLE_RESET)
     if not confirm_action(f"{RED}Confirm delete? [y/N]: {STYLE_RESET}"):
         logger.info("Deletion aborted")
         print(YELLOW + "✗ Aborted" + STYLE_RESET)
         return None
 
-    remaining = [u for u in users if u != selected]
-    for idx, user in enumerate(remaining, start=1):
-        if str(user.get("id", "")).isdigit():
-            user["id"] = str(idx)
+    # ``selected`` is a reference into ``users``: drop it by position rather
+    # than comparing every remaining dict against it. Remaining ids are kept
+    # as they are; new ids come from the global counter in stats.json.
+    remaining = users
+    remaining.pop(selected_idx)
 
     save_users(user_file, remaining)
     logger.info(f"Deleted {safe_user_info(selected)} from {role_dir.name}")
     print(GREEN + f"✔ Successfully deleted user from {role_dir.name}" + STYLE_RESET)
     return True
 
+@lru_cache(maxsize=None)
+def _existing_role_paths() -> Tuple[Tuple[str, Path], ...]:
+    """Default role folders present on disk, checked once per process.
+
+    Call ``_existing_role_paths.cache_clear()`` after creating a role folder.
+    """
+    return tuple((r, path) for r, path in _ROLE_PATHS.items() if path.is_dir())
+
 def delete_user(query: str, role: Optional[str] = None) -> None:
-    roles = [role] if role else list(DEFAULT_ROLES)
     deleted_roles: List[str] = []
-
-    for r in roles:
-        role_path = DATABASE_DIR / r
-        if not role_path.is_dir():
-            continue
-        result = delete_user_from_role(role_path, query)
+    if role:
+        path = _ROLE_PATHS.get(role) or DATABASE_DIR / role
+        role_paths = [(role, path)] if path.is_dir() else []
+    else:
+        role_paths = list(_existing_role_paths())
+
+    # Read every role file concurrently up front. Only the reads run in the
+    # event loop: the dialogs below start their own prompt_toolkit loops, so
+    # the interactive part stays synchronous and walks the roles in order.
+    user_files = [path / DEFAULT_USER_FILE for _, path in role_paths]
+    contents = asyncio.run(read_role_files(user_files)) if user_files else []
+
+    for (r, role_path), user_file, raw in zip(role_paths, user_files, contents):
+        # An empty read is a missing, empty, unreadable or timed-out file;
+        # load_users re-reads it and raises the precise error
+        users = parse_users(raw, user_file) if raw else load_users(user_file)
+        result = delete_user_from_role(role_path, query, users)
         if result:
             deleted_roles.append(r)
 
@@ -216,7 +321,7 @@ def delete_user(query: str, role: Optional[str] = None) -> None:
 # =====================
 # Main
 # =====================
-def main() -> None:
+def main(argv: Optional[List[str]] = None) -> None:
     try:
         display_title("Delete User")
     except Exception:
@@ -14,13 +14,17 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import bisect
 import json
 import logging
+import os
 import sys
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 # prompt_toolkit for interactive prompt
 from prompt_toolkit import prompt
@@ -39,6 +43,8 @@ except Exception:
     # Fallbacks if Utils.colors not available to avoid ImportError during tests
     BLACK = RED = GREEN = YELLOW = BLUE = MAGENTA = CYAN = WHITE = BRIGHT = STYLE_RESET = ""
     LRED = ""
+    WHITE_BRIGHT = ""
+    BORDER = "-" * 50
 
 try:
     from Utils.display_title import display_title
@@ -49,8 +55,48 @@ except Exception:
 # Optional fuzzy library
 try:
     from rapidfuzz import fuzz as rapidfuzz_fuzz  # type: ignore
+    from rapidfuzz import process as rapidfuzz_process  # type: ignore
 except Exception:
     rapidfuzz_fuzz = None  # type: ignore
+    rapidfuzz_process = None  # type: ignore
+
+# rapidfuzz.process.cdist returns a numpy matrix; without numpy fuzzy search
+# stays on the single-threaded process.extract path
+try:
+    import numpy as np  # type: ignore
+except ImportError:
+    np = None  # type: ignore
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib decoder
+    orjson = None
+
+# Optional kernel-async file reads (caio: io_uring / Linux AIO); without it
+# reads go through the default thread-pool executor
+try:
+    from aiofile import async_open  # type: ignore
+except ImportError:
+    async_open = None  # type: ignore
+
+# Optional typed decoder: parses and validates a whole users.json in one pass
+try:
+    import msgspec  # type: ignore
+except ImportError:
+    msgspec = None  # type: ignore
+
+# Optional compact trie for completer prefix lookups; without it the
+# completer bisects a sorted list
+try:
+    import marisa_trie  # type: ignore
+except ImportError:
+    marisa_trie = None  # type: ignore
+
+
+def _loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 # ----------------------
 # Constants / Config
@@ -60,6 +106,16 @@ DEFAULT_ROLES = ("Owner", "Developer", "Admin", "Member")
 DEFAULT_REQUIRED_FIELDS = frozenset({"id", "name", "email", "role"})
 DEFAULT_USER_LOAD_TIMEOUT = 3  # seconds per file
 DEFAULT_FUZZY_THRESHOLD = 75
+# Concurrent thread-pool file loads; matches the default executor's worker
+# count, so more would only queue. Kernel-queued (aiofile) reads are not throttled.
+EXECUTOR_READ_CONCURRENCY = min(32, (os.cpu_count() or 1) + 4)
+# Below this many users a multithreaded cdist costs more than it saves
+CDIST_MIN_CHOICES = 5000
+# Joins per-field values for substring scans; cannot occur in typed queries
+_HAYSTACK_SEP = "\x00"
+# Per-role user cache bounds
+DEFAULT_ROLE_CACHE_ENTRIES = 32
+DEFAULT_ROLE_CACHE_TTL = 3600.0  # seconds
 
 ROLE_COLORS: Dict[str, Tuple[str, str]] = {
     "Owner": (RED, WHITE),
@@ -108,13 +164,25 @@ class CriticalDataError(UserSearchError):
 # ----------------------
 # Models
 # ----------------------
+@lru_cache(maxsize=64)
+def _canonical_role(role: str) -> str:
+    return sys.intern(role.capitalize())
+
 @dataclass(frozen=True)
 class User:
+    # no per-instance __dict__; fields have no defaults so slots work pre-3.10
+    __slots__ = ("id", "name", "email", "role")
+
     id: str
     name: str
     email: str
     role: str
 
+    def __post_init__(self) -> None:
+        # Canonical, interned role so display lookups hit ROLE_COLORS directly;
+        # also runs for users built by the msgspec decoder
+        object.__setattr__(self, "role", _canonical_role(self.role))
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> Optional["User"]:
         """Return User if dict contains required fields, otherwise None."""
@@ -131,14 +199,122 @@ class User:
             role=str(data["role"])
         )
 
+# Strict decoder for well-formed files (all four fields present as strings);
+# anything it rejects goes through User.from_dict item by item
+_USER_LIST_DECODER = msgspec.json.Decoder(List[User]) if msgspec is not None else None
+
+def decode_users(raw: bytes) -> Optional[List[User]]:
+    """Decode a users.json payload straight into Users, or None if it needs the lenient path."""
+    if _USER_LIST_DECODER is None:
+        return None
+    try:
+        return _USER_LIST_DECODER.decode(raw)
+    except msgspec.DecodeError:  # includes ValidationError
+        return None
+
+@dataclass(frozen=True)
+class UserIndex:
+    """Users with their lowercased names and emails as parallel tuples."""
+    users: Tuple[User, ...]
+    names_lower: Tuple[str, ...]
+    emails_lower: Tuple[str, ...]
+
+    @classmethod
+    def build(cls, users: List[User]) -> "UserIndex":
+        return cls(
+            users=tuple(users),
+            names_lower=tuple(u.name.lower() for u in users),
+            emails_lower=tuple(u.email.lower() for u in users),
+        )
+
+    def field(self, name: str) -> Tuple[str, ...]:
+        """Lowercased values for 'name' or 'email'."""
+        return self.names_lower if name == "name" else self.emails_lower
+
+    @cached_property
+    def _shards(self) -> Dict[str, "UserIndex"]:
+        positions: Dict[str, List[int]] = {}
+        for i, u in enumerate(self.users):
+            positions.setdefault(u.role.lower(), []).append(i)
+        return {
+            role: UserIndex(
+                users=tuple(self.users[i] for i in idx),
+                names_lower=tuple(self.names_lower[i] for i in idx),
+                emails_lower=tuple(self.emails_lower[i] for i in idx),
+            )
+            for role, idx in positions.items()
+        }
+
+    def shard(self, role: Optional[str]) -> "UserIndex":
+        """Sub-index holding only users of role (case-insensitive); the full index when role is None."""
+        if not role:
+            return self
+        return self._shards.get(role.lower(), _EMPTY_INDEX)
+
+    @staticmethod
+    def _join(values: Tuple[str, ...]) -> Tuple[str, List[int]]:
+        starts = []
+        offset = 0
+        for value in values:
+            starts.append(offset)
+            offset += len(value) + 1
+        return _HAYSTACK_SEP.join(values), starts
+
+    @cached_property
+    def _names_haystack(self) -> Tuple[str, List[int]]:
+        return self._join(self.names_lower)
+
+    @cached_property
+    def _emails_haystack(self) -> Tuple[str, List[int]]:
+        return self._join(self.emails_lower)
+
+    def contains(self, name: str, needle: str) -> List[int]:
+        """Positions of users whose lowercased field contains needle, in order.
+
+        Scans one separator-joined string with str.find instead of testing each
+        value from Python, so the cost tracks the number of matches; needles hit
+        by a large share of users fall back to the per-value test.
+        """
+        blob, starts = self._names_haystack if name == "name" else self._emails_haystack
+        if _HAYSTACK_SEP in needle or blob.count(needle) * 8 > len(starts):
+            return [i for i, value in enumerate(self.field(name)) if needle in value]
+        found: List[int] = []
+        find = blob.find
+        pos = find(needle)
+        while pos != -1:
+            i = bisect.bisect_right(starts, pos) - 1
+            found.append(i)
+            if i + 1 >= len(starts):
+                break
+            pos = find(needle, starts[i + 1])
+        return found
+
+_EMPTY_INDEX = UserIndex(users=(), names_lower=(), emails_lower=())
+
 # ----------------------
 # Utilities
 # ----------------------
+def _render_role(role_clean: str, fg_color: str, bracket_color: str) -> str:
+    return f"{BRIGHT}{bracket_color}[{STYLE_RESET}{fg_color}{role_clean}{STYLE_RESET}{BRIGHT}{bracket_color}]{STYLE_RESET}"
+
+# Known roles are rendered once at import
+_ROLE_RENDER: Dict[str, str] = {
+    role: _render_role(role, fg, bracket) for role, (fg, bracket) in ROLE_COLORS.items()
+}
+
+@lru_cache(maxsize=8)
+def _colored_unknown_role(role_clean: str) -> str:
+    return _render_role(role_clean, WHITE, WHITE)
+
 def colored_role(role: str) -> str:
     """Return colorized role string for display (best-effort)."""
+    # User roles are canonicalized at load, so the first lookup usually hits
+    rendered = _ROLE_RENDER.get(role)
+    if rendered is not None:
+        return rendered
     role_clean = str(role).capitalize()
-    fg_color, bracket_color = ROLE_COLORS.get(role_clean, (WHITE, WHITE))
-    return f"{BRIGHT}{bracket_color}[{STYLE_RESET}{fg_color}{role_clean}{STYLE_RESET}{BRIGHT}{bracket_color}]{STYLE_RESET}"
+    rendered = _ROLE_RENDER.get(role_clean)
+    return rendered if rendered is not None else _colored_unknown_role(role_clean)
 
 def user_to_display(user: User) -> str:
     return f"ID: {user.id} | {colored_role(user.role)} {user.name} | Email: {user.email}"
@@ -152,15 +328,19 @@ def show_error(message: str, pause: float = 2.0) -> None:
     clear()
 
 def ensure_roles_exist(database_dir: Path, roles: Tuple[str, ...]) -> List[Path]:
-    """Check role directories exist; return list of existing role directory paths."""
-    existing = []
-    missing = []
-    for role in roles:
-        p = database_dir / role
-        if p.is_dir():
-            existing.append(p)
-        else:
-            missing.append(role)
+    """Check role directories exist; return list of existing role directory paths.
+
+    One ``os.scandir`` of ``database_dir`` answers for every role instead
+    of a separate stat per role folder.
+    """
+    wanted = set(roles)
+    try:
+        with os.scandir(database_dir) as entries:
+            present = {entry.name for entry in entries if entry.name in wanted and entry.is_dir()}
+    except OSError:
+        present = set()
+    existing = [database_dir / role for role in roles if role in present]
+    missing = [role for role in roles if role not in present]
     if missing:
         logger.warning(f"Missing role directories: {missing}")
     return existing
@@ -184,6 +364,13 @@ class UserLoader:
         Timeout in seconds for reading each file.
     escalate_on_missing: bool
         If True, treat missing files/folders as critical and raise CriticalDataError.
+    max_entries: int
+        Maximum number of role files kept in the per-role LRU cache.
+    ttl_seconds: float
+        Age after which a cached role file is reloaded from disk.
+    read_concurrency: Optional[int]
+        Maximum concurrent file reads. Defaults to no limit with aiofile and
+        EXECUTOR_READ_CONCURRENCY otherwise.
     """
 
     def __init__(
@@ -193,28 +380,57 @@ class UserLoader:
         users_file: str = DEFAULT_USER_FILE,
         timeout: int = DEFAULT_USER_LOAD_TIMEOUT,
         escalate_on_missing: bool = False,
+        max_entries: int = DEFAULT_ROLE_CACHE_ENTRIES,
+        ttl_seconds: float = DEFAULT_ROLE_CACHE_TTL,
+        read_concurrency: Optional[int] = None,
     ) -> None:
         self.database_dir = database_dir
         self.roles = roles
         self.users_file = users_file
         self.timeout = timeout
         self.escalate_on_missing = escalate_on_missing
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        # (role, users_file) -> (monotonic load time, users), least recently used first
+        self._role_cache: "OrderedDict[Tuple[str, str], Tuple[float, List[User]]]" = OrderedDict()
         self._cached_users: List[User] = []
-        self._load_semaphore = asyncio.Semaphore(8)  # limit concurrency for disk IO
+        self._index: Optional[UserIndex] = None
+        # (path, reason) for files that failed during the current load
+        self._errors: List[Tuple[Path, str]] = []
+        # limit concurrency for thread-pool disk IO; the kernel schedules aiofile reads
+        if read_concurrency is None and async_open is None:
+            read_concurrency = EXECUTOR_READ_CONCURRENCY
+        self._load_semaphore: Optional[asyncio.Semaphore] = (
+            asyncio.Semaphore(read_concurrency) if read_concurrency else None
+        )
 
-    async def _read_path_text(self, path: Path) -> str:
+    async def _read_path_bytes(self, path: Path) -> bytes:
+        if async_open is not None:
+            async with async_open(path, "rb") as f:
+                return await f.read()
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, path.read_text, "utf-8")
+        return await loop.run_in_executor(None, path.read_bytes)
 
-    async def _load_file(self, path: Path) -> List[User]:
-        """Attempt to read and parse a users.json file, returning validated Users."""
+    async def _load_file(self, path: Path) -> Optional[List[User]]:
+        """Attempt to read and parse a users.json file, returning validated Users.
+
+        Returns None when the file could not be read or parsed so the failure
+        is not cached.
+        """
+        if self._load_semaphore is None:
+            return await self._read_users(path)
         async with self._load_semaphore:
-            try:
-                content = await asyncio.wait_for(self._read_path_text(path), timeout=self.timeout)
-                data = json.loads(content)
+            return await self._read_users(path)
+
+    async def _read_users(self, path: Path) -> Optional[List[User]]:
+        try:
+            content = await asyncio.wait_for(self._read_path_bytes(path), timeout=self.timeout)
+            users = decode_users(content)
+            if users is None:
+                data = _loads(content)
                 if not isinstance(data, list):
                     logger.warning(f"Unexpected format in {path}: expected list, got {type(data)}")
-                    return []
+                    return None
                 users = []
                 for item in data:
                     user = User.from_dict(item)
@@ -222,32 +438,50 @@ class UserLoader:
                         users.append(user)
                     else:
                         logger.debug(f"Ignored invalid user entry in {path}")
-                logger.info(f"Loaded {len(users)} valid users from {path}")
-                return users
-            except asyncio.TimeoutError:
-                logger.warning(f"Timeout loading file: {path}")
-                # Not critical; return empty and inform user
-                show_error(f"Timeout while loading {path.parent.name}/{self.users_file}")
-            except json.JSONDecodeError:
-                logger.warning(f"Corrupt JSON in file: {path}")
-                show_error(f"Corrupt JSON in {path.parent.name}/{self.users_file}")
-            except Exception as exc:
-                logger.exception(f"Unexpected error loading {path}: {exc}")
-                # escalate if requested
-                if self.escalate_on_missing:
-                    raise CriticalDataError(f"Failed to load {path}: {exc}") from exc
-                show_error(f"Failed to load {path.parent.name}/{self.users_file}: {exc}")
-            return []
+            logger.info(f"Loaded {len(users)} valid users from {path}")
+            return users
+        # Not critical; log, record and report once from load_all_users so a
+        # bad file never blocks the other concurrent loads
+        except asyncio.TimeoutError:
+            logger.warning(f"Timeout loading file: {path}")
+            self._errors.append((path, "timeout"))
+        except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses it
+            logger.warning(f"Corrupt JSON in file: {path}")
+            self._errors.append((path, "corrupt JSON"))
+        except Exception as exc:
+            logger.exception(f"Unexpected error loading {path}: {exc}")
+            # escalate if requested
+            if self.escalate_on_missing:
+                raise CriticalDataError(f"Failed to load {path}: {exc}") from exc
+            self._errors.append((path, str(exc)))
+        return None
+
+    def _cache_get(self, key: Tuple[str, str]) -> Optional[List[User]]:
+        entry = self._role_cache.get(key)
+        if entry is None:
+            return None
+        loaded_at, users = entry
+        if time.monotonic() - loaded_at >= self.ttl_seconds:
+            del self._role_cache[key]
+            return None
+        self._role_cache.move_to_end(key)
+        return users
+
+    def _cache_put(self, key: Tuple[str, str], users: List[User]) -> None:
+        self._role_cache[key] = (time.monotonic(), users)
+        self._role_cache.move_to_end(key)
+        while len(self._role_cache) > self.max_entries:
+            self._role_cache.popitem(last=False)
 
     async def load_all_users(self, refresh: bool = False) -> List[User]:
         """
-        Load users from all roles asynchronously and cache result.
+        Load users from all roles asynchronously and cache result per role.
 
-        If refresh is True, clears cache and reloads from disk.
+        Roles with a fresh cache entry are served from memory; only the rest
+        are read from disk. If refresh is True, every role is reloaded.
         """
-        if self._cached_users and not refresh:
-            logger.debug("Returning cached users")
-            return list(self._cached_users)
+        if refresh:
+            self._role_cache.clear()
 
         role_dirs = ensure_roles_exist(self.database_dir, self.roles)
         if not role_dirs:
@@ -258,11 +492,18 @@ class UserLoader:
             show_error(msg)
             return []
 
-        tasks = []
+        parts: List[Optional[List[User]]] = []
+        misses: List[Tuple[int, Tuple[str, str], Path]] = []
         for role_dir in role_dirs:
+            key = (role_dir.name, self.users_file)
+            cached = self._cache_get(key)
+            if cached is not None:
+                parts.append(cached)
+                continue
             file_path = role_dir / self.users_file
             if file_path.is_file():
-                tasks.append(self._load_file(file_path))
+                misses.append((len(parts), key, file_path))
+                parts.append(None)
             else:
                 logger.info(f"Missing users file at {file_path}; skipping.")
                 if self.escalate_on_missing:
@@ -270,18 +511,49 @@ class UserLoader:
                     raise CriticalDataError(f"Missing required file: {file_path}")
                 # else: continue without raising
 
-        results = await asyncio.gather(*tasks, return_exceptions=False)
-        users: List[User] = []
-        for res in results:
-            users.extend(res)
+        self._errors = []
+        results = await asyncio.gather(
+            *(self._load_file(path) for _, _, path in misses), return_exceptions=False
+        )
+        if self._errors:
+            details = "; ".join(f"{p.parent.name}/{self.users_file}: {reason}" for p, reason in self._errors)
+            show_error(f"Failed to load {len(self._errors)} file(s): {details}")
+        for (slot, key, _), res in zip(misses, results):
+            if res is not None:
+                self._cache_put(key, res)
+            parts[slot] = res
 
-        self._cached_users = users
-        logger.info(f"Loaded total {len(users)} users from {len(results)} files")
+        users: List[User] = []
+        for res in parts:
+            if res:
+                users.extend(res)
+
+        if misses or self._index is None or len(users) != len(self._cached_users):
+            self._cached_users = users
+            self._index = UserIndex.build(users)
+        logger.info(f"Loaded total {len(users)} users ({len(misses)} role files read from disk)")
         return list(users)
 
+    def indexed(self) -> UserIndex:
+        """Lowercased field index of the cached users, built once per load."""
+        if self._index is None:
+            self._index = UserIndex.build(self._cached_users)
+        return self._index
+
+    def invalidate(self, prefix: str) -> int:
+        """Drop cached role files whose role name starts with prefix; returns how many."""
+        stale = [key for key in self._role_cache if key[0].startswith(prefix)]
+        for key in stale:
+            del self._role_cache[key]
+        if stale:
+            self._index = None
+        return len(stale)
+
     def clear_cache(self) -> None:
         """Clear internal cache to force reload on next call."""
-        self._cached_users.clear()
+        self._role_cache.clear()
+        self._cached_users = []
+        self._index = None
 
 # ----------------------
 # Searcher
@@ -291,34 +563,70 @@ class UserSearcher:
     Search through User objects by field with optional fuzzy support.
     """
 
-    def __init__(self, users: List[User], use_fuzzy: bool = False, threshold: int = DEFAULT_FUZZY_THRESHOLD) -> None:
-        self.users = users
+    def __init__(
+        self,
+        users: List[User],
+        use_fuzzy: bool = False,
+        threshold: int = DEFAULT_FUZZY_THRESHOLD,
+        index: Optional[UserIndex] = None,
+    ) -> None:
+        # A shared index (e.g. UserLoader.indexed()) avoids re-lowercasing every user
+        self._index = index if index is not None else UserIndex.build(users)
+        self.users = self._index.users
         self.use_fuzzy = use_fuzzy and (rapidfuzz_fuzz is not None)
         if use_fuzzy and rapidfuzz_fuzz is None:
             # fallback notice — prefer logger for non-interactive consumers
             print("Warning: rapidfuzz not installed; fuzzy search disabled.")
             logger.info("Fuzzy requested but rapidfuzz not available; disabled.")
         self.threshold = int(threshold)
+        # Pick the matcher once; search() only validates and dispatches
+        self._match = self._fuzzy_search if self.use_fuzzy else self._simple_search
+        # (index, field, query, positions) of the last substring search
+        self._last: Optional[Tuple[UserIndex, str, str, List[int]]] = None
 
-    def _simple_search(self, query: str, field_getter) -> List[User]:
+    def _simple_search(self, query: str, field: str, index: UserIndex) -> List[User]:
         q = query.lower()
-        return [u for u in self.users if q in field_getter(u)]
+        last = self._last
+        if last is not None and last[0] is index and last[1] == field and last[2] in q:
+            # anything containing q also contains the previous query
+            values = index.field(field)
+            positions = [i for i in last[3] if q in values[i]]
+        else:
+            positions = index.contains(field, q)
+        self._last = (index, field, q, positions)
+        users = index.users
+        return [users[i] for i in positions]
+
+    def _fuzzy_search(self, query: str, field: str, index: UserIndex) -> List[User]:
+        # partial_ratio for substring-like fuzzy matches, scored over the whole
+        # choice list in one rapidfuzz call; results come back best first
+        users = index.users
+        choices = index.field(field)
+        if np is not None and len(choices) >= CDIST_MIN_CHOICES:
+            # score on all cores; cutoff pairs come back as 0
+            scores = rapidfuzz_process.cdist(
+                [query.lower()],
+                choices,
+                scorer=rapidfuzz_fuzz.partial_ratio,
+                score_cutoff=self.threshold,
+                workers=-1,
+            ).ravel()
+            order = np.argsort(-scores, kind="stable")
+            return [users[i] for i in order[scores[order] >= self.threshold]]
+        matches = rapidfuzz_process.extract(
+            query.lower(),
+            choices,
+            scorer=rapidfuzz_fuzz.partial_ratio,
+            score_cutoff=self.threshold,
+            limit=None,
+        )
+        return [users[idx] for _, _, idx in matches]
 
-    def _fuzzy_search(self, query: str, field_getter) -> List[User]:
-        # use partial_ratio for substring-like fuzzy matches
-        scored: List[Tuple[int, User]] = []
-        q = query.lower()
-        for u in self.users:
-            value = field_getter(u)
-            # rapidfuzz expects str inputs; partial_ratio returns 0-100
-            score = rapidfuzz_fuzz.partial_ratio(q, value)
-            if score >= self.threshold:
-                scored.append((score, u))
-        scored.sort(key=lambda x: x[0], reverse=True)
-        return [user for _, user in scored]
-
-    def search(self, query: str, field: str) -> List[User]:
-        """Search users by 'name' or 'email'. Returns list of User objects."""
+    def search(self, query: str, field: str, role_filter: Optional[str] = None) -> List[User]:
+        """Search users by 'name' or 'email'. Returns list of User objects.
+
+        With role_filter set only that role's users are scanned.
+        """
         if not query or not query.strip():
             return []
 
@@ -326,17 +634,7 @@ class UserSearcher:
         if field not in {"name", "email"}:
             raise ValueError("field must be 'name' or 'email'")
 
-        # Precompute field getter to avoid repeated getattr/str calls
-        if field == "name":
-            getter = lambda u: u.name.lower()
-        else:
-            getter = lambda u: u.email.lower()
-
-        # Choose algorithm
-        if self.use_fuzzy:
-            return self._fuzzy_search(query, getter)
-        else:
-            return self._simple_search(query, getter)
+        return self._match(query, field, self._index.shard(role_filter))
 
 # ----------------------
 # Completer
@@ -344,18 +642,49 @@ class UserSearcher:
 class RoleNameCompleter(Completer):
     """
     Efficient completer that suggests based on name and email.
-    Filters using simple startswith on lowercase cached values for snappy UX.
+    Looks prefixes up in a marisa-trie when installed, otherwise binary-searches
+    a sorted copy of the lowercase values, for snappy UX.
     """
 
-    def __init__(self, users: List[User], mode: str) -> None:
+    def __init__(
+        self,
+        users: List[User],
+        mode: str,
+        index: Optional[UserIndex] = None,
+        role_filter: Optional[str] = None,
+    ) -> None:
         self.mode = mode.lower()
         assert self.mode in {"name", "email"}
-        # prepare tuple list for faster iteration: (field_value_lower, display_text, insert_text)
-        self._candidates: List[Tuple[str, str, str]] = []
-        for u in users:
-            field_val = u.name if self.mode == "name" else u.email
-            display = f"[{u.role}] {u.name} <{u.email}>"
-            self._candidates.append((field_val.lower(), display, field_val))
+        # Sort the shared lowercase values once so each keystroke is a bisect;
+        # display strings are only built for the few candidates actually yielded
+        index = (index if index is not None else UserIndex.build(users)).shard(role_filter)
+        values = index.field(self.mode)
+        order = sorted(range(len(values)), key=values.__getitem__)
+        keys = [values[i] for i in order]
+        self._users: List[User] = [index.users[i] for i in order]
+        self._trie = None
+        self._slots: List[List[int]] = []
+        if marisa_trie is not None:
+            # one trie node per distinct value; slots map key ids to user positions
+            self._trie = marisa_trie.Trie(keys)
+            self._slots = [[] for _ in range(len(self._trie))]
+            for pos, key in enumerate(keys):
+                self._slots[self._trie[key]].append(pos)
+            keys = []
+        self._keys: List[str] = keys
+
+    def _prefix_positions(self, text: str) -> Iterator[int]:
+        if self._trie is not None:
+            trie, slots = self._trie, self._slots
+            for key in trie.iterkeys(text):
+                yield from slots[trie[key]]
+            return
+        # matches form a contiguous run starting at the bisect point
+        keys = self._keys
+        i = bisect.bisect_left(keys, text)
+        while i < len(keys) and keys[i].startswith(text):
+            yield i
+            i += 1
 
     def get_completions(self, document, complete_event):
         text = document.text_before_cursor.lower()
@@ -363,13 +692,12 @@ class RoleNameCompleter(Completer):
             return  # avoid flooding suggestions when empty
 
         # yield candidates whose field startswith the typed text, up to 20 suggestions
-        count = 0
-        for val_lower, display, insert in self._candidates:
-            if val_lower.startswith(text):
-                yield Completion(insert, start_position=-len(text), display=display)
-                count += 1
-                if count >= 20:
-                    break
+        by_name = self.mode == "name"
+        for _, pos in zip(range(20), self._prefix_positions(text)):
+            u = self._users[pos]
+            insert = u.name if by_name else u.email
+            display = f"[{u.role}] {u.name} <{u.email}>"
+            yield Completion(insert, start_position=-len(text), display=display)
 
 # ----------------------
 # Logging helper
@@ -386,11 +714,11 @@ def log_action(mode: str, query: str, result_count: int, enable_logging: bool) -
 # ----------------------
 # Display results
 # ----------------------
+_NO_MATCHES = f"{WHITE_BRIGHT}\n{'-' * 50}\n{LRED}No matches found.\n{BORDER}\n"
+
 def display_results(results: List[User]) -> None:
     if not results:
-        print(WHITE + BRIGHT + "\n" + "-" * 50)
-        print(LRED + "No matches found.")
-        print(WHITE + BRIGHT + "-" * 50 + "\n")
+        print(_NO_MATCHES)
         time.sleep(1.2)
         return
     print(f"\nFound {len(results)} user(s):\n")
@@ -446,8 +774,10 @@ async def main_async(args: argparse.Namespace) -> None:
         event.app.exit()
 
     # Prepare searcher/completer before loop; can refresh users dynamically if needed
-    searcher = UserSearcher(users, use_fuzzy=fuzzy_search_flag, threshold=fuzzy_threshold)
-    completer = RoleNameCompleter(users, mode)
+    index = user_loader.indexed()
+    role_filter = args.role or None
+    searcher = UserSearcher(users, use_fuzzy=fuzzy_search_flag, threshold=fuzzy_threshold, index=index)
+    completer = RoleNameCompleter(users, mode, index=index, role_filter=role_filter)
 
     while True:
         try:
@@ -463,7 +793,7 @@ async def main_async(args: argparse.Namespace) -> None:
 
         results = []
         try:
-            results = searcher.search(query, mode)
+            results = searcher.search(query, mode, role_filter=role_filter)
         except Exception as exc:
             logger.exception(f"Search error: {exc}")
             show_error(f"Search error: {exc}")
@@ -485,65 +815,29 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
                         help=f"Fuzzy match threshold (0-100). Default {DEFAULT_FUZZY_THRESHOLD}.")
     parser.add_argument("--users-file", default=DEFAULT_USER_FILE, help="Name of users file in each role folder.")
     parser.add_argument("--roles", nargs="+", help="Custom role folder names to scan (overrides defaults).")
+    parser.add_argument("--role", help="Only search and suggest users with this role.")
     parser.add_argument("--load-timeout", default=DEFAULT_USER_LOAD_TIMEOUT, type=int, help="Timeout (seconds) per file load.")
     parser.add_argument("--escalate-on-missing", action="store_true", help="Raise CriticalDataError on missing files/dirs.")
     parser.add_argument("--refresh-cache", action="store_true", help="Force reload users from disk.")
     return parser.parse_args(argv)
 
 def run_tests() -> None:
+    """Run tests/test_search.py (the suite lives with the other tests)."""
     import unittest
 
-    class SearchUsersTest(unittest.TestCase):
-        def setUp(self):
-            self.sample_users = [
-                User(id="001", name="LloydLewis", email="lloyd@example.com", role="Owner"),
-                User(id="002", name="Jixel", email="jixel@dev.com", role="Developer"),
-            ]
-
-        def test_simple_search(self):
-            searcher = UserSearcher(self.sample_users)
-            results = searcher.search("lloyd", "name")
-            self.assertEqual(len(results), 1)
-            self.assertEqual(results[0].name, "LloydLewis")
-
-        def test_fuzzy_search(self):
-            if rapidfuzz_fuzz is None:
-                self.skipTest("rapidfuzz not installed")
-            searcher = UserSearcher(self.sample_users, use_fuzzy=True)
-            results = searcher.search("Loyd", "name")
-            self.assertTrue(any(u.name == "LloydLewis" for u in results))
-
-        def test_no_results(self):
-            searcher = UserSearcher(self.sample_users)
-            results = searcher.search("xyz", "name")
-            self.assertEqual(len(results), 0)
-
-        def test_empty_query(self):
-            searcher = UserSearcher(self.sample_users)
-            results = searcher.search("", "name")
-            self.assertEqual(len(results), 0)
-
-    class LoaderTest(unittest.IsolatedAsyncioTestCase):
-        async def test_load_users_handles_missing_files(self):
-            import tempfile
-            from pathlib import Path as P
-            with tempfile.TemporaryDirectory() as tmpdir:
-                tmp = P(tmpdir)
-                loader = UserLoader(tmp, roles=tuple(["NoRole1", "NoRole2"]), users_file="users.json")
-                users = await loader.load_all_users()
-                self.assertIsInstance(users, list)
-                self.assertEqual(len(users), 0)
-
-    unittest.main(argv=['first-arg-is-ignored'], exit=False)
+    tests_dir = Path(__file__).resolve().parent.parent / "tests"
+    suite = unittest.defaultTestLoader.discover(str(tests_dir), pattern="test_search.py",
+                                                top_level_dir=str(tests_dir))
+    unittest.TextTestRunner().run(suite)
 
 # ----------------------
 # Entrypoint
 # ----------------------
-if __name__ == "__main__":
-    args = parse_args()
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
     if args.test:
         run_tests()
-        sys.exit(0)
+        return 0
 
     # Run main async loop with basic top-level error handling
     try:
@@ -557,8 +851,13 @@ if __name__ == "__main__":
         asyncio.get_event_loop().run_until_complete(main_async(args))
     except CriticalDataError as cde:
         show_error(f"Critical error: {cde}")
-        sys.exit(2)
+        return 2
     except Exception as exc:
         logger.exception(f"Unhandled exception in main: {exc}")
         show_error(f"Unhandled error: {exc}")
-        sys.exit(1)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
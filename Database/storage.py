@@ -4,12 +4,142 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+import mmap
+import os
+import shutil
+import stat
+import tempfile
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Protocol
+from typing import Any, Dict, Iterator, List, Optional, Protocol, Tuple
 
 from Handler.config_loader import Config
 
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib encoder/decoder
+    orjson = None
+
+try:
+    import simdjson  # pysimdjson
+except ImportError:  # optional: large files then go through orjson
+    simdjson = None
+
+# Role files at least this large are parsed straight from a read-only mmap
+MMAP_PARSE_THRESHOLD = 4 * 1024 * 1024
+
+
+def _dumps(data: Any, indent: bool = False) -> bytes:
+    # Role files are written compact; indent only for small human-read files
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option)
+    if indent:
+        return json.dumps(data, indent=4, ensure_ascii=False).encode("utf-8")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _loads_mapped(path: Path) -> Any:
+    """Parse a large JSON file from a read-only mmap without copying it into bytes."""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        view = memoryview(mm)
+        try:
+            if simdjson is not None:
+                # a Parser is not thread-safe, and export loads roles from a pool
+                return simdjson.Parser().parse(view, recursive=True)
+            return orjson.loads(view)
+        finally:
+            view.release()
+
+
+_O_CLOEXEC = getattr(os, "O_CLOEXEC", 0)
+_O_BINARY = getattr(os, "O_BINARY", 0)
+
+
+def read_file_bytes(path: Path) -> bytes:
+    """Read a whole file with one fstat and (usually) a single read syscall."""
+    fd = os.open(path, os.O_RDONLY | _O_CLOEXEC | _O_BINARY)
+    try:
+        size = os.fstat(fd).st_size
+        # One extra byte detects a file that grew since fstat
+        data = os.read(fd, size + 1)
+        if len(data) <= size:
+            return data
+        chunks = [data]
+        while True:
+            chunk = os.read(fd, 1 << 16)
+            if not chunk:
+                return b"".join(chunks)
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+
+
+def write_file_bytes(path: Path, data: bytes, durable: bool = False) -> None:
+    """Create or truncate ``path`` and write ``data`` with raw os.write calls."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_CLOEXEC | _O_BINARY, 0o644)
+    try:
+        _write_all(fd, data)
+        if durable:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def fsync_path(path: Path) -> None:
+    """Flush ``path`` (a file, or a directory's entries on POSIX) to disk."""
+    try:
+        fd = os.open(path, os.O_RDONLY | _O_CLOEXEC | _O_BINARY)
+    except (IsADirectoryError, PermissionError):
+        return  # directories cannot be opened for fsync on Windows
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def atomic_write_bytes(path: Path, data: bytes, durable: bool = False) -> None:
+    """Replace ``path`` with ``data`` via a uniquely named sibling temp file.
+
+    The temp file lives in the target directory so ``os.replace`` is a plain
+    rename on the same filesystem. ``durable=True`` adds an fsync first.
+    """
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    try:
+        try:
+            _write_all(fd, data)
+            if durable:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        # mkstemp creates 0600; keep the target's mode, 0644 for a new file
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            mode = 0o644
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
 
 class StorageAdapter(Protocol):
     """Interface for loading and persisting role user data."""
@@ -26,39 +156,125 @@ class StorageAdapter(Protocol):
         """Write aggregate statistics."""
 
 
+def _link_backup(path: Path) -> Optional[Path]:
+    """Hard-link ``path`` to a sibling backup (copy if links are unsupported); None if missing."""
+    backup = path.with_name(f"{path.name}.{os.getpid()}.bak")
+    try:
+        backup.unlink(missing_ok=True)
+        os.link(path, backup)
+    except FileNotFoundError:
+        return None
+    except OSError:
+        if not path.exists():
+            return None
+        shutil.copy2(path, backup)
+    return backup
+
+
 @dataclass
 class JsonStorageAdapter:
     """JSON file-backed implementation of :class:`StorageAdapter`."""
 
     config: Config
+    _batching: bool = field(default=False, init=False, repr=False)
+    _staged: List[Tuple[Path, Path]] = field(default_factory=list, init=False, repr=False)
 
     def _role_dir(self, role: str) -> Path:
         return self.config.database_dir / role
 
+    def _stage(self, target: Path, payload: bytes) -> None:
+        # Staged next to its target, so the swap is a same-filesystem rename
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=target.name + ".", suffix=".tmp")
+        self._staged.append((Path(tmp), target))
+        try:
+            _write_all(fd, payload)
+        finally:
+            os.close(fd)
+
+    @contextmanager
+    def batch(self) -> Iterator["JsonStorageAdapter"]:
+        """
+        Stage role writes and move them into place together on success.
+
+        Inside the block ``write_role_users`` and ``update_stats`` write each
+        file to a temp file in its target's directory. On a clean exit every
+        staged file is renamed over its target in one tight loop; on error
+        nothing is swapped in and the temp files are discarded. With
+        ``durable_writes`` the staged files are flushed together right before
+        the renames, and each target directory once after them.
+
+        The swap is not atomic across files. Each target is hard-linked to a
+        backup first, and if a rename fails the files already replaced are put
+        back (best effort) before the error propagates.
+        """
+        self._batching = True
+        self._staged = []
+        try:
+            yield self
+            durable = self.config.durable_writes
+            if durable:
+                for staged, _ in self._staged:
+                    fsync_path(staged)
+            # (target, backup or None if the target did not exist), in swap order
+            swapped: List[Tuple[Path, Optional[Path]]] = []
+            try:
+                for staged, target in self._staged:
+                    swapped.append((target, _link_backup(target)))
+                    os.replace(staged, target)
+            except BaseException:
+                for target, backup in reversed(swapped):
+                    if backup is not None:
+                        os.replace(backup, target)
+                    else:
+                        target.unlink(missing_ok=True)
+                raise
+            for _, backup in swapped:
+                if backup is not None:
+                    backup.unlink(missing_ok=True)
+            if durable:
+                for directory in {target.parent for _, target in self._staged}:
+                    fsync_path(directory)
+        finally:
+            for staged, _ in self._staged:
+                staged.unlink(missing_ok=True)
+            self._batching = False
+            self._staged = []
+
     def load_role_users(self, role: str, users_file: str) -> List[Dict[str, Any]]:
         path = self._role_dir(role) / users_file
-        if not path.exists():
+        try:
+            size = path.stat().st_size
+        except FileNotFoundError:
             return []
 
-        content = path.read_text(encoding="utf-8")
         try:
-            data = json.loads(content)
-        except json.JSONDecodeError as exc:
+            if size >= MMAP_PARSE_THRESHOLD and (simdjson is not None or orjson is not None):
+                data = _loads_mapped(path)
+            else:
+                data = _loads(read_file_bytes(path))
+        except ValueError as exc:
             raise ValueError(f"Invalid JSON in {path}: {exc}") from exc
 
-        if not isinstance(data, list):
+        # JSON decoders only produce concrete lists, so an exact type check suffices
+        if type(data) is not list:
             raise ValueError(f"Unexpected content in {path}: expected a list of users")
         return data
 
     def write_role_users(self, role: str, users: List[Dict[str, Any]], users_file: str) -> None:
+        if self._batching:
+            self._stage(self._role_dir(role) / users_file, _dumps(users))
+            return
+
         role_path = self._role_dir(role)
         role_path.mkdir(parents=True, exist_ok=True)
-        path = role_path / users_file
-        tmp = path.with_suffix(path.suffix + ".tmp")
-        tmp.write_text(json.dumps(users, indent=4, ensure_ascii=False), encoding="utf-8")
-        tmp.replace(path)
+        atomic_write_bytes(role_path / users_file, _dumps(users), durable=self.config.durable_writes)
 
     def update_stats(self, total_users: int) -> None:
+        payload = _dumps({"User_Count": total_users}, indent=True)
+        if self._batching:
+            self._stage(self.config.stats_file, payload)
+            return
+
         self.config.stats_file.parent.mkdir(parents=True, exist_ok=True)
-        payload = {"User_Count": total_users}
-        self.config.stats_file.write_text(json.dumps(payload, indent=4), encoding="utf-8")
+        self.config.stats_file.write_bytes(payload)
@@ -23,13 +23,15 @@ import sys
 import os
 import io
 import json
+import mmap
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Iterable, Iterator, List, Dict, Optional, Set, Tuple
 
 from prompt_toolkit import prompt
-from prompt_toolkit.completion import WordCompleter, FuzzyCompleter
+from prompt_toolkit.completion import Completer, Completion, WordCompleter, FuzzyCompleter
 from prompt_toolkit.styles import Style as PTStyle
 from prompt_toolkit.key_binding import KeyBindings
 from prompt_toolkit.layout import Layout, HSplit
@@ -37,12 +39,30 @@ from prompt_toolkit.widgets import TextArea, Frame
 from prompt_toolkit.application import Application
 from prompt_toolkit.clipboard import ClipboardData
 
+try:
+    import ijson  # streaming parser; picks the fastest backend (yajl2_c) available
+except ImportError:  # optional: fall back to json.load
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib encoder/decoder
+    orjson = None
+
+try:
+    from rapidfuzz import fuzz, process, utils as fuzz_utils
+except ImportError:  # optional: fall back to prompt_toolkit's FuzzyCompleter
+    process = None
+
+_JSON_ERRORS = (json.JSONDecodeError,) + ((ijson.JSONError,) if ijson is not None else ())
+
 # ----- Config & Paths -----
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
 from Utils.colors import *
 from Utils.display_title import *
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 try:
     from Handler.path_handler import DATABASE_DIR  # type: ignore
     DATABASE_DIR = Path(DATABASE_DIR)
@@ -55,6 +75,17 @@ REQUIRED_FIELDS = {"id", "name", "email", "role"}
 ENABLE_LOGGING = True
 LOG_DIR = DATABASE_DIR / "Logs"
 LOG_FILE = LOG_DIR / "edit_user.log"
+# Append-only edit log; folded into the role files at startup, on exit and
+# whenever it grows past WAL_COMPACT_BYTES
+WAL_FILE = LOG_DIR / "edits.wal"
+WAL_COMPACT_BYTES = 1 << 20
+# Role files at least this large are rewritten record by record during
+# compaction (needs ijson) instead of being loaded whole
+STREAM_REWRITE_BYTES = 8 << 20
+# Role files larger than this are parsed straight from a read-only mmap
+MMAP_PARSE_BYTES = 1 << 20
+# Records shorter than this are edited inline instead of in a full-screen app
+INLINE_EDIT_CHARS = 4096
 
 style = PTStyle.from_dict({
     'completion-menu': 'bg:#222222',
@@ -84,40 +115,83 @@ def show_error(message: str) -> None:
     Display an error message with a highlighted border and pause for 2 seconds.
     Clears the terminal after showing error to reset UX.
     """
-    print(WHITE+BRIGHT+"\n" + "-"*50)
-    print(LRED+f"Error: {message}")
-    print(WHITE+BRIGHT+"-"*50 + "\n")
+    print(ERROR_TEMPLATE.format(msg=message))
     time.sleep(2)
     try:
-        os.system('cls' if os.name == 'nt' else 'clear')
+        clear_screen()
     except Exception:
         pass
 
 
-def atomic_save(path: Path, content: str) -> None:
-    """
-    Save file atomically to prevent corruption:
-    - Write to a temporary file first
-    - Flush and fsync to ensure data is on disk
-    - Replace original file safely, handling existing file conflicts
-    """
-    tmp = path.with_suffix(path.suffix + '.tmp')
+def _fsync_dir(directory: Path) -> None:
+    if not hasattr(os, 'O_DIRECTORY'):
+        return  # Windows: directories cannot be fsynced
     try:
-        tmp.parent.mkdir(parents=True, exist_ok=True)
-        with io.open(tmp, 'w', encoding='utf-8', errors='strict') as f:
-            f.write(content)
-            f.flush()
-            os.fsync(f.fileno())
-        try:
-            tmp.replace(path)
-        except Exception:
-            if path.exists():
-                path.unlink()
-            tmp.rename(path)
-    except Exception as e:
-        raise e
+        dfd = os.open(str(directory), os.O_DIRECTORY)
+    except OSError:
+        return
+    try:
+        os.fsync(dfd)
+    except OSError:
+        pass  # some filesystems do not support directory fsync
+    finally:
+        os.close(dfd)
 
 # ----- Database -----
+# path -> ((st_mtime_ns, st_size), parsed list) of role files as last read or written
+_user_cache: Dict[Path, Tuple[Tuple[int, int], list]] = {}
+
+
+def _orjson_loads_mapped(path: Path):
+    # orjson reads the page-cache backed view directly, no bytes copy of the file
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        view = memoryview(mm)
+        try:
+            return orjson.loads(view)
+        finally:
+            view.release()
+
+
+def _parse_users_file(path: Path, size: int = 0) -> list:
+    # The whole list is cached anyway, so one orjson pass over the bytes beats
+    # streaming; ijson and json.load remain fallbacks
+    if orjson is not None:
+        # JSONDecodeError subclasses json's
+        if size > MMAP_PARSE_BYTES:
+            data = _orjson_loads_mapped(path)
+        else:
+            data = orjson.loads(path.read_bytes())
+        return data if isinstance(data, list) else []
+    if ijson is not None:
+        # Streaming parse, one record at a time
+        with path.open('rb') as f:
+            return list(ijson.items(f, 'item', use_float=True))
+    with path.open('r', encoding='utf-8') as f:
+        data = json.load(f)
+    return data if isinstance(data, list) else []
+
+
+def _load_json_cached(path: Path) -> list:
+    """
+    Parsed contents of a role file, re-read only when its mtime or size changed.
+    Callers must not mutate the returned list. Raises FileNotFoundError if missing.
+    """
+    st = path.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    hit = _user_cache.get(path)
+    if hit is not None and hit[0] == key:
+        return hit[1]
+    data = _parse_users_file(path, st.st_size)
+    _user_cache[path] = (key, data)
+    return data
+
+
+def _remember_saved(path: Path, data: list) -> None:
+    """Record what was just written so the next load skips the re-parse."""
+    st = path.stat()
+    _user_cache[path] = ((st.st_mtime_ns, st.st_size), data)
+
+
 def is_valid_user(user: dict) -> bool:
     """
     Check if a user dictionary contains all REQUIRED_FIELDS.
@@ -126,6 +200,16 @@ def is_valid_user(user: dict) -> bool:
     return isinstance(user, dict) and REQUIRED_FIELDS.issubset(user)
 
 
+def _load_role(role: str) -> Optional[list]:
+    """Parsed role file ([] if missing), or None if it is corrupt."""
+    try:
+        return _load_json_cached(DATABASE_DIR / role / USERS_FILE)
+    except FileNotFoundError:
+        return []
+    except _JSON_ERRORS:
+        return None
+
+
 def load_users() -> List[Dict]:
     """
     Load all users from all role folders.
@@ -133,21 +217,225 @@ def load_users() -> List[Dict]:
     Returns a flat list of valid user dictionaries.
     """
     all_users = []
-    for role in ROLES:
-        file_path = DATABASE_DIR / role / USERS_FILE
-        if not file_path.exists():
-            continue
-        try:
-            with file_path.open('r', encoding='utf-8') as f:
-                data = json.load(f)
-                if isinstance(data, list):
-                    for u in data:
-                        if is_valid_user(u):
-                            all_users.append(u)
-        except json.JSONDecodeError:
+    edits, inserts = replay_wal()
+    # Role files are read and parsed concurrently (file reads and orjson release
+    # the GIL); errors are reported here, in role order
+    with ThreadPoolExecutor(max_workers=len(ROLES)) as ex:
+        loaded = list(ex.map(_load_role, ROLES))
+    for role, data in zip(ROLES, loaded):
+        if data is None:
             show_error(f"Corrupt JSON in {role}/{USERS_FILE}")
+            continue
+        if role in edits:
+            # edits not yet compacted into the role file
+            data = _apply_edits(data, edits[role], inserts.get(role, set()))
+        all_users.extend(u for u in data if is_valid_user(u))
     return all_users
 
+# ----- Edit log -----
+Edits = Dict[str, Dict[str, Optional[dict]]]
+# ((st_size, st_mtime_ns) of the log, edits, inserts) as last replayed or appended;
+# reused while the log file is unchanged, so a save does not re-parse the log
+_wal_state: Optional[Tuple[Optional[Tuple[int, int]], Edits, Dict[str, Set[str]]]] = None
+
+
+def _apply_record(edits: Edits, inserts: Dict[str, Set[str]], record: dict) -> None:
+    role, uid = record["role"], str(record["id"])
+    edits.setdefault(role, {})[uid] = record["user"]
+    if record.get("new"):
+        inserts.setdefault(role, set()).add(uid)
+    else:
+        inserts.get(role, set()).discard(uid)
+    moved_from = record.get("from")
+    if moved_from:
+        # role change: the removal from the old role rides in the same record
+        edits.setdefault(moved_from, {})[uid] = None
+        inserts.get(moved_from, set()).discard(uid)
+
+
+def wal_append(record: dict, *, fsync: bool = True) -> int:
+    """
+    Append one length-prefixed record to the edit log and apply it to the
+    in-memory replay; returns the new log size.
+    """
+    global _wal_state
+    if orjson is not None:
+        entry = orjson.dumps(record)
+    else:
+        entry = json.dumps(record, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    edits, inserts = replay_wal()  # also cuts off a torn tail before appending
+    LOG_DIR.mkdir(parents=True, exist_ok=True)
+    with open(WAL_FILE, 'ab') as f:
+        f.write(len(entry).to_bytes(4, 'little') + entry)
+        f.flush()
+        if fsync:
+            os.fsync(f.fileno())
+        st = os.fstat(f.fileno())
+    _apply_record(edits, inserts, record)
+    _wal_state = ((st.st_size, st.st_mtime_ns), edits, inserts)
+    return st.st_size
+
+
+def _log_edit(role: str, user_id: str, user: Optional[dict], *, new: bool = False,
+              moved_from: Optional[str] = None, fsync: bool = True) -> int:
+    # user=None records a removal of user_id from role; new=True marks a user
+    # that is not in the role file yet, the only kind compaction may append;
+    # moved_from removes the user from its previous role in the same record
+    record = {"ts": time.time_ns(), "role": role, "id": user_id, "user": user, "new": new}
+    if moved_from:
+        record["from"] = moved_from
+    return wal_append(record, fsync=fsync)
+
+
+def _wal_stamp() -> Optional[Tuple[int, int]]:
+    try:
+        st = WAL_FILE.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def replay_wal() -> Tuple[Edits, Dict[str, Set[str]]]:
+    """
+    Latest logged state per role and user id (None = removed), last writer wins,
+    plus the ids per role whose latest save was of a user not yet in the role file.
+    The log is only re-read when it changed since the last replay or append;
+    callers must not mutate the result.
+    A torn record at the end of the log (crash mid-append) is cut off the file,
+    so later appends are not stranded behind it.
+    """
+    global _wal_state
+    stamp = _wal_stamp()
+    if _wal_state is not None and _wal_state[0] == stamp:
+        return _wal_state[1], _wal_state[2]
+    edits: Edits = {}
+    inserts: Dict[str, Set[str]] = {}
+    try:
+        raw = WAL_FILE.read_bytes()
+    except FileNotFoundError:
+        raw = b''
+    pos = 0
+    while pos + 4 <= len(raw):
+        size = int.from_bytes(raw[pos:pos + 4], 'little')
+        body = raw[pos + 4:pos + 4 + size]
+        if len(body) < size:
+            break
+        pos += 4 + size
+        try:
+            record = orjson.loads(body) if orjson is not None else json.loads(body)
+        except ValueError:
+            continue
+        _apply_record(edits, inserts, record)
+    if pos < len(raw):
+        os.truncate(WAL_FILE, pos)
+        stamp = _wal_stamp()
+    _wal_state = (stamp, edits, inserts)
+    return edits, inserts
+
+
+def _iter_edits_applied(users: Iterable, edits: Dict[str, Optional[dict]],
+                        inserts: Set[str] = frozenset()) -> Iterator:
+    """
+    Same result as applying each logged save/removal to users in turn.
+    Saves of ids missing from users are only appended when logged as inserts;
+    otherwise the user was removed by another tool after the edit was logged.
+    """
+    applied = set()
+    for u in users:
+        uid = str(u.get('id')) if isinstance(u, dict) else None
+        if uid in edits:
+            new = edits[uid]
+            if new is None:
+                continue
+            if uid not in applied:
+                applied.add(uid)
+                yield new
+                continue
+        yield u
+    for uid in inserts:
+        new = edits.get(uid)
+        if new is not None and uid not in applied:
+            yield new
+
+
+def _apply_edits(users_list: list, edits: Dict[str, Optional[dict]],
+                 inserts: Set[str] = frozenset()) -> list:
+    return list(_iter_edits_applied(users_list, edits, inserts))
+
+
+def _record_bytes(user) -> bytes:
+    # One list element, indented as it would be inside the pretty-printed array
+    if orjson is not None:
+        body = orjson.dumps(user, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        return b'  ' + body.replace(b'\n', b'\n  ')
+    body = json.dumps(user, ensure_ascii=False, indent=4)
+    return ('    ' + body.replace('\n', '\n    ')).encode('utf-8')
+
+
+def dump_users_to(path: Path, users: Iterable, *, fsync: bool = True) -> None:
+    """
+    Atomically write users as a JSON array one record at a time, so neither the
+    whole list nor its encoded text has to be held in memory.
+    """
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    tmp.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        with io.open(tmp, 'wb') as f:
+            sep = b'[\n'
+            for u in users:
+                f.write(sep)
+                f.write(_record_bytes(u))
+                sep = b',\n'
+            f.write(b'[]' if sep == b'[\n' else b'\n]')
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        tmp.replace(path)
+        if fsync:
+            _fsync_dir(path.parent)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _stream_records(path: Path) -> Iterator:
+    # The source closes once exhausted, before dump_users_to replaces it
+    with path.open('rb') as src:
+        yield from ijson.items(src, 'item', use_float=True)
+
+
+def _rewrite_role_streaming(file_path: Path, edits: Dict[str, Optional[dict]],
+                            inserts: Set[str]) -> None:
+    dump_users_to(file_path, _iter_edits_applied(_stream_records(file_path), edits, inserts))
+    _user_cache.pop(file_path, None)
+
+
+def compact_wal() -> None:
+    """Rewrite every role file touched by the edit log, then drop the log."""
+    edits, inserts = replay_wal()
+    complete = True
+    for role, role_edits in edits.items():
+        role_inserts = inserts.get(role, set())
+        file_path = DATABASE_DIR / role / USERS_FILE
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            if ijson is not None and file_path.stat().st_size >= STREAM_REWRITE_BYTES:
+                _rewrite_role_streaming(file_path, role_edits, role_inserts)
+                continue
+            users_list = _load_json_cached(file_path)
+        except FileNotFoundError:
+            users_list = []
+        except _JSON_ERRORS:
+            # keep the log so these edits are not lost; load_users reports the file
+            complete = False
+            continue
+        users_list = _apply_edits(users_list, role_edits, role_inserts)
+        dump_users_to(file_path, users_list)
+        _remember_saved(file_path, users_list)
+    # Replaying is idempotent, so a crash before this unlink only repeats work
+    if complete:
+        WAL_FILE.unlink(missing_ok=True)
+
 # ----- Editor -----
 def open_editor(initial_text: str) -> Optional[str]:
     """
@@ -160,36 +448,22 @@ def open_editor(initial_text: str) -> Optional[str]:
     - CTRL+A: Select all text
     - CTRL+Z: Undo
     Returns edited text on save, None if cancelled or interrupted.
+    Small records are edited in an inline prompt; only large ones pay for the
+    full-screen application.
     """
-    text_area = TextArea(
-        text=initial_text,
-        scrollbar=True,
-        line_numbers=True,
-        wrap_lines=False,
-        multiline=True,
-        focus_on_click=True,
-    )
-    status_bar = TextArea(
-        text="CTRL+S Save | CTRL+X Cancel | CTRL+K Cut | CTRL+U Paste",
-        height=1,
-        focusable=False,
-        style="class:status"
-    )
-
+    status_text = "CTRL+S Save | CTRL+X Cancel | CTRL+K Cut | CTRL+U Paste"
     kb = KeyBindings()
-    saved = {'content': None}
 
     # Save shortcut
     @kb.add('c-s')
     def _(event):
-        saved['content'] = text_area.text
-        event.app.exit()
+        event.app.exit(result=event.app.current_buffer.text)
 
-    # Cancel shortcut
-    @kb.add('c-x')
+    # Cancel shortcut; eager so it wins over the emacs bindings that start
+    # with c-x (e.g. c-x c-e) instead of waiting out the key-sequence timeout
+    @kb.add('c-x', eager=True)
     def _(event):
-        saved['content'] = None
-        event.app.exit()
+        event.app.exit(result=None)
 
     # Cut shortcut
     @kb.add('c-k')
@@ -228,53 +502,85 @@ def open_editor(initial_text: str) -> Optional[str]:
         buffer = event.app.current_buffer
         buffer.undo()
 
-    root = HSplit([Frame(text_area, title='User Editor'), status_bar])
-    app = Application(layout=Layout(root), key_bindings=kb, full_screen=True)
-
     try:
-        app.run()
-    except KeyboardInterrupt:
+        if len(initial_text) < INLINE_EDIT_CHARS:
+            return prompt(
+                "",
+                default=initial_text,
+                multiline=True,
+                key_bindings=kb,
+                bottom_toolbar=status_text,
+            )
+
+        text_area = TextArea(
+            text=initial_text,
+            scrollbar=True,
+            line_numbers=True,
+            wrap_lines=False,
+            multiline=True,
+            focus_on_click=True,
+        )
+        status_bar = TextArea(
+            text=status_text,
+            height=1,
+            focusable=False,
+            style="class:status"
+        )
+        root = HSplit([Frame(text_area, title='User Editor'), status_bar])
+        app = Application(layout=Layout(root), key_bindings=kb, full_screen=True)
+        return app.run()
+    except (KeyboardInterrupt, EOFError):
         return None
     except Exception as e:
         show_error(f"Editor crashed: {e}")
         return None
 
-    return saved['content']
-
 # ----- Save -----
-def save_user(user: dict) -> None:
+def _stored_record(role: str, user_id: str) -> Optional[dict]:
+    """Record for user_id in the role file itself (edit log ignored), or None."""
+    try:
+        data = _load_json_cached(DATABASE_DIR / role / USERS_FILE)
+    except (FileNotFoundError, *_JSON_ERRORS):
+        return None
+    for u in data:
+        if isinstance(u, dict) and str(u.get('id')) == user_id:
+            return u
+    return None
+
+
+def _current_record(role: str, user_id: str) -> Optional[dict]:
+    """Stored record for user_id in role, pending edits included, or None."""
+    edits = replay_wal()[0].get(role, {})
+    if user_id in edits:
+        return edits[user_id]
+    return _stored_record(role, user_id)
+
+
+def save_user(user: dict, *, moved_from: Optional[str] = None, fsync: bool = True) -> None:
     """
     Save or update a user in the correct role folder.
-    - Creates role folder if missing
-    - Updates existing user if ID matches
+    - Appends the new state to the edit log instead of rewriting users.json
+    - Updates existing user if ID matches (once the log is compacted)
     - Appends new user if ID not found
-    - Handles role change by removing from old role file
-    - Uses atomic_save to prevent corruption
+    - moved_from removes the user from its previous role in the same log record,
+      so a crash cannot leave it in both roles
+    - Compacts the log into the role files once it grows large
+    - Skips the write entirely when the stored record is already identical
+    - fsync=False skips the log's fsync barrier
     - Logs the operation
     """
     role = user.get('role')
     if not role or role not in ROLES:
         raise ValueError("Invalid role")
-    file_path = DATABASE_DIR / role / USERS_FILE
-    file_path.parent.mkdir(parents=True, exist_ok=True)
-    users_list = []
-    if file_path.exists():
-        try:
-            with file_path.open('r', encoding='utf-8') as f:
-                data = json.load(f)
-                if isinstance(data, list):
-                    users_list = data
-        except Exception:
-            users_list = []
-    updated = False
-    for i, u in enumerate(users_list):
-        if str(u.get('id')) == str(user.get('id')):
-            users_list[i] = user
-            updated = True
-            break
-    if not updated:
-        users_list.append(user)
-    atomic_save(file_path, json.dumps(users_list, ensure_ascii=False, indent=4))
+    if moved_from == role or moved_from not in ROLES:
+        moved_from = None
+    user_id = str(user.get('id'))
+    if moved_from is None and _current_record(role, user_id) == user:
+        log(f"No changes for user {user_id} in {role}")
+        return
+    new = _stored_record(role, user_id) is None
+    if _log_edit(role, user_id, user, new=new, moved_from=moved_from, fsync=fsync) >= WAL_COMPACT_BYTES:
+        compact_wal()
     log(f"Saved user {user.get('id')} in {role}")
 
 # ----- Validation -----
@@ -296,7 +602,45 @@ def validate_user(raw: str) -> dict:
     return data
 
 # ----- Main Loop -----
-def main():
+def build_match_rows(users: List[Dict]) -> List[tuple]:
+    """Precompute (name, email, id) lowercased once per load for query matching."""
+    return [(str(u.get('name', '')).lower(), str(u.get('email', '')).lower(),
+             str(u.get('id', '')).lower(), u) for u in users]
+
+
+class RapidFuzzCompleter(Completer):
+    """Rank names against the typed text with rapidfuzz (C++).
+
+    process.extract keeps only the best ``limit`` names above the cutoff in a
+    bounded heap, so each keystroke yields the top matches without sorting
+    every name.
+    """
+
+    def __init__(self, choices: List[str], limit: int = 30, score_cutoff: int = 60) -> None:
+        self.choices = choices
+        self.limit = limit
+        self.score_cutoff = score_cutoff
+
+    def get_completions(self, document, complete_event):
+        text = document.text_before_cursor
+        if not text.strip():
+            return
+        for choice, _, _ in process.extract(text, self.choices, scorer=fuzz.WRatio,
+                                            score_cutoff=self.score_cutoff,
+                                            processor=fuzz_utils.default_process,
+                                            limit=self.limit):
+            yield Completion(choice, start_position=-len(text))
+
+
+def build_completer(users: List[Dict]) -> Completer:
+    """Name completer for the search prompt."""
+    names = list(dict.fromkeys(u["name"] for u in users if u.get("name")))
+    if process is not None:
+        return RapidFuzzCompleter(names)
+    return FuzzyCompleter(WordCompleter(names, ignore_case=True, sentence=True, match_middle=True))
+
+
+def main(argv: Optional[List[str]] = None):
     """
     Continuous interactive loop:
     - Prompts for name, email, or ID with fuzzy search
@@ -305,39 +649,44 @@ def main():
     - Saves changes and handles role transfer
     - Clears terminal and repeats until CTRL+C
     """
+    # Users, their lowercased match keys and the completer are rebuilt only
+    # after a save changes the role files
+    users: Optional[List[Dict]] = None
+    compact_wal()
     while True:
         try:
             display_title()
-            users = load_users()
+            if users is None:
+                users = load_users()
+                rows = build_match_rows(users)
+                fuzzy_completer = build_completer(users)
             if not users:
+                users = None
                 print("No users found. Check role folders and users.json.")
                 time.sleep(2)
-                os.system('cls' if os.name == 'nt' else 'clear')
+                clear_screen()
                 continue
 
-            user_name_map = {u["name"]: u for u in users if u.get("name")}
-            name_completions = list(user_name_map.keys())
-            word_completer = WordCompleter(name_completions, ignore_case=True, sentence=True, match_middle=True)
-            fuzzy_completer = FuzzyCompleter(word_completer)
-
             query = prompt("[SYSTEM] Enter name, email or ID: ",
                            style=style,
                            completer=fuzzy_completer,
-                           complete_while_typing=True)
+                           complete_while_typing=True,
+                           # score off the UI thread; stale keystrokes are cancelled
+                           complete_in_thread=True)
 
             if not query.strip():
                 show_error("Empty query")
-                os.system('cls' if os.name == 'nt' else 'clear')
+                clear_screen()
                 continue
 
-            matches = [u for u in users if query.lower() in u.get('name', '').lower()
-                                         or query.lower() in u.get('email', '').lower()
-                                         or query.lower() == str(u.get('id', '')).lower()]
+            q = query.lower()
+            matches = [u for name_lc, email_lc, id_lc, u in rows
+                       if q in name_lc or q in email_lc or q == id_lc]
 
             if not matches:
                 print("No matches found.")
                 time.sleep(2)
-                os.system('cls' if os.name == 'nt' else 'clear')
+                clear_screen()
                 continue
 
             if len(matches) > 1:
@@ -349,12 +698,12 @@ def main():
                     idx = int(sel) - 1
                     if idx < 0 or idx >= len(matches):
                         show_error("Invalid selection")
-                        os.system('cls' if os.name == 'nt' else 'clear')
+                        clear_screen()
                         continue
                     user = matches[idx]
                 except Exception:
                     show_error("Selection parse error")
-                    os.system('cls' if os.name == 'nt' else 'clear')
+                    clear_screen()
                     continue
             else:
                 user = matches[0]
@@ -364,33 +713,26 @@ def main():
             if not edited:
                 print("Edit cancelled.")
                 time.sleep(1)
-                os.system('cls' if os.name == 'nt' else 'clear')
+                clear_screen()
                 continue
 
             new_user = validate_user(edited)
             old_role = user.get('role')
-            new_role = new_user.get('role')
-
-            save_user(new_user)
 
-            if old_role != new_role and old_role in ROLES:
-                old_file = DATABASE_DIR / old_role / USERS_FILE
-                if old_file.exists():
-                    with old_file.open('r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    data = [u for u in data if str(u.get('id')) != str(new_user.get('id'))]
-                    atomic_save(old_file, json.dumps(data, ensure_ascii=False, indent=4))
+            users = None  # role files change from here on; reload next pass
+            save_user(new_user, moved_from=old_role)
 
             print("User saved successfully.")
             time.sleep(2)
-            os.system('cls' if os.name == 'nt' else 'clear')
+            clear_screen()
 
         except KeyboardInterrupt:
             print("\nOperation cancelled. Exiting...")
+            compact_wal()
             break
         except Exception as e:
             show_error(str(e))
-            os.system('cls' if os.name == 'nt' else 'clear')
+            clear_screen()
             # Loop continues
 
 
@@ -10,8 +10,10 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 DEFAULT_ENV_PATH = PROJECT_ROOT / ".env"
@@ -22,13 +24,29 @@ def _read_env_file(env_path: Path) -> Dict[str, str]:
         return {}
     data: Dict[str, str] = {}
     for line in env_path.read_text(encoding="utf-8").splitlines():
-        if not line or line.strip().startswith("#") or "=" not in line:
+        stripped = line.strip()
+        if not stripped or stripped[0] == "#":
             continue
-        key, value = line.split("=", 1)
-        data[key.strip()] = value.strip()
+        key, sep, value = stripped.partition("=")
+        if sep:
+            data[key.strip()] = value.strip()
     return data
 
 
+@lru_cache(maxsize=32)
+def _read_env_cached(path_str: str, mtime_ns: int, size: int) -> Mapping[str, str]:
+    # Keyed by stat so an edited .env is re-read; read-only so the cache stays intact
+    return MappingProxyType(_read_env_file(Path(path_str)))
+
+
+def _env_data(env_path: Path) -> Mapping[str, str]:
+    try:
+        st = env_path.stat()
+    except OSError:
+        return MappingProxyType({})
+    return _read_env_cached(str(env_path), st.st_mtime_ns, st.st_size)
+
+
 @dataclass(frozen=True)
 class Config:
     project_root: Path
@@ -36,11 +54,13 @@ class Config:
     exports_dir: Path
     stats_file: Path
     backup_retention: int
+    # fsync role files before they replace the old ones
+    durable_writes: bool = False
 
 
 def load_config(env_path: Optional[Path] = None, overrides: Optional[Dict[str, str]] = None) -> Config:
     env_file = env_path or DEFAULT_ENV_PATH
-    env_data = _read_env_file(env_file)
+    env_data = _env_data(env_file)
     override_data = overrides or {}
 
     def _get(key: str, default: str) -> str:
@@ -51,6 +71,7 @@ def load_config(env_path: Optional[Path] = None, overrides: Optional[Dict[str, s
     exports_dir = Path(_get("EXPORTS_DIR", str(database_dir / "data" / "exports"))).resolve()
     stats_file = Path(_get("STATS_FILE", str(database_dir / "Logs" / "stats.json"))).resolve()
     backup_retention = int(_get("BACKUP_RETENTION", "5"))
+    durable_writes = _get("DURABLE_WRITES", "0").lower() in {"1", "true", "yes"}
 
     return Config(
         project_root=project_root,
@@ -58,4 +79,5 @@ def load_config(env_path: Optional[Path] = None, overrides: Optional[Dict[str, s
         exports_dir=exports_dir,
         stats_file=stats_file,
         backup_retention=backup_retention,
+        durable_writes=durable_writes,
     )
@@ -32,3 +32,10 @@ BRIGHT = Style.BRIGHT
 DIM = Style.DIM
 NORMAL = Style.NORMAL
 STYLE_RESET = Style.RESET_ALL
+
+# Precombined styles for hot display paths (built once at import)
+WHITE_BRIGHT = WHITE + BRIGHT
+YELLOW_BRIGHT = YELLOW + BRIGHT
+BORDER = WHITE_BRIGHT + "-" * 50
+# Error box used by the interactive tools: format(msg=...)
+ERROR_TEMPLATE = f"{WHITE_BRIGHT}\n{'-' * 50}\n{LRED}Error: {{msg}}\n{BORDER}\n"
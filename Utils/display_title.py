@@ -1,10 +1,25 @@
 # Script update for Jixovox database utilities - updated 2026-01-05 09:37 UTC by lloydlewis
 import os
-from Utils.colors import YELLOW,BRIGHT,GREEN
+import sys
+from Utils.colors import YELLOW_BRIGHT,GREEN
 
+# Erase display + scrollback and home the cursor, as `clear` does. colorama
+# (initialized by Utils.colors) translates 2J/H for legacy Windows consoles
+# but not the scrollback erase, so that part is POSIX-only
+CLEAR_SEQ = "\x1b[2J\x1b[H" if os.name == 'nt' else "\x1b[2J\x1b[3J\x1b[H"
+# Decided once: clearing only makes sense on an interactive terminal
+_CLEAR_ON_TTY = bool(sys.stdout and sys.stdout.isatty())
 
-def display_title(color=YELLOW+BRIGHT):
-    os.system('cls' if os.name == 'nt' else 'clear')
+
+def clear_screen():
+    """Clear the terminal in-process instead of forking cls/clear."""
+    if _CLEAR_ON_TTY:
+        sys.stdout.write(CLEAR_SEQ)
+        sys.stdout.flush()
+
+
+def display_title(color=YELLOW_BRIGHT):
+    clear_screen()
     print(color+"""
                     ██╗██╗██╗  ██╗ ██████╗ ██╗   ██╗ ██████╗ ██╗  ██╗ by
                     ██║██║╚██╗██╔╝██╔═══██╗██║   ██║██╔═══██╗╚██╗██╔╝ lloyd
@@ -14,6 +29,3 @@ def display_title(color=YELLOW+BRIGHT):
                 ╚════╝ ╚═╝╚═╝  ╚═╝ ╚═════╝   ╚═══╝   ╚═════╝ ╚═╝  ╚═╝ """,GREEN +"""V 1.0
                                                                                                                                         
 """)
-    
-
-display_title()
@@ -0,0 +1,179 @@
+# Script update for Jixovox database utilities - updated 2026-01-05 09:37 UTC by lloydlewis
+import gzip
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from cryptography.fernet import Fernet
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT))
+# A configured key keeps add.py from logging the ephemeral-key warning on import
+os.environ.setdefault("APP_ENC_KEY", Fernet.generate_key().decode())
+
+from Database import add
+
+
+def _record(i):
+    email = f"user{i}@example.com"
+    return {"id": str(i), "name": add.encrypt_data(f"User{i}"), "email": add.encrypt_data(email)}, email
+
+
+class UsersStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.folder = Path(self.tempdir.name) / "Member"
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def _fill(self, count, safe_mode=False):
+        with add.Users(self.folder, safe_mode=safe_mode) as users:
+            for i in range(count):
+                users.add_user(*_record(i))
+
+    def _ids(self, users):
+        return [u["id"] for u in users.cache]
+
+    def test_append_and_reload(self):
+        self._fill(3)
+        with add.Users(self.folder) as users:
+            self.assertEqual(self._ids(users), ["0", "1", "2"])
+            self.assertTrue(users.email_exists("USER1@example.com"))
+            users.add_user(*_record(3))
+            with self.assertRaises(add.EmailExistsError):
+                users.add_user(*_record(3))
+
+        self.assertEqual(self._ids(add.Users(self.folder)), ["0", "1", "2", "3"])
+
+    def test_add_user_derives_key_from_record(self):
+        with add.Users(self.folder) as users:
+            record, _ = _record(0)
+            users.add_user(record)
+            users.add_user({"id": "1", "email": "plain@example.com"})
+            self.assertTrue(users.email_exists("user0@example.com"))
+            with self.assertRaises(add.EmailExistsError):
+                users.add_user({"id": "2", "email": add.encrypt_data("plain@example.com")})
+
+    def test_reader_salvages_open_stream_without_rewriting(self):
+        writer = add.Users(self.folder)
+        for i in range(2):
+            writer.add_user(*_record(i))
+        writer.flush()
+        before = (self.folder / "users.jsonl.gz").stat().st_ino
+
+        with self.assertLogs(level="WARNING"):
+            reader = add.Users(self.folder)
+        self.assertEqual(self._ids(reader), ["0", "1"])
+        self.assertEqual((self.folder / "users.jsonl.gz").stat().st_ino, before)
+
+        writer.add_user(*_record(2))
+        writer.close()
+        self.assertEqual(self._ids(add.Users(self.folder)), ["0", "1", "2"])
+
+    def test_torn_tail_is_repaired_by_next_writer(self):
+        self._fill(50)
+        db_file = self.folder / "users.jsonl.gz"
+        data = db_file.read_bytes()
+        db_file.write_bytes(data[:-20])  # crash before the gzip trailer
+
+        with self.assertLogs(level="WARNING"):
+            users = add.Users(self.folder)
+        salvaged = self._ids(users)
+        self.assertTrue(salvaged)
+        self.assertEqual(db_file.read_bytes(), data[:-20])
+
+        users.add_user(*_record(50))
+        users.close()
+        with gzip.open(db_file, "rb") as f:
+            self.assertEqual(len(f.read().splitlines()), len(salvaged) + 1)
+
+    def test_journal_replays_records_the_file_lost(self):
+        self._fill(3, safe_mode=True)
+        db_file = self.folder / "users.jsonl.gz"
+        with gzip.open(db_file, "rb") as f:
+            first = f.readline()
+        with gzip.open(db_file, "wb") as f:
+            f.write(first)
+
+        with self.assertLogs(level="WARNING"):
+            users = add.Users(self.folder, safe_mode=True)
+        self.assertEqual(self._ids(users), ["0", "1", "2"])
+        self.assertTrue(users.email_exists("user2@example.com"))
+        self.assertTrue((self.folder / "users.jsonl.gz.wal").exists())
+
+    def test_safe_mode_survives_crash(self):
+        script = textwrap.dedent(f"""
+            import os, sys
+            sys.path.insert(0, {str(ROOT)!r})
+            from pathlib import Path
+            from Database import add
+            users = add.Users(Path({str(self.folder)!r}), safe_mode=True)
+            for i in range(5):
+                email = f"user{{i}}@example.com"
+                users.add_user({{"id": str(i), "email": add.encrypt_data(email)}}, email)
+            os._exit(0)
+        """)
+        subprocess.run([sys.executable, "-c", script], check=True, env=os.environ.copy())
+
+        with self.assertLogs(level="WARNING"):
+            users = add.Users(self.folder, safe_mode=True)
+        self.assertEqual(self._ids(users), ["0", "1", "2", "3", "4"])
+
+
+class BulkCreateTest(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        root = Path(self.tempdir.name)
+        patches = [
+            mock.patch.object(add, "BASE_DIR", root),
+            mock.patch.object(add, "STATS_FILE", root / "Logs" / "stats.json"),
+            mock.patch.object(add, "hash_password", lambda pw: "hashed"),  # skip Argon2
+            mock.patch.object(add, "_mirrored_roles", set()),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.addCleanup(self.tempdir.cleanup)
+
+    def test_stats_count_records_written_before_a_failure(self):
+        records = [("member", f"User {n}", f"{n.lower()}@example.com", "Passw0rd!") for n in ("Ann", "Bob", "Cid")]
+        store_user = add._store_user
+        calls = []
+
+        def failing_store(*args):
+            calls.append(args)
+            if len(calls) == 3:
+                raise OSError("disk full")
+            return store_user(*args)
+
+        with mock.patch.object(add, "_store_user", failing_store):
+            with self.assertRaises(OSError):
+                add.create_users_bulk(records)
+        self.assertEqual(add.load_stats()["User_Count"], 2)
+
+        created = add.create_users_bulk([("member", "User Dee", "dee@example.com", "Passw0rd!")])
+        self.assertEqual(created[0]["id"], "3")
+
+
+class PlainMirrorTest(unittest.TestCase):
+    def test_mirrored_users_reach_users_json_on_exit(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            role_folder = Path(tmp)
+            (role_folder / "users.json").write_text('[{"id": "1", "email": "old@example.com"}]')
+            add._mirror_plain_users_json(role_folder, {"id": "2", "email": "new@example.com"})
+
+            add._rollup_mirrors()
+            users = json.loads((role_folder / "users.json").read_text())
+            self.assertEqual([u["id"] for u in users], ["1", "2"])
+            self.assertFalse((role_folder / "users.ndjson").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
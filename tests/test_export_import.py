@@ -9,6 +9,7 @@ sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 from Handler.config_loader import load_config
 from Database import export_import
+from Database.storage import JsonStorageAdapter
 
 
 class ExportImportTest(unittest.TestCase):
@@ -64,6 +65,64 @@ class ExportImportTest(unittest.TestCase):
         self.assertEqual(len(current), 1)
         self.assertEqual(current[0]["name"], "NewOwner")
 
+    def test_export_reuses_snapshot_for_unchanged_roles(self):
+        self._write_sample_users()
+        loads = []
+
+        class CountingAdapter(JsonStorageAdapter):
+            def load_role_users(self, role, users_file):
+                loads.append(role)
+                return super().load_role_users(role, users_file)
+
+        adapter = CountingAdapter(self.config)
+        exports = self.db_root / "data" / "exports"
+        first = export_import.export_database(exports / "first.json", storage=adapter)
+        second = export_import.export_database(exports / "second.json", storage=adapter)
+
+        self.assertEqual(len(loads), len(export_import.DEFAULT_ROLES))
+        first_data = json.loads(first.read_text(encoding="utf-8"))
+        second_data = json.loads(second.read_text(encoding="utf-8"))
+        self.assertEqual(first_data["users"], second_data["users"])
+        self.assertEqual(set(first_data["metadata"]), set(second_data["metadata"]))
+
+        extra = [{"id": "1", "name": "MemberOne", "email": "m1@example.com", "role": "Member"}]
+        (self.db_root / "Member" / export_import.USER_FILE).write_text(json.dumps(extra), encoding="utf-8")
+        third = export_import.export_database(exports / "third.json", storage=adapter)
+
+        self.assertEqual(len(loads), 2 * len(export_import.DEFAULT_ROLES))
+        third_data = json.loads(third.read_text(encoding="utf-8"))
+        self.assertEqual([u["name"] for u in third_data["users"]["Member"]], ["MemberOne"])
+
+    def test_failed_import_leaves_role_files_untouched(self):
+        self._write_sample_users()
+        snapshot = self.db_root / "broken.json"
+        snapshot.write_text(json.dumps({
+            "users": {
+                "Owner": [{"id": "9", "name": "Replacement", "email": "r@example.com", "role": "Owner"}],
+                "Member": [{"id": "1", "name": "NoEmail"}],
+            }
+        }), encoding="utf-8")
+
+        with self.assertRaises(ValueError):
+            export_import.import_database(snapshot, mode="replace", config=self.config)
+
+        owner_file = self.db_root / "Owner" / export_import.USER_FILE
+        current = json.loads(owner_file.read_text(encoding="utf-8"))
+        self.assertEqual([u["name"] for u in current], ["OwnerOne", "OwnerTwo"])
+        self.assertEqual(list(self.db_root.glob(".staging-*")), [])
+
+    def test_fast_parse_matches_argparse(self):
+        parser = export_import.build_parser()
+        for argv in (
+            ["export"],
+            ["export", "-o", "out.json", "--users-file=u.json"],
+            ["import", "--file", "s.json", "--mode", "replace"],
+            ["backup", "--retention", "3"],
+        ):
+            self.assertEqual(vars(export_import._fast_parse(argv)), vars(parser.parse_args(argv)))
+        for argv in (["export", "--help"], ["import"], ["backup", "--retention", "x"], ["export", "-o"]):
+            self.assertIsNone(export_import._fast_parse(argv))
+
     def test_backup_prunes_exports(self):
         export_import.run_backup(config=self.config, retention=1)
         export_import.run_backup(config=self.config, retention=1)
@@ -72,6 +131,45 @@ class ExportImportTest(unittest.TestCase):
         exports = sorted((self.db_root / "data" / "exports").glob("users-export-*.json"))
         self.assertLessEqual(len(exports), 1)
 
+    def test_compact_rolls_up_pending_mirror(self):
+        self._write_sample_users()
+        pending = self.db_root / "Owner" / export_import.PENDING_USER_FILE
+        records = [
+            {"id": "2", "name": "OwnerTwo", "email": "OWNER2@example.com", "role": "Owner", "created": "x"},
+            {"id": "3", "name": "OwnerThree", "email": "owner3@example.com", "role": "Owner"},
+        ]
+        pending.write_text("".join(json.dumps(r) + "\n" for r in records) + "{broken\n", encoding="utf-8")
+
+        applied = export_import.compact_database(config=self.config)
+        self.assertEqual(applied["Owner"], 2)
+        self.assertEqual(applied["Member"], 0)
+        self.assertFalse(pending.exists())
+
+        owner_file = self.db_root / "Owner" / export_import.USER_FILE
+        current = json.loads(owner_file.read_text(encoding="utf-8"))
+        self.assertEqual([u["id"] for u in current], ["1", "2", "3"])
+        self.assertEqual(current[1]["created"], "x")
+
+    def test_compact_picks_up_interrupted_rollup(self):
+        self._write_sample_users()
+        owner_dir = self.db_root / "Owner"
+        leftover = owner_dir / export_import.COMPACTING_USER_FILE
+        pending = owner_dir / export_import.PENDING_USER_FILE
+        leftover.write_text(json.dumps(
+            {"id": "3", "name": "OwnerThree", "email": "owner3@example.com", "role": "Owner"}) + "\n",
+            encoding="utf-8")
+        pending.write_text(json.dumps(
+            {"id": "4", "name": "OwnerFour", "email": "owner4@example.com", "role": "Owner"}) + "\n",
+            encoding="utf-8")
+
+        applied = export_import.compact_database(config=self.config)
+        self.assertEqual(applied["Owner"], 2)
+        self.assertFalse(leftover.exists())
+        self.assertFalse(pending.exists())
+
+        current = json.loads((owner_dir / export_import.USER_FILE).read_text(encoding="utf-8"))
+        self.assertEqual([u["id"] for u in current], ["1", "2", "3", "4"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,109 @@
+# Script update for Jixovox database utilities - updated 2026-01-05 09:37 UTC by lloydlewis
+import logging
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from prompt_toolkit.document import Document
+
+from Database import search
+from Database.search import RoleNameCompleter, User, UserIndex, UserLoader, UserSearcher, rapidfuzz_fuzz
+
+
+def setUpModule():
+    # Log to a temp dir instead of the tracked Database/Logs files; without
+    # propagation the root handler (system_log.txt, if add.py set it up) stays quiet
+    global _log_dir, _saved_handlers
+    _log_dir = tempfile.TemporaryDirectory()
+    _saved_handlers = search.logger.handlers[:]
+    handler = logging.FileHandler(Path(_log_dir.name) / "search.log", encoding="utf-8")
+    search.logger.handlers = [handler]
+    search.logger.propagate = False
+
+
+def tearDownModule():
+    for handler in search.logger.handlers:
+        handler.close()
+    search.logger.handlers = _saved_handlers
+    search.logger.propagate = True
+    _log_dir.cleanup()
+
+
+class SearchUsersTest(unittest.TestCase):
+    def setUp(self):
+        self.sample_users = [
+            User(id="001", name="LloydLewis", email="lloyd@example.com", role="Owner"),
+            User(id="002", name="Jixel", email="jixel@dev.com", role="Developer"),
+        ]
+
+    def test_simple_search(self):
+        searcher = UserSearcher(self.sample_users)
+        results = searcher.search("lloyd", "name")
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0].name, "LloydLewis")
+
+    def test_fuzzy_search(self):
+        if rapidfuzz_fuzz is None:
+            self.skipTest("rapidfuzz not installed")
+        searcher = UserSearcher(self.sample_users, use_fuzzy=True)
+        results = searcher.search("Loyd", "name")
+        self.assertTrue(any(u.name == "LloydLewis" for u in results))
+
+    def test_no_results(self):
+        searcher = UserSearcher(self.sample_users)
+        results = searcher.search("xyz", "name")
+        self.assertEqual(len(results), 0)
+
+    def test_role_filter(self):
+        searcher = UserSearcher(self.sample_users)
+        self.assertEqual([u.id for u in searcher.search("e", "name", role_filter="developer")], ["002"])
+        self.assertEqual(searcher.search("lloyd", "name", role_filter="Developer"), [])
+        self.assertEqual(searcher.search("lloyd", "name", role_filter="Unknown"), [])
+
+    def test_empty_query(self):
+        searcher = UserSearcher(self.sample_users)
+        results = searcher.search("", "name")
+        self.assertEqual(len(results), 0)
+
+
+class UserIndexShardTest(unittest.TestCase):
+    def setUp(self):
+        self.index = UserIndex.build([
+            User(id="1", name="Ann", email="ann@example.com", role="Member"),
+            User(id="2", name="Bob", email="bob@example.com", role="Owner"),
+            User(id="3", name="Cid", email="cid@example.com", role="member"),
+        ])
+
+    def test_shard_keeps_role_users_in_order(self):
+        shard = self.index.shard("MEMBER")
+        self.assertEqual([u.id for u in shard.users], ["1", "3"])
+        self.assertEqual(shard.names_lower, ("ann", "cid"))
+        self.assertEqual(shard.emails_lower, ("ann@example.com", "cid@example.com"))
+
+    def test_shard_without_role_is_full_index(self):
+        self.assertIs(self.index.shard(None), self.index)
+        self.assertEqual(self.index.shard("Admin").users, ())
+
+    def test_completer_role_filter(self):
+        completer = RoleNameCompleter([], "name", index=self.index, role_filter="owner")
+        self.assertEqual([c.text for c in completer.get_completions(Document("b"), None)], ["Bob"])
+        self.assertEqual(list(completer.get_completions(Document("a"), None)), [])
+
+
+class LoaderTest(unittest.IsolatedAsyncioTestCase):
+    async def test_load_users_handles_missing_files(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            loader = UserLoader(Path(tmpdir), roles=("NoRole1", "NoRole2"), users_file="users.json")
+            with mock.patch.object(search, "show_error") as show_error:  # skips its 2s pause
+                users = await loader.load_all_users()
+            show_error.assert_called_once()
+            self.assertIsInstance(users, list)
+            self.assertEqual(len(users), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+# Script update for Jixovox database utilities - updated 2026-01-05 09:37 UTC by lloydlewis
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from Handler.config_loader import load_config
+from Database import storage
+from Database.storage import JsonStorageAdapter, atomic_write_bytes, read_file_bytes, write_file_bytes
+
+
+class FileBytesTest(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tempdir.name) / "users.json"
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_roundtrip_and_truncate(self):
+        payload = bytes(range(256)) * 1024
+        write_file_bytes(self.path, payload)
+        self.assertEqual(read_file_bytes(self.path), payload)
+
+        write_file_bytes(self.path, b"[]")
+        self.assertEqual(read_file_bytes(self.path), b"[]")
+
+    def test_empty_file(self):
+        write_file_bytes(self.path, b"")
+        self.assertEqual(read_file_bytes(self.path), b"")
+
+    def test_atomic_write_leaves_no_temp_files(self):
+        write_file_bytes(self.path, b"old")
+        atomic_write_bytes(self.path, b"new")
+        atomic_write_bytes(self.path, b"[1]", durable=True)
+
+        self.assertEqual(read_file_bytes(self.path), b"[1]")
+        self.assertEqual([p.name for p in self.path.parent.iterdir()], ["users.json"])
+
+
+    @unittest.skipIf(os.name == "nt", "POSIX permission bits")
+    def test_atomic_write_keeps_target_mode(self):
+        write_file_bytes(self.path, b"old")
+        os.chmod(self.path, 0o600)
+        atomic_write_bytes(self.path, b"new")
+        self.assertEqual(self.path.stat().st_mode & 0o777, 0o600)
+
+        fresh = self.path.with_name("fresh.json")
+        atomic_write_bytes(fresh, b"[]")
+        self.assertEqual(fresh.stat().st_mode & 0o777, 0o644)
+
+
+class BatchSwapTest(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.db_root = Path(self.tempdir.name) / "Database"
+        self.adapter = JsonStorageAdapter(load_config(overrides={
+            "PROJECT_ROOT": self.tempdir.name,
+            "DATABASE_DIR": str(self.db_root),
+            "STATS_FILE": str(Path(self.tempdir.name) / "stats" / "stats.json"),
+        }))
+        self.adapter.write_role_users("Owner", [{"id": "1"}], "users.json")
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def _files(self):
+        return sorted(p.relative_to(self.tempdir.name).as_posix()
+                      for p in Path(self.tempdir.name).rglob("*") if p.is_file())
+
+    def test_batch_stages_next_to_targets(self):
+        with self.adapter.batch():
+            self.adapter.write_role_users("Owner", [{"id": "2"}], "users.json")
+            self.adapter.update_stats(2)
+
+        self.assertEqual(self.adapter.load_role_users("Owner", "users.json"), [{"id": "2"}])
+        self.assertEqual(self._files(), ["Database/Owner/users.json", "stats/stats.json"])
+
+    def test_failed_swap_restores_replaced_files(self):
+        real_replace = os.replace
+        calls = []
+
+        def flaky_replace(src, dst):
+            calls.append(dst)
+            if len(calls) == 2:
+                raise OSError("disk full")
+            return real_replace(src, dst)
+
+        with self.assertRaises(OSError):
+            with mock.patch.object(storage.os, "replace", flaky_replace):
+                with self.adapter.batch():
+                    self.adapter.write_role_users("Owner", [{"id": "2"}], "users.json")
+                    self.adapter.write_role_users("Member", [{"id": "3"}], "users.json")
+
+        self.assertEqual(self.adapter.load_role_users("Owner", "users.json"), [{"id": "1"}])
+        self.assertEqual(self._files(), ["Database/Owner/users.json"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+# Script update for Jixovox database utilities - updated 2026-01-05 09:37 UTC by lloydlewis
+import json
+import sys
+import tempfile
+import unittest
+from unittest import mock
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from prompt_toolkit.document import Document
+
+from Database import update
+
+
+class EditLogTest(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.db_root = Path(self.tempdir.name)
+        self.saved = {name: getattr(update, name)
+                      for name in ("DATABASE_DIR", "LOG_DIR", "LOG_FILE", "WAL_FILE")}
+        update.DATABASE_DIR = self.db_root
+        update.LOG_DIR = self.db_root / "Logs"
+        update.LOG_FILE = update.LOG_DIR / "edit_user.log"
+        update.WAL_FILE = update.LOG_DIR / "edits.wal"
+        update._user_cache.clear()
+        update._wal_state = None
+
+        self.members = [
+            {"id": "1", "name": "One", "email": "one@example.com", "role": "Member"},
+            {"id": "2", "name": "Two", "email": "two@example.com", "role": "Member"},
+        ]
+        self.member_file = self.db_root / "Member" / update.USERS_FILE
+        self.member_file.parent.mkdir(parents=True)
+        self.member_file.write_text(json.dumps(self.members), encoding="utf-8")
+
+    def tearDown(self):
+        for name, value in self.saved.items():
+            setattr(update, name, value)
+        update._user_cache.clear()
+        update._wal_state = None
+        self.tempdir.cleanup()
+
+    def _read_members(self):
+        return json.loads(self.member_file.read_text(encoding="utf-8"))
+
+    def test_torn_record_is_truncated_before_next_append(self):
+        update.save_user(dict(self.members[0], name="First"))
+        intact = update.WAL_FILE.stat().st_size
+        with open(update.WAL_FILE, "ab") as f:
+            f.write((100).to_bytes(4, "little") + b'{"ts"')  # crash mid-append
+
+        update.replay_wal()
+        self.assertEqual(update.WAL_FILE.stat().st_size, intact)
+
+        update.save_user(dict(self.members[1], name="Second"))
+        update.compact_wal()
+        self.assertEqual([u["name"] for u in self._read_members()], ["First", "Second"])
+        self.assertFalse(update.WAL_FILE.exists())
+
+    def test_compaction_does_not_restore_removed_user(self):
+        update.save_user(dict(self.members[0], name="Edited"))
+        # another tool removes the user before the log is compacted
+        self.member_file.write_text(json.dumps(self.members[1:]), encoding="utf-8")
+
+        update.compact_wal()
+        self.assertEqual([u["id"] for u in self._read_members()], ["2"])
+
+    def test_compaction_appends_new_users(self):
+        moved = {"id": "7", "name": "Moved", "email": "moved@example.com", "role": "Member"}
+        update.save_user(moved)
+        update.save_user(dict(moved, name="MovedAgain"))
+
+        update.compact_wal()
+        self.assertEqual([u["name"] for u in self._read_members()], ["One", "Two", "MovedAgain"])
+
+    def test_saves_do_not_reread_the_log(self):
+        update.save_user(dict(self.members[0], name="First"))
+        with mock.patch.object(type(update.WAL_FILE), "read_bytes", side_effect=AssertionError):
+            update.save_user(dict(self.members[1], name="Second"))
+            update.save_user(dict(self.members[1], name="Second"))  # unchanged: skipped
+            edits, _ = update.replay_wal()
+        self.assertEqual(edits["Member"]["2"]["name"], "Second")
+
+    def test_role_change_is_one_record(self):
+        moved = dict(self.members[0], role="Admin")
+        update.save_user(moved, moved_from="Member")
+        self.assertEqual(update.replay_wal()[0], {"Admin": {"1": moved}, "Member": {"1": None}})
+
+        update.compact_wal()
+        self.assertEqual([u["id"] for u in self._read_members()], ["2"])
+        admins = json.loads((self.db_root / "Admin" / update.USERS_FILE).read_text(encoding="utf-8"))
+        self.assertEqual(admins, [moved])
+
+
+
+class CompleterTest(unittest.TestCase):
+    @unittest.skipIf(update.process is None, "rapidfuzz not installed")
+    def test_rapidfuzz_completer_returns_best_matches(self):
+        names = [f"Zed{i} Alpha" for i in range(40)] + ["Alpha"]
+        completer = update.RapidFuzzCompleter(names, limit=5)
+        found = [c.text for c in completer.get_completions(Document("alpha"), None)]
+        self.assertEqual(len(found), 5)
+        self.assertEqual(found[0], "Alpha")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+# Script update for Jixovox database utilities - updated 2026-01-05 09:37 UTC by lloydlewis
+import json
+import sys
+import tempfile
+import threading
+import unittest
+from unittest import mock
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from Database.USERS import Users
+
+
+class UsersTest(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.base_dir = Path(self.tempdir.name)
+        self.users = Users(base_dir=self.base_dir)
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def _user(self, uid, name, email, role="Member"):
+        return {"id": uid, "name": name, "email": email, "role": role}
+
+    def test_add_user_persists_to_role_file(self):
+        self.users.add_user(self._user("1", "Alice", "alice@example.com"))
+
+        stored = json.loads((self.base_dir / "Member" / "users.json").read_text(encoding="utf-8"))
+        self.assertEqual([u["name"] for u in stored], ["Alice"])
+
+    def test_duplicate_detected_across_roles(self):
+        self.users.add_user(self._user("1", "Alice", "alice@example.com", role="Admin"))
+
+        with self.assertRaises(ValueError):
+            self.users.add_user(self._user("2", "Bob", "alice@example.com"))
+        with self.assertRaises(ValueError):
+            self.users.add_user(self._user("3", "Alice", "other@example.com", role="Owner"))
+
+    def test_is_duplicate_callable_on_class(self):
+        self.users.add_user(self._user("1", "Alice", "alice@example.com"))
+        # Users.is_duplicate binds to Users() with the default base_dir
+        with mock.patch.object(Users.__init__, "__defaults__", (self.base_dir,)):
+            self.assertTrue(Users.is_duplicate("Alice", "other@example.com"))
+            self.assertFalse(Users.is_duplicate("Bob", "bob@example.com"))
+
+    def test_concurrent_duplicate_insert_admits_one(self):
+        errors = []
+        other = Users(base_dir=self.base_dir)
+
+        def insert(manager, uid, role):
+            try:
+                manager.add_user(self._user(uid, f"User{uid}", "same@example.com", role=role))
+            except ValueError as exc:
+                errors.append(exc)
+
+        threads = [
+            threading.Thread(target=insert, args=(self.users if i % 2 else other, str(i), role))
+            for i, role in enumerate(["Member", "Admin", "Owner", "Developer"])
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(len(errors), 3)
+        self.assertEqual(len(self.users.find_user("same@example.com")), 1)
+
+    def test_bulk_defers_writes_until_exit(self):
+        member_file = self.base_dir / "Member" / "users.json"
+        with self.users.bulk():
+            self.users.add_user(self._user("1", "Alice", "alice@example.com"))
+            self.users.add_user(self._user("2", "Bob", "bob@example.com"))
+            self.assertEqual(json.loads(member_file.read_text(encoding="utf-8")), [])
+            with self.assertRaises(ValueError):
+                self.users.add_user(self._user("3", "Alice", "dup@example.com"))
+
+        stored = json.loads(member_file.read_text(encoding="utf-8"))
+        self.assertEqual([u["id"] for u in stored], ["1", "2"])
+
+    def test_bulk_keeps_queued_users_when_file_changes(self):
+        member_file = self.base_dir / "Member" / "users.json"
+        with self.users.bulk():
+            self.users.add_user(self._user("1", "Alice", "alice@example.com"))
+            member_file.write_text(json.dumps([self._user("9", "Zed", "zed@example.com")]), encoding="utf-8")
+            self.users.add_user(self._user("2", "Bob", "bob@example.com"))
+            with self.assertRaises(ValueError):
+                self.users.add_user(self._user("3", "Alice", "dup@example.com"))
+
+        stored = json.loads(member_file.read_text(encoding="utf-8"))
+        self.assertEqual([u["id"] for u in stored], ["9", "1", "2"])
+
+    def test_add_users_is_all_or_nothing(self):
+        batch = [
+            self._user("1", "Alice", "alice@example.com"),
+            self._user("2", "Bob", "bob@example.com", role="Admin"),
+            self._user("3", "Carol", "alice@example.com"),
+        ]
+        with self.assertRaises(ValueError):
+            self.users.add_users(batch)
+        self.assertEqual(self.users.list_all_users(), [])
+
+        self.users.add_users(batch[:2])
+        admins = json.loads((self.base_dir / "Admin" / "users.json").read_text(encoding="utf-8"))
+        self.assertEqual([u["name"] for u in admins], ["Bob"])
+        self.assertEqual(len(self.users.list_all_users()), 2)
+
+    def test_cache_refreshes_when_file_changes(self):
+        self.users.add_user(self._user("1", "Alice", "alice@example.com"))
+        member_file = self.base_dir / "Member" / "users.json"
+        member_file.write_text(json.dumps([self._user("2", "Bob", "bob@example.com")]), encoding="utf-8")
+
+        self.assertEqual([u["id"] for u in self.users.find_user("example.com")], ["2"])
+        self.assertFalse(self.users.is_duplicate("Alice", "alice@example.com"))
+
+    def test_find_user_matches_id_name_and_email(self):
+        self.users.add_user(self._user("7", "Alice", "alice@example.com"))
+        self.users.add_user(self._user("8", "Bob", "bob@example.com", role="Owner"))
+
+        self.assertEqual([u["id"] for u in self.users.find_user("ALICE")], ["7"])
+        self.assertEqual([u["id"] for u in self.users.find_user("bob@")], ["8"])
+        self.assertEqual(len(self.users.find_user("example.com")), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()